@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+from benchmarks.stub_servers import STUB_HANDLERS, StubConfig, StubServer
+from src.services.file_translation_service import FileTranslationService
+from src.translation.baidu_engine import BaiduEngine
+from src.translation.base_engine import TranslationEngine
+from src.translation.engine_manager import EngineManager
+from src.translation.llm_engine import LlmEngine
+from src.translation.models import TranslationRequest, TranslationResult
+from src.translation.retry_policy import RetryPolicy
+from src.translation.youdao_engine import YoudaoEngine
+
+WORKLOADS = ("text", "word", "file")
+
+
+def create_engine(name: str, base_url: str) -> TranslationEngine:
+    if name == "baidu":
+        return BaiduEngine("bench", "bench", api_url=f"{base_url}/api/trans/vip/translate")
+    if name == "youdao":
+        return YoudaoEngine("bench", "bench", api_url=f"{base_url}/api")
+    if name == "llm":
+        return LlmEngine(f"{base_url}/v1", "bench", "stub-model")
+    raise ValueError(f"未知引擎: {name}")
+
+
+def _word(index: int) -> str:
+    letters = []
+    index += 26
+    while index:
+        index, remainder = divmod(index, 26)
+        letters.append(chr(ord("a") + remainder))
+    return "".join(reversed(letters))
+
+
+def percentile(samples: list[float], percent: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def _timed(call: Callable[[], TranslationResult]) -> tuple[float, bool]:
+    started = time.perf_counter()
+    result = call()
+    return time.perf_counter() - started, result.success
+
+
+def run_calls(
+    calls: list[Callable[[], TranslationResult]], concurrency: int
+) -> tuple[list[float], int, float]:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        outcomes = list(executor.map(_timed, calls))
+    wall = time.perf_counter() - started
+
+    latencies = [latency for latency, _ in outcomes]
+    errors = sum(1 for _, success in outcomes if not success)
+    return latencies, errors, wall
+
+
+def text_workload(manager: EngineManager, count: int, concurrency: int):
+    calls = [
+        (lambda i=i: manager.translate(
+            TranslationRequest(
+                text=f"Benchmark sentence number {i} about throughput.",
+                from_lang="en",
+                to_lang="zh",
+            )
+        ))
+        for i in range(count)
+    ]
+    return run_calls(calls, concurrency)
+
+
+def word_workload(manager: EngineManager, count: int, concurrency: int):
+    calls = [
+        (lambda i=i: manager.lookup_word(_word(i), "en", "zh"))
+        for i in range(count)
+    ]
+    return run_calls(calls, concurrency)
+
+
+def file_workload(manager: EngineManager, paragraphs: int, workers: int):
+    lines = [
+        f"Paragraph {i}. It repeats a common clause. Revision {i % 7}."
+        if i % 5 else "Confidential - do not distribute."
+        for i in range(paragraphs)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = Path(directory) / "benchmark.txt"
+        file_path.write_text("\n".join(lines), encoding="utf-8")
+
+        service = FileTranslationService(manager, {manager.current_engine_name: workers})
+        errors: list[str] = []
+        service.error_occurred.connect(errors.append)
+
+        started = time.perf_counter()
+        service.translate_file(file_path, "en", "zh")
+        wall = time.perf_counter() - started
+
+    return [wall], len(errors), wall
+
+
+def run_benchmark(
+    engine_name: str,
+    workload: str,
+    config: StubConfig,
+    count: int,
+    concurrency: int,
+    retries: int,
+    rate_limit: float,
+) -> dict:
+    with StubServer(STUB_HANDLERS[engine_name], config) as server:
+        engine = create_engine(engine_name, server.url)
+        manager = EngineManager()
+        manager.register_engine(engine)
+        if retries > 1:
+            manager.set_retry_policy(RetryPolicy(max_attempts=retries, base_delay=0.05))
+        if rate_limit > 0:
+            manager.configure_rate_limits({engine_name: rate_limit})
+
+        try:
+            if workload == "text":
+                latencies, errors, wall = text_workload(manager, count, concurrency)
+            elif workload == "word":
+                latencies, errors, wall = word_workload(manager, count, concurrency)
+            else:
+                latencies, errors, wall = file_workload(manager, count, concurrency)
+        finally:
+            engine.close()
+
+        http_requests = server.request_count
+
+    operations = len(latencies) if workload != "file" else count
+    return {
+        "engine": engine_name,
+        "workload": workload,
+        "operations": operations,
+        "http_requests": http_requests,
+        "errors": errors,
+        "wall_seconds": wall,
+        "ops_per_second": operations / wall if wall else None,
+        "p50": percentile(latencies, 50) if workload != "file" else None,
+        "p95": percentile(latencies, 95) if workload != "file" else None,
+        "p99": percentile(latencies, 99) if workload != "file" else None,
+    }
+
+
+def _format_ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:8.1f}"
+
+
+def format_report(rows: list[dict]) -> str:
+    header = (
+        f"{'engine':<8}{'workload':<10}{'ops':>7}{'http':>7}{'errors':>8}"
+        f"{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'wall s':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['engine']:<8}{row['workload']:<10}{row['operations']:>7}"
+            f"{row['http_requests']:>7}{row['errors']:>8}"
+            f"{row['ops_per_second']:>10.1f}{_format_ms(row['p50']):>10}"
+            f"{_format_ms(row['p95']):>10}{_format_ms(row['p99']):>10}"
+            f"{row['wall_seconds']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="使用本地模拟服务器测量翻译引擎吞吐量与延迟")
+    parser.add_argument("--engine", choices=[*STUB_HANDLERS, "all"], default="all")
+    parser.add_argument("--workload", choices=[*WORKLOADS, "all"], default="all")
+    parser.add_argument("--count", type=int, default=200, help="请求数（file 负载为段落数）")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--qps", type=float, default=0.0, help="模拟服务端 QPS 限制，0 表示不限")
+    parser.add_argument("--retries", type=int, default=1, help="最大尝试次数，1 表示不重试")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="客户端限速，0 表示不限")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", type=Path, default=None, help="将结果写入 JSON 文件")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    config = StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        qps=args.qps,
+        seed=args.seed,
+    )
+
+    engines = list(STUB_HANDLERS) if args.engine == "all" else [args.engine]
+    workloads = list(WORKLOADS) if args.workload == "all" else [args.workload]
+
+    rows = [
+        run_benchmark(
+            engine_name,
+            workload,
+            config,
+            args.count,
+            args.concurrency,
+            args.retries,
+            args.rate_limit,
+        )
+        for engine_name in engines
+        for workload in workloads
+    ]
+
+    print(format_report(rows))
+    if args.json is not None:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel
+
+
+class StubConfig(BaseModel, frozen=True):
+    latency: float = 0.05
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    qps: float = 0.0
+    token_interval: float = 0.0
+    seed: Optional[int] = None
+
+
+class _QpsGate:
+
+    def __init__(self, qps: float) -> None:
+        self._qps = qps
+        self._hits: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if self._qps <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            while self._hits and now - self._hits[0] >= 1.0:
+                self._hits.popleft()
+            if len(self._hits) >= self._qps:
+                return False
+            self._hits.append(now)
+            return True
+
+
+class _StubHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, handler_class: type, config: StubConfig) -> None:
+        super().__init__(("127.0.0.1", 0), handler_class)
+        self.config = config
+        self.gate = _QpsGate(config.qps)
+        self.rng = random.Random(config.seed)
+        self.rng_lock = threading.Lock()
+        self.request_count = 0
+        self.request_times: list[float] = []
+        self.count_lock = threading.Lock()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _StubHttpServer
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _begin(self) -> tuple[bool, bool]:
+        with self.server.count_lock:
+            self.server.request_count += 1
+            self.server.request_times.append(time.monotonic())
+
+        config = self.server.config
+        with self.server.rng_lock:
+            jitter = self.server.rng.uniform(-config.jitter, config.jitter)
+            failed = self.server.rng.random() < config.error_rate
+        time.sleep(max(0.0, config.latency + jitter))
+
+        return not self.server.gate.allow(), failed
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(self, data: dict, status: int = 200) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _fake_translation(text: str) -> str:
+    return f"[译]{text}"
+
+
+class BaiduStubHandler(_StubHandler):
+
+    def do_GET(self) -> None:
+        throttled, failed = self._begin()
+        params = parse_qs(urlsplit(self.path).query)
+
+        if throttled:
+            self._send_json({"error_code": "54003", "error_msg": "Invalid Access Limit"})
+            return
+        if failed:
+            self._send_json({"error_code": "52001", "error_msg": "TIMEOUT"})
+            return
+
+        query = params.get("q", [""])[0]
+        self._send_json({
+            "from": params.get("from", ["auto"])[0],
+            "to": params.get("to", ["zh"])[0],
+            "trans_result": [
+                {"src": line, "dst": _fake_translation(line)}
+                for line in query.split("\n")
+                if line.strip()
+            ],
+        })
+
+
+class YoudaoStubHandler(_StubHandler):
+
+    def do_POST(self) -> None:
+        throttled, failed = self._begin()
+        form = parse_qs(self._read_body().decode("utf-8"))
+
+        if throttled:
+            self._send_json({"errorCode": "411"})
+            return
+        if failed:
+            self._send_json({"errorCode": "503"}, status=503)
+            return
+
+        queries = form.get("q", [""])
+        if urlsplit(self.path).path.endswith("/v2/api"):
+            self._send_json({
+                "errorCode": "0",
+                "translateResults": [
+                    {"query": query, "translation": _fake_translation(query)}
+                    for query in queries
+                ],
+            })
+            return
+
+        query = queries[0]
+        data = {"errorCode": "0", "translation": [_fake_translation(query)]}
+        if query.isalpha():
+            data["basic"] = {
+                "phonetic": query,
+                "explains": [f"n. {_fake_translation(query)}"],
+            }
+        self._send_json(data)
+
+
+class ChatStubHandler(_StubHandler):
+
+    def do_POST(self) -> None:
+        throttled, failed = self._begin()
+        body = json.loads(self._read_body() or b"{}")
+
+        if throttled:
+            self._send_json({"error": {"message": "Rate limit reached"}}, status=429)
+            return
+        if failed:
+            self._send_json({"error": {"message": "Internal error"}}, status=500)
+            return
+
+        reply = self._reply(body.get("messages", []))
+        if body.get("stream"):
+            self._stream(reply)
+        else:
+            self._send_json({"choices": [{"message": {"role": "assistant", "content": reply}}]})
+
+    @staticmethod
+    def _reply(messages: list[dict]) -> str:
+        content = messages[-1].get("content", "") if messages else ""
+        try:
+            segments = json.loads(content)
+        except ValueError:
+            return _fake_translation(content)
+        if isinstance(segments, dict):
+            return json.dumps(
+                {key: _fake_translation(str(value)) for key, value in segments.items()},
+                ensure_ascii=False,
+            )
+        return _fake_translation(content)
+
+    def _stream(self, reply: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        for start in range(0, len(reply), 4):
+            chunk = {"choices": [{"delta": {"content": reply[start:start + 4]}}]}
+            self._write_chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n")
+            if self.server.config.token_interval:
+                time.sleep(self.server.config.token_interval)
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+class StubServer:
+
+    def __init__(self, handler_class: type, config: Optional[StubConfig] = None) -> None:
+        self._server = _StubHttpServer(handler_class, config or StubConfig())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-server", daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        with self._server.count_lock:
+            return self._server.request_count
+
+    @property
+    def request_times(self) -> list[float]:
+        with self._server.count_lock:
+            return list(self._server.request_times)
+
+    def start(self) -> StubServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> StubServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+STUB_HANDLERS = {
+    "baidu": BaiduStubHandler,
+    "youdao": YoudaoStubHandler,
+    "llm": ChatStubHandler,
+}
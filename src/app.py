@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ctypes
+import sqlite3
 import sys
 from pathlib import Path
 
@@ -14,19 +15,27 @@ from PyQt5.QtWidgets import QApplication
 
 from src.clipboard.hotkey_manager import HotkeyManager
 from src.clipboard.selection_handler import SelectionHandler
-from src.config.constants import DB_NAME, SETTINGS_FILE
+from src.clipboard.selection_watcher import SelectionWatcher
+from src.config.constants import DATA_DIR_NAME, DB_NAME, SETTINGS_FILE
 from src.config.settings import get_settings, init_settings, update_settings
 from src.database.connection import init_database
 from src.database.migrations import create_tables
 from src.history.repository import TranslationRepository
+from src.history.translation_memory import TranslationMemory
 from src.services.translation_service import TranslationService
+from src.translation.dictionary_engine import LocalDictionaryEngine
 from src.translation.engine_factory import EngineFactory
 from src.translation.engine_manager import EngineManager
+from src.translation.http_pool import HttpPool
+from src.translation.local_dictionary import LocalDictionary, resolve_dictionary_path
+from src.translation.rate_limiter import TokenBucket
+from src.translation.retry_policy import RetryPolicy
 from src.ui.floating_popup import FloatingPopup
 from src.ui.main_window import MainWindow
 from src.ui.styles.theme import create_app_icon
 from src.ui.system_tray import SystemTray
 from src.utils.async_worker import AsyncWorker
+from src.utils.lru_cache import LruCache
 
 
 class TranslationApp:
@@ -37,7 +46,7 @@ class TranslationApp:
         self._app.setWindowIcon(create_app_icon())
         self._app.setQuitOnLastWindowClosed(True)
 
-        self._data_dir = Path.home() / ".translation_tool"
+        self._data_dir = Path.home() / DATA_DIR_NAME
         self._data_dir.mkdir(parents=True, exist_ok=True)
 
         self._settings_path = self._data_dir / SETTINGS_FILE
@@ -49,7 +58,9 @@ class TranslationApp:
         init_database(self._db_path)
         create_tables()
 
-        self._engine_manager = EngineManager()
+        self._http_pool = self._create_http_pool()
+
+        self._engine_manager = EngineManager(self._create_translation_memory())
         self._init_engines()
 
         self._repository = TranslationRepository()
@@ -57,6 +68,12 @@ class TranslationApp:
         self._translation_service = TranslationService(
             self._engine_manager,
             self._repository,
+            LruCache(
+                max_size=self._settings.preferences.result_cache_size,
+                ttl_seconds=self._settings.preferences.result_cache_ttl_seconds,
+            ),
+            self._create_prefetch_budget(),
+            self._create_local_dictionary(),
         )
 
         self._main_window = MainWindow(self._engine_manager, self._repository)
@@ -68,6 +85,11 @@ class TranslationApp:
 
         self._selection_handler = SelectionHandler()
 
+        self._selection_watcher = SelectionWatcher(
+            max_chars=self._settings.preferences.prefetch_max_chars,
+            watch_primary=self._settings.preferences.prefetch_watch_primary,
+        )
+
         self._hotkey_manager = HotkeyManager(
             hotkey_str=self._settings.preferences.hotkey,
             callback=self._on_hotkey_pressed,
@@ -79,16 +101,81 @@ class TranslationApp:
 
         self._hotkey_manager.start()
 
+        if self._settings.preferences.prefetch_enabled:
+            self._selection_watcher.start()
+
     def _init_engines(self) -> None:
-        engines = EngineFactory.create_all_engines(self._settings.api_keys)
+        engines = EngineFactory.create_all_engines(
+            self._settings.api_keys, self._http_pool.client
+        )
 
         for engine in engines:
             self._engine_manager.register_engine(engine)
 
+        self._configure_engine_policies()
+
         engine_name = self._settings.preferences.default_engine
         if engine_name in self._engine_manager.available_engines:
             self._engine_manager.set_current_engine(engine_name)
 
+        self._http_pool.set_warm_targets(EngineFactory.engine_urls(self._settings.api_keys))
+        self._http_pool.warm_up_in_background()
+
+    def _create_http_pool(self) -> HttpPool:
+        prefs = self._settings.preferences
+        return HttpPool(
+            max_connections=prefs.http_max_connections,
+            max_keepalive_connections=prefs.http_max_keepalive_connections,
+            keepalive_expiry=prefs.http_keepalive_expiry,
+            http2=prefs.http2_enabled,
+        )
+
+    def _configure_engine_policies(self) -> None:
+        prefs = self._settings.preferences
+        self._engine_manager.configure_rate_limits(prefs.engine_rate_limits)
+        self._engine_manager.set_retry_policy(
+            RetryPolicy(
+                max_attempts=prefs.retry_max_attempts,
+                base_delay=prefs.retry_base_delay,
+                max_delay=prefs.retry_max_delay,
+                time_budget=prefs.retry_time_budget,
+            )
+        )
+        self._engine_manager.set_fallback_chain(prefs.fallback_engines)
+        self._engine_manager.configure_circuit_breakers(
+            prefs.circuit_failure_threshold,
+            prefs.circuit_cooldown_seconds,
+        )
+        self._engine_manager.set_hedging(prefs.hedge_interactive_requests)
+
+    def _create_prefetch_budget(self) -> TokenBucket | None:
+        per_minute = self._settings.preferences.prefetch_per_minute
+        if per_minute <= 0:
+            return None
+        return TokenBucket(per_minute / 60.0, capacity=min(3.0, per_minute))
+
+    def _create_local_dictionary(self) -> LocalDictionaryEngine | None:
+        prefs = self._settings.preferences
+        if not prefs.local_dictionary_enabled:
+            return None
+
+        path = resolve_dictionary_path(prefs.local_dictionary_path)
+        if not path.exists():
+            return None
+        try:
+            return LocalDictionaryEngine(LocalDictionary(path))
+        except sqlite3.Error:
+            return None
+
+    def _create_translation_memory(self) -> TranslationMemory | None:
+        prefs = self._settings.preferences
+        if not prefs.translation_memory_enabled:
+            return None
+        return TranslationMemory(
+            max_entries=prefs.translation_memory_max_entries,
+            max_age_days=prefs.translation_memory_max_age_days,
+        )
+
     def _connect_signals(self) -> None:
         translation_panel = self._main_window.get_translation_panel()
 
@@ -108,19 +195,49 @@ class TranslationApp:
             self._floating_popup.show_translation
         )
 
+        self._translation_service.translation_partial.connect(
+            self._floating_popup.show_partial
+        )
+
+        self._selection_watcher.candidate_found.connect(
+            self._on_prefetch_candidate
+        )
+
+        self._selection_handler.selection_copied.connect(
+            self._selection_watcher.ignore
+        )
+
+        self._selection_handler.clipboard_restoring.connect(
+            self._selection_watcher.ignore
+        )
+
     def _on_settings_changed(self) -> None:
         self._settings = get_settings()
-        new_engines = EngineFactory.create_all_engines(self._settings.api_keys)
+        new_engines = EngineFactory.create_all_engines(
+            self._settings.api_keys, self._http_pool.client
+        )
         self._engine_manager.reload_engines(
             new_engines,
             self._settings.preferences.default_engine,
         )
+        self._http_pool.set_warm_targets(EngineFactory.engine_urls(self._settings.api_keys))
+        self._http_pool.warm_up_in_background()
+        self._configure_engine_policies()
+        self._engine_manager.set_memory(self._create_translation_memory())
+        self._translation_service.clear_cache()
+        self._translation_service.set_prefetch_budget(self._create_prefetch_budget())
+        self._translation_service.set_dictionary(self._create_local_dictionary())
+        if self._settings.preferences.prefetch_enabled:
+            self._selection_watcher.start()
+        else:
+            self._selection_watcher.stop()
 
     def _on_translation_completed(self, result) -> None:
         if result.success:
             self._repository.create_from_result(result)
 
     def _on_hotkey_pressed(self) -> None:
+        self._http_pool.warm_up_in_background(only_if_idle=True)
         worker = AsyncWorker(self._selection_handler.capture_selection)
         self._thread_pool.start(worker)
 
@@ -133,10 +250,21 @@ class TranslationApp:
         )
         self._thread_pool.start(worker)
 
+    def _on_prefetch_candidate(self, text: str) -> None:
+        self._translation_service.prefetch(
+            text,
+            self._settings.preferences.default_from_lang,
+            self._settings.preferences.default_to_lang,
+        )
+
     def run(self) -> int:
         self._main_window.show()
         return self._app.exec_()
 
     def cleanup(self) -> None:
         self._hotkey_manager.stop()
+        self._selection_watcher.stop()
         self._engine_manager.close_all()
+        self._engine_manager.set_memory(None)
+        self._translation_service.set_dictionary(None)
+        self._http_pool.close()
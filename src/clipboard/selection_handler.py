@@ -9,6 +9,8 @@ from pynput import keyboard
 
 class SelectionHandler(QObject):
     text_selected = pyqtSignal(str)
+    selection_copied = pyqtSignal(str)
+    clipboard_restoring = pyqtSignal(str)
 
     def __init__(self) -> None:
         super().__init__()
@@ -37,8 +39,11 @@ class SelectionHandler(QObject):
         except Exception:
             pass
 
+        self.selection_copied.emit(selected_text)
+
         try:
             if selected_text != original_clipboard:
+                self.clipboard_restoring.emit(original_clipboard)
                 pyperclip.copy(original_clipboard)
         except Exception:
             pass
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import re
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QClipboard
+from PyQt5.QtWidgets import QApplication
+
+_URL_OR_PATH = re.compile(r"^(?:[a-zA-Z][a-zA-Z0-9+.-]*://|www\.|[A-Za-z]:\\|~?/)\S*$")
+_HAS_LETTER = re.compile(r"[^\W\d_]")
+_IGNORE_SECONDS = 2.0
+
+
+def is_prefetch_candidate(text: str, max_chars: int) -> bool:
+    stripped = text.strip()
+    if not stripped or len(stripped) > max_chars:
+        return False
+    if _URL_OR_PATH.match(stripped):
+        return False
+    return bool(_HAS_LETTER.search(stripped))
+
+
+class SelectionWatcher(QObject):
+    candidate_found = pyqtSignal(str)
+
+    def __init__(
+        self,
+        max_chars: int = 500,
+        watch_primary: bool = True,
+        debounce_ms: int = 300,
+        history_size: int = 32,
+    ) -> None:
+        super().__init__()
+        self._max_chars = max_chars
+        self._watch_primary = watch_primary
+        self._clipboard = QApplication.clipboard()
+        self._recent: deque[str] = deque(maxlen=history_size)
+        self._expected_writes: deque[tuple[str, float]] = deque()
+        self._pending_mode = QClipboard.Clipboard
+        self._enabled = False
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._emit_pending)
+
+    def start(self) -> None:
+        if self._enabled:
+            return
+        self._enabled = True
+        self._clipboard.dataChanged.connect(self._on_clipboard_changed)
+        if self._watch_primary and self._clipboard.supportsSelection():
+            self._clipboard.selectionChanged.connect(self._on_selection_changed)
+
+    def stop(self) -> None:
+        if not self._enabled:
+            return
+        self._enabled = False
+        self._debounce_timer.stop()
+        self._clipboard.dataChanged.disconnect(self._on_clipboard_changed)
+        if self._watch_primary and self._clipboard.supportsSelection():
+            self._clipboard.selectionChanged.disconnect(self._on_selection_changed)
+
+    def ignore(self, text: str) -> None:
+        self._expected_writes.append((text.strip(), time.monotonic() + _IGNORE_SECONDS))
+
+    def _on_clipboard_changed(self) -> None:
+        self._schedule(QClipboard.Clipboard)
+
+    def _on_selection_changed(self) -> None:
+        self._schedule(QClipboard.Selection)
+
+    def _schedule(self, mode: QClipboard.Mode) -> None:
+        self._pending_mode = mode
+        self._debounce_timer.start()
+
+    def _emit_pending(self) -> None:
+        text = self._clipboard.text(self._pending_mode).strip()
+        if self._pending_mode == QClipboard.Clipboard and self._consume_expected(text):
+            return
+        if text in self._recent or not is_prefetch_candidate(text, self._max_chars):
+            return
+        self._recent.append(text)
+        self.candidate_found.emit(text)
+
+    def _consume_expected(self, text: str) -> bool:
+        now = time.monotonic()
+        while self._expected_writes and self._expected_writes[0][1] < now:
+            self._expected_writes.popleft()
+        for entry in self._expected_writes:
+            if entry[0] == text:
+                self._expected_writes.remove(entry)
+                return True
+        return False
@@ -2,6 +2,38 @@ BAIDU_API_URL = "https://fanyi-api.baidu.com/api/trans/vip/translate"
 
 YOUDAO_API_URL = "https://openapi.youdao.com/api"
 
+YOUDAO_BATCH_API_URL = "https://openapi.youdao.com/v2/api"
+
+BAIDU_MAX_QUERY_BYTES = 6000
+
+YOUDAO_MAX_BATCH_CHARS = 5000
+
+LLM_MAX_BATCH_TOKENS = 2000
+
+LLM_MAX_BATCH_SEGMENTS = 100
+
+NETWORK_ERROR_CODE = "network"
+
+CIRCUIT_OPEN_ERROR_CODE = "circuit_open"
+
+DICTIONARY_MISS_ERROR_CODE = "not_found"
+
+DEFAULT_HEDGE_DELAY_SECONDS = 1.0
+
+MIN_HEDGE_DELAY_SECONDS = 0.2
+
+BAIDU_RATE_LIMIT_ERROR_CODES = frozenset({"54003"})
+
+YOUDAO_RATE_LIMIT_ERROR_CODES = frozenset({"411"})
+
+LLM_RATE_LIMIT_ERROR_CODES = frozenset({"429"})
+
+BAIDU_RETRYABLE_ERROR_CODES = frozenset({"52001", "52002", "54003", NETWORK_ERROR_CODE})
+
+YOUDAO_RETRYABLE_ERROR_CODES = frozenset({"411", NETWORK_ERROR_CODE})
+
+LLM_RETRYABLE_ERROR_CODES = frozenset({"429", "500", "502", "503", "504", NETWORK_ERROR_CODE})
+
 DEFAULT_HOTKEY = "<ctrl>+<alt>+t"
 
 LANGUAGE_MAP = {
@@ -20,6 +52,8 @@ LANGUAGE_MAP = {
 
 LANGUAGE_DISPLAY_NAMES = {v: k for k, v in LANGUAGE_MAP.items()}
 
+UNSPACED_LANGUAGES = frozenset({"zh", "cht", "jp", "ja"})
+
 BAIDU_LANGUAGE_CODES = {
     "zh": "zh",
     "en": "en",
@@ -64,8 +98,16 @@ LLM_LANGUAGE_NAMES = {
 
 SUPPORTED_FILE_EXTENSIONS = {".txt", ".docx", ".pdf"}
 
+PDF_PARALLEL_MIN_PAGES = 64
+
+PDF_PAGES_PER_TASK = 16
+
 MAX_TEXT_CHUNK_SIZE = 5000
 
+DATA_DIR_NAME = ".translation_tool"
+
 DB_NAME = "translation_history.db"
 
+LOCAL_DICTIONARY_FILE = "ecdict.db"
+
 SETTINGS_FILE = "settings.json"
@@ -33,6 +33,32 @@ class Preferences(BaseModel, frozen=True):
     history_page_size: int = 20
     auto_copy_result: bool = False
     start_minimized: bool = False
+    translation_memory_enabled: bool = True
+    translation_memory_max_entries: int = 20000
+    translation_memory_max_age_days: int = 30
+    result_cache_size: int = 256
+    result_cache_ttl_seconds: int = 1800
+    file_translation_workers: dict[str, int] = {"baidu": 1, "youdao": 4, "llm": 4}
+    file_job_resume_enabled: bool = True
+    engine_rate_limits: dict[str, float] = {"baidu": 1.0, "youdao": 10.0, "llm": 3.0}
+    retry_max_attempts: int = 4
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 8.0
+    retry_time_budget: float = 30.0
+    fallback_engines: list[str] = ["baidu", "youdao", "llm"]
+    circuit_failure_threshold: int = 5
+    circuit_cooldown_seconds: float = 30.0
+    hedge_interactive_requests: bool = False
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 120.0
+    http2_enabled: bool = True
+    prefetch_enabled: bool = False
+    prefetch_watch_primary: bool = True
+    prefetch_max_chars: int = 500
+    prefetch_per_minute: float = 6.0
+    local_dictionary_enabled: bool = True
+    local_dictionary_path: str = ""
 
 
 class AppSettings(BaseModel, frozen=True):
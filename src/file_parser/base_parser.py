@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Iterator
 
 
 class FileParser(ABC):
@@ -10,6 +11,9 @@ class FileParser(ABC):
     def parse(self, file_path: Path) -> str:
         ...
 
+    def iter_segments(self, file_path: Path) -> Iterator[str]:
+        yield self.parse(file_path)
+
     @property
     @abstractmethod
     def supported_extensions(self) -> set[str]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterator
 
 from docx import Document
 
@@ -14,12 +15,12 @@ class DocxParser(FileParser):
         return {".docx"}
 
     def parse(self, file_path: Path) -> str:
+        return "\n".join(self.iter_segments(file_path))
+
+    def iter_segments(self, file_path: Path) -> Iterator[str]:
         doc = Document(file_path)
 
-        paragraphs = []
         for para in doc.paragraphs:
             text = para.text.strip()
             if text:
-                paragraphs.append(text)
-
-        return "\n".join(paragraphs)
+                yield text
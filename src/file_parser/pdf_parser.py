@@ -1,32 +1,103 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Iterator, Optional
 
 import fitz
 
+from src.config.constants import PDF_PAGES_PER_TASK, PDF_PARALLEL_MIN_PAGES
 from src.file_parser.base_parser import FileParser
 
 
+def _extract_pages(file_path: str, start: int, stop: int) -> list[str]:
+    doc = fitz.open(file_path)
+    try:
+        return [doc.load_page(index).get_text() for index in range(start, stop)]
+    finally:
+        doc.close()
+
+
 class PdfParser(FileParser):
 
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parallel_min_pages: int = PDF_PARALLEL_MIN_PAGES,
+        pages_per_task: int = PDF_PAGES_PER_TASK,
+    ) -> None:
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._parallel_min_pages = parallel_min_pages
+        self._pages_per_task = pages_per_task
+
     @property
     def supported_extensions(self) -> set[str]:
         return {".pdf"}
 
     def parse(self, file_path: Path) -> str:
+        return "\n".join(self.iter_segments(file_path))
+
+    def iter_segments(self, file_path: Path) -> Iterator[str]:
         try:
             doc = fitz.open(file_path)
         except Exception as exc:
             raise ValueError(f"无法打开 PDF 文件: {exc}") from exc
 
+        if self._max_workers > 1 and doc.page_count >= self._parallel_min_pages:
+            page_count = doc.page_count
+            doc.close()
+            pages = self._iter_pages_parallel(file_path, page_count)
+        else:
+            pages = self._iter_pages_serial(doc)
+
+        for text in pages:
+            if text.strip():
+                yield text
+
+    @staticmethod
+    def _iter_pages_serial(doc: fitz.Document) -> Iterator[str]:
         try:
-            text_parts = []
-            for page in doc:
-                text = page.get_text()
-                if text.strip():
-                    text_parts.append(text)
-            return "\n".join(text_parts)
-        except Exception as exc:
-            raise ValueError(f"PDF 解析失败: {exc}") from exc
+            for index in range(doc.page_count):
+                try:
+                    yield doc.load_page(index).get_text()
+                except Exception as exc:
+                    raise ValueError(f"PDF 解析失败: {exc}") from exc
         finally:
             doc.close()
+
+    def _iter_pages_parallel(self, file_path: Path, page_count: int) -> Iterator[str]:
+        ranges = iter(
+            (start, min(start + self._pages_per_task, page_count))
+            for start in range(0, page_count, self._pages_per_task)
+        )
+        task_count = -(-page_count // self._pages_per_task)
+        workers = min(self._max_workers, task_count)
+
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        pending: deque[Future] = deque(
+            executor.submit(_extract_pages, str(file_path), start, stop)
+            for start, stop in islice(ranges, workers * 2)
+        )
+
+        try:
+            while pending:
+                try:
+                    texts = pending.popleft().result()
+                except Exception as exc:
+                    raise ValueError(f"PDF 解析失败: {exc}") from exc
+
+                next_range = next(ranges, None)
+                if next_range is not None:
+                    pending.append(
+                        executor.submit(_extract_pages, str(file_path), *next_range)
+                    )
+
+                yield from texts
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
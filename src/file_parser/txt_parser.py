@@ -1,11 +1,46 @@
 from __future__ import annotations
 
+import codecs
+import logging
+import mmap
 from pathlib import Path
+from typing import Iterator
 
-import chardet
+from chardet import UniversalDetector
 
 from src.file_parser.base_parser import FileParser
 
+logger = logging.getLogger(__name__)
+
+_READ_BLOCK_SIZE = 64 * 1024
+_DETECT_MAX_BYTES = 1024 * 1024
+_MAX_PENDING_CHARS = 1024 * 1024
+_PROBE_BYTES = 4096
+_SUPERSET_ENCODINGS = {"ascii": "utf-8", "gb2312": "gb18030", "gbk": "gb18030"}
+
+
+def detect_encoding(data: bytes, max_bytes: int = _DETECT_MAX_BYTES) -> str:
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(data[:max_bytes])
+    except UnicodeDecodeError:
+        pass
+    else:
+        return "utf-8-sig" if data[:3] == codecs.BOM_UTF8 else "utf-8"
+
+    detector = UniversalDetector()
+    for start in range(0, min(len(data), max_bytes), _READ_BLOCK_SIZE):
+        detector.feed(data[start:min(start + _READ_BLOCK_SIZE, max_bytes)])
+        if detector.done:
+            break
+    detector.close()
+
+    encoding = detector.result.get("encoding") or "utf-8"
+    encoding = _SUPERSET_ENCODINGS.get(encoding.lower(), encoding)
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return "utf-8"
+
 
 class TxtParser(FileParser):
 
@@ -14,15 +49,102 @@ class TxtParser(FileParser):
         return {".txt"}
 
     def parse(self, file_path: Path) -> str:
-        raw_data = file_path.read_bytes()
+        with file_path.open("rb") as handle:
+            if file_path.stat().st_size == 0:
+                return ""
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return "".join(self._decode_pieces(data))
+
+    def iter_segments(self, file_path: Path) -> Iterator[str]:
+        with file_path.open("rb") as handle:
+            if file_path.stat().st_size == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield from self._decode_blocks(data)
+
+    def _decode_blocks(self, data: mmap.mmap) -> Iterator[str]:
+        pending: list[str] = []
+        pending_size = 0
+
+        for piece in self._decode_pieces(data):
+            cut = piece.rfind("\n")
+            if cut >= 0:
+                pending.append(piece[:cut])
+                yield "".join(pending)
+                pending = [piece[cut + 1:]]
+                pending_size = len(pending[0])
+                continue
 
-        detected = chardet.detect(raw_data)
-        encoding = detected.get("encoding", "utf-8")
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size >= _MAX_PENDING_CHARS:
+                yield "".join(pending)
+                pending = []
+                pending_size = 0
 
-        if encoding is None:
-            encoding = "utf-8"
+        tail = "".join(pending)
+        if tail:
+            yield tail
 
+    def _decode_pieces(self, data: mmap.mmap) -> Iterator[str]:
+        encoding = detect_encoding(data)
+        errors = "strict"
+        decoder = self._incremental_decoder(encoding, errors)
+        position = 0
+        switched_at = -1
+
+        while position < len(data):
+            block = data[position:position + _READ_BLOCK_SIZE]
+            final = position + len(block) >= len(data)
+            buffered = decoder.getstate()[0]
+            try:
+                text = decoder.decode(block, final=final)
+            except UnicodeDecodeError:
+                chunk = buffered + block
+                start, end = self._first_error(chunk, encoding)
+                yield chunk[:start].decode(encoding)
+                position += start - len(buffered)
+
+                if self._decodes_cleanly(data[position + end - start:], encoding):
+                    logger.warning("Undecodable bytes at offset %d (%s)", position, encoding)
+                    yield "\ufffd"
+                    position += end - start
+                    decoder = self._incremental_decoder(encoding, errors)
+                    continue
+
+                detected = detect_encoding(data[position:position + _DETECT_MAX_BYTES])
+                if position == switched_at or detected == encoding:
+                    logger.warning(
+                        "Undecodable bytes at offset %d, replacing them (%s)", position, encoding
+                    )
+                    errors = "replace"
+                else:
+                    logger.info(
+                        "Encoding changes at offset %d: %s -> %s", position, encoding, detected
+                    )
+                    encoding = detected
+                switched_at = position
+                decoder = self._incremental_decoder(encoding, errors)
+                continue
+
+            yield text
+            position += len(block)
+
+    @staticmethod
+    def _first_error(chunk: bytes, encoding: str) -> tuple[int, int]:
+        try:
+            chunk.decode(encoding)
+        except UnicodeDecodeError as exc:
+            return exc.start, max(exc.end, exc.start + 1)
+        return 0, 1
+
+    def _decodes_cleanly(self, data: bytes, encoding: str) -> bool:
         try:
-            return raw_data.decode(encoding)
-        except (UnicodeDecodeError, LookupError):
-            return raw_data.decode("utf-8", errors="ignore")
+            self._incremental_decoder(encoding, "strict").decode(data[:_PROBE_BYTES])
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    @staticmethod
+    def _incremental_decoder(encoding: str, errors: str) -> codecs.IncrementalDecoder:
+        return codecs.getincrementaldecoder(encoding)(errors=errors)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from src.database.connection import get_session
+from src.history.models import FileJobChunkRecord
+
+logger = logging.getLogger(__name__)
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with file_path.open("rb") as handle:
+        while block := handle.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileJobKey(BaseModel, frozen=True):
+    file_hash: str
+    from_lang: str
+    to_lang: str
+    engine_name: str
+
+
+class FileJobJournal:
+
+    def __init__(self, max_age_days: int = 7) -> None:
+        self._max_age = timedelta(days=max_age_days)
+
+    def load(self, job: FileJobKey) -> dict[int, tuple[str, str]]:
+        session = get_session()
+        try:
+            session.query(FileJobChunkRecord).filter(
+                FileJobChunkRecord.created_at < datetime.utcnow() - self._max_age
+            ).delete(synchronize_session=False)
+            session.commit()
+
+            return {
+                record.chunk_index: (record.chunk_hash, record.translated_text)
+                for record in self._query(session, job)
+            }
+        except SQLAlchemyError:
+            logger.warning("File job journal lookup failed", exc_info=True)
+            session.rollback()
+            return {}
+        finally:
+            session.close()
+
+    def record(
+        self,
+        job: FileJobKey,
+        chunk_index: int,
+        chunk_hash: str,
+        translated_text: str,
+    ) -> None:
+        session = get_session()
+        try:
+            record = (
+                self._query(session, job)
+                .filter(FileJobChunkRecord.chunk_index == chunk_index)
+                .first()
+            )
+            if record is None:
+                record = FileJobChunkRecord(
+                    file_hash=job.file_hash,
+                    from_lang=job.from_lang,
+                    to_lang=job.to_lang,
+                    engine_name=job.engine_name,
+                    chunk_index=chunk_index,
+                )
+                session.add(record)
+            record.chunk_hash = chunk_hash
+            record.translated_text = translated_text
+            record.created_at = datetime.utcnow()
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+        except SQLAlchemyError:
+            logger.warning("File job journal write failed", exc_info=True)
+            session.rollback()
+        finally:
+            session.close()
+
+    def discard(self, job: FileJobKey) -> int:
+        session = get_session()
+        try:
+            count = self._query(session, job).delete(synchronize_session=False)
+            session.commit()
+            return count
+        except SQLAlchemyError:
+            logger.warning("File job journal cleanup failed", exc_info=True)
+            session.rollback()
+            return 0
+        finally:
+            session.close()
+
+    @staticmethod
+    def _query(session, job: FileJobKey):
+        return session.query(FileJobChunkRecord).filter_by(
+            file_hash=job.file_hash,
+            from_lang=job.from_lang,
+            to_lang=job.to_lang,
+            engine_name=job.engine_name,
+        )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -27,3 +27,70 @@ class TranslationRecord(Base):
 
     def __repr__(self) -> str:
         return f"<TranslationRecord(id={self.id}, source='{self.source_text[:20]}...')>"
+
+
+class TranslationMemoryRecord(Base):
+    __tablename__ = "translation_memory"
+    __table_args__ = (
+        UniqueConstraint(
+            "engine_name",
+            "from_lang",
+            "to_lang",
+            "text_hash",
+            "with_detail",
+            name="uq_translation_memory_key",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    engine_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    from_lang: Mapped[str] = mapped_column(String(10), nullable=False)
+    to_lang: Mapped[str] = mapped_column(String(10), nullable=False)
+    text_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    with_detail: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    result_json: Mapped[str] = mapped_column(Text, nullable=False)
+    hit_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TranslationMemoryRecord(id={self.id}, engine='{self.engine_name}', "
+            f"hash='{self.text_hash[:8]}')>"
+        )
+
+
+class FileJobChunkRecord(Base):
+    __tablename__ = "file_job_chunks"
+    __table_args__ = (
+        UniqueConstraint(
+            "file_hash",
+            "from_lang",
+            "to_lang",
+            "engine_name",
+            "chunk_index",
+            name="uq_file_job_chunk_key",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    file_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    from_lang: Mapped[str] = mapped_column(String(10), nullable=False)
+    to_lang: Mapped[str] = mapped_column(String(10), nullable=False)
+    engine_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    chunk_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    translated_text: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<FileJobChunkRecord(id={self.id}, file='{self.file_hash[:8]}', "
+            f"chunk={self.chunk_index})>"
+        )
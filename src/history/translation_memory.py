@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from src.database.connection import get_session
+from src.history.models import TranslationMemoryRecord
+from src.translation.models import TranslationRequest, TranslationResult
+from src.utils.text_utils import text_hash
+
+logger = logging.getLogger(__name__)
+
+_LOOKUP_BATCH_SIZE = 500
+_ACCESS_FLUSH_SIZE = 64
+_ACCESS_FLUSH_SECONDS = 30.0
+_SWEEP_INTERVAL = 256
+_EVICT_HEADROOM_DIVISOR = 10
+
+
+class TranslationMemory:
+
+    def __init__(self, max_entries: int = 20000, max_age_days: int = 30) -> None:
+        self._max_entries = max_entries
+        self._max_age = timedelta(days=max_age_days)
+        self._lock = threading.Lock()
+        self._pending_hits: dict[int, tuple[int, datetime]] = {}
+        self._last_flush = time.monotonic()
+        self._row_count: Optional[int] = None
+        self._inserts_since_sweep = 0
+
+    def get(
+        self,
+        engine_name: str,
+        request: TranslationRequest,
+        with_detail: bool = False,
+    ) -> Optional[TranslationResult]:
+        session = get_session()
+        try:
+            record = self._find(session, engine_name, request, with_detail)
+            if record is None:
+                return None
+
+            now = datetime.utcnow()
+            if now - record.created_at > self._max_age:
+                session.delete(record)
+                session.commit()
+                self._adjust_row_count(-1)
+                return None
+
+            result = TranslationResult.model_validate_json(record.result_json)
+            record_id = record.id
+        except (SQLAlchemyError, ValidationError):
+            logger.warning("Translation memory lookup failed", exc_info=True)
+            session.rollback()
+            return None
+        finally:
+            session.close()
+
+        self._record_hits([record_id], now)
+        return result.model_copy(update={"source_text": request.text})
+
+    def put(
+        self,
+        engine_name: str,
+        request: TranslationRequest,
+        result: TranslationResult,
+        with_detail: bool = False,
+    ) -> None:
+        self.put_many(engine_name, [(request, result)], with_detail)
+
+    def get_many(
+        self,
+        engine_name: str,
+        requests: list[TranslationRequest],
+        with_detail: bool = False,
+    ) -> list[Optional[TranslationResult]]:
+        if not requests:
+            return []
+
+        session = get_session()
+        try:
+            records = self._find_many(session, engine_name, requests, with_detail)
+            now = datetime.utcnow()
+            results: list[Optional[TranslationResult]] = []
+            hit_ids: list[int] = []
+            for request in requests:
+                record = records.get(self._key(request))
+                if record is None or now - record.created_at > self._max_age:
+                    results.append(None)
+                    continue
+                result = TranslationResult.model_validate_json(record.result_json)
+                hit_ids.append(record.id)
+                results.append(result.model_copy(update={"source_text": request.text}))
+        except (SQLAlchemyError, ValidationError):
+            logger.warning("Translation memory lookup failed", exc_info=True)
+            session.rollback()
+            return [None] * len(requests)
+        finally:
+            session.close()
+
+        self._record_hits(hit_ids, now)
+        return results
+
+    def put_many(
+        self,
+        engine_name: str,
+        entries: list[tuple[TranslationRequest, TranslationResult]],
+        with_detail: bool = False,
+    ) -> None:
+        entries = [(request, result) for request, result in entries if result.success]
+        if not entries:
+            return
+
+        session = get_session()
+        try:
+            now = datetime.utcnow()
+            records = self._find_many(
+                session, engine_name, [request for request, _ in entries], with_detail
+            )
+            inserted = 0
+            for request, result in entries:
+                key = self._key(request)
+                record = records.get(key)
+                if record is None:
+                    record = TranslationMemoryRecord(
+                        engine_name=engine_name,
+                        from_lang=request.from_lang,
+                        to_lang=request.to_lang,
+                        text_hash=key[2],
+                        with_detail=with_detail,
+                        hit_count=0,
+                        created_at=now,
+                    )
+                    session.add(record)
+                    records[key] = record
+                    inserted += 1
+                record.result_json = result.model_dump_json()
+                record.created_at = now
+                record.last_used_at = now
+            session.commit()
+            if self._needs_eviction(session, inserted):
+                self._evict(session, now)
+        except IntegrityError:
+            session.rollback()
+        except SQLAlchemyError:
+            logger.warning("Translation memory write failed", exc_info=True)
+            session.rollback()
+        finally:
+            session.close()
+
+    def count(self) -> int:
+        session = get_session()
+        try:
+            return session.query(func.count(TranslationMemoryRecord.id)).scalar()
+        finally:
+            session.close()
+
+    def clear(self) -> int:
+        session = get_session()
+        try:
+            count = session.query(TranslationMemoryRecord).delete()
+            session.commit()
+            with self._lock:
+                self._pending_hits.clear()
+                self._row_count = 0
+            return count
+        finally:
+            session.close()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+
+        session = get_session()
+        try:
+            for record_id, (hits, last_used_at) in pending.items():
+                session.query(TranslationMemoryRecord).filter_by(id=record_id).update(
+                    {
+                        TranslationMemoryRecord.hit_count: (
+                            TranslationMemoryRecord.hit_count + hits
+                        ),
+                        TranslationMemoryRecord.last_used_at: last_used_at,
+                    },
+                    synchronize_session=False,
+                )
+            session.commit()
+        except SQLAlchemyError:
+            logger.warning("Translation memory access update failed", exc_info=True)
+            session.rollback()
+        finally:
+            session.close()
+
+    def _record_hits(self, record_ids: list[int], now: datetime) -> None:
+        if not record_ids:
+            return
+        with self._lock:
+            for record_id in record_ids:
+                hits, _ = self._pending_hits.get(record_id, (0, now))
+                self._pending_hits[record_id] = (hits + 1, now)
+            due = (
+                len(self._pending_hits) >= _ACCESS_FLUSH_SIZE
+                or time.monotonic() - self._last_flush >= _ACCESS_FLUSH_SECONDS
+            )
+        if due:
+            self.flush()
+
+    def _adjust_row_count(self, delta: int) -> None:
+        with self._lock:
+            if self._row_count is not None:
+                self._row_count += delta
+
+    def _needs_eviction(self, session, inserted: int) -> bool:
+        with self._lock:
+            if self._row_count is None:
+                self._row_count = session.query(
+                    func.count(TranslationMemoryRecord.id)
+                ).scalar()
+            else:
+                self._row_count += inserted
+            self._inserts_since_sweep += inserted
+            return (
+                self._row_count > self._max_entries
+                or self._inserts_since_sweep >= _SWEEP_INTERVAL
+            )
+
+    def _find(
+        self,
+        session,
+        engine_name: str,
+        request: TranslationRequest,
+        with_detail: bool,
+    ) -> Optional[TranslationMemoryRecord]:
+        return (
+            session.query(TranslationMemoryRecord)
+            .filter_by(
+                engine_name=engine_name,
+                from_lang=request.from_lang,
+                to_lang=request.to_lang,
+                text_hash=text_hash(request.text),
+                with_detail=with_detail,
+            )
+            .first()
+        )
+
+    def _find_many(
+        self,
+        session,
+        engine_name: str,
+        requests: list[TranslationRequest],
+        with_detail: bool,
+    ) -> dict[tuple[str, str, str], TranslationMemoryRecord]:
+        hashes = sorted({text_hash(request.text) for request in requests})
+        records: dict[tuple[str, str, str], TranslationMemoryRecord] = {}
+        for start in range(0, len(hashes), _LOOKUP_BATCH_SIZE):
+            query = session.query(TranslationMemoryRecord).filter(
+                TranslationMemoryRecord.engine_name == engine_name,
+                TranslationMemoryRecord.with_detail == with_detail,
+                TranslationMemoryRecord.text_hash.in_(hashes[start:start + _LOOKUP_BATCH_SIZE]),
+            )
+            for record in query:
+                records[(record.from_lang, record.to_lang, record.text_hash)] = record
+        return records
+
+    @staticmethod
+    def _key(request: TranslationRequest) -> tuple[str, str, str]:
+        return (request.from_lang, request.to_lang, text_hash(request.text))
+
+    def _evict(self, session, now: datetime) -> None:
+        self.flush()
+
+        session.query(TranslationMemoryRecord).filter(
+            TranslationMemoryRecord.created_at < now - self._max_age
+        ).delete(synchronize_session=False)
+
+        total = session.query(func.count(TranslationMemoryRecord.id)).scalar()
+        overflow = total - self._max_entries
+        if overflow > 0:
+            overflow += self._max_entries // _EVICT_HEADROOM_DIVISOR
+            stale_ids = [
+                row.id
+                for row in session.query(TranslationMemoryRecord.id)
+                .order_by(TranslationMemoryRecord.last_used_at)
+                .limit(overflow)
+            ]
+            session.query(TranslationMemoryRecord).filter(
+                TranslationMemoryRecord.id.in_(stale_ids)
+            ).delete(synchronize_session=False)
+            total -= len(stale_ids)
+
+        session.commit()
+        with self._lock:
+            self._row_count = total
+            self._inserts_since_sweep = 0
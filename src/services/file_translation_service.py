@@ -1,23 +1,45 @@
 from __future__ import annotations
 
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Optional
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from src.config.constants import UNSPACED_LANGUAGES
 from src.file_parser.parser_factory import ParserFactory
+from src.history.file_job_journal import FileJobJournal, FileJobKey, hash_file
+from src.services.segment_dedup import SegmentDeduplicator
 from src.translation.engine_manager import EngineManager
-from src.translation.models import TranslationRequest
-from src.utils.text_utils import split_text_chunks
+from src.translation.models import TranslationRequest, TranslationResult
+from src.utils.text_utils import (
+    pack_segments,
+    split_paragraphs,
+    split_sentences,
+    text_hash,
+)
+
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
 
 
 class FileTranslationService(QObject):
     progress_updated = pyqtSignal(int, int)
     translation_completed = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
+    duplicates_saved = pyqtSignal(int, int)
 
-    def __init__(self, engine_manager: EngineManager) -> None:
+    def __init__(
+        self,
+        engine_manager: EngineManager,
+        workers_per_engine: Optional[dict[str, int]] = None,
+        journal: Optional[FileJobJournal] = None,
+    ) -> None:
         super().__init__()
         self._engine_manager = engine_manager
+        self._workers_per_engine = workers_per_engine or {}
+        self._journal = journal
 
     def translate_file(
         self,
@@ -31,32 +53,35 @@ class FileTranslationService(QObject):
                 self.error_occurred.emit(f"不支持的文件格式: {file_path.suffix}")
                 return
 
-            text = parser.parse(file_path)
-
-            if not text.strip():
-                self.error_occurred.emit("文件内容为空")
-                return
-
-            chunks = split_text_chunks(text)
-            total_chunks = len(chunks)
-
-            translated_chunks = []
-
-            for i, chunk in enumerate(chunks):
-                request = TranslationRequest(
-                    text=chunk,
+            engine = self._engine_manager.current_engine
+            chunks = pack_segments(
+                parser.iter_segments(file_path),
+                engine.max_segment_size,
+                engine.measure_segment,
+            )
+
+            requests = (
+                TranslationRequest(text=chunk, from_lang=from_lang, to_lang=to_lang)
+                for chunk in chunks
+            )
+
+            job = None
+            if self._journal is not None:
+                job = FileJobKey(
+                    file_hash=hash_file(file_path),
                     from_lang=from_lang,
                     to_lang=to_lang,
+                    engine_name=self._engine_manager.current_engine_name,
                 )
 
-                result = self._engine_manager.translate(request)
+            dedup = SegmentDeduplicator()
+            translated_chunks = self._translate_requests(requests, dedup, job)
 
-                if result.success:
-                    translated_chunks.append(result.translated_text)
-                else:
-                    translated_chunks.append(f"[翻译失败: {result.error}]")
+            if translated_chunks is None:
+                self.error_occurred.emit("文件内容为空")
+                return
 
-                self.progress_updated.emit(i + 1, total_chunks)
+            self._report_duplicates(dedup)
 
             translated_text = "\n\n".join(translated_chunks)
 
@@ -64,3 +89,165 @@ class FileTranslationService(QObject):
 
         except Exception as e:
             self.error_occurred.emit(f"文件翻译出错: {str(e)}")
+
+    def _worker_count(self) -> int:
+        engine_name = self._engine_manager.current_engine_name
+        return max(1, self._workers_per_engine.get(engine_name, 1))
+
+    def _report_duplicates(self, dedup: SegmentDeduplicator) -> None:
+        self._engine_manager.metrics.record_cache(
+            "file_dedup", hits=dedup.saved_segments, misses=dedup.unique_segments
+        )
+        self.duplicates_saved.emit(dedup.saved_segments, dedup.saved_chars)
+
+    def _translate_requests(
+        self,
+        requests: Iterable[TranslationRequest],
+        dedup: SegmentDeduplicator,
+        job: Optional[FileJobKey] = None,
+    ) -> Optional[list[str]]:
+        workers = self._worker_count()
+        window = workers * _CHUNKS_IN_FLIGHT_PER_WORKER
+        checkpoints = self._journal.load(job) if job is not None else {}
+        translated: list[str] = []
+        pending: deque[Future] = deque()
+        progress_lock = threading.Lock()
+        submitted = 0
+        finished = 0
+        has_content = False
+        complete = True
+        exhausted = False
+
+        def report_progress(future: Future) -> None:
+            nonlocal finished
+            if future.cancelled() or future.exception() is not None:
+                return
+            with progress_lock:
+                finished += 1
+                self.progress_updated.emit(finished, submitted if exhausted else 0)
+
+        def drain_oldest() -> None:
+            nonlocal complete
+            text, ok = pending.popleft().result()
+            translated.append(text)
+            complete = complete and ok
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for index, request in enumerate(requests):
+                    has_content = has_content or bool(request.text.strip())
+                    checkpoint = checkpoints.get(index)
+                    if checkpoint is not None and checkpoint[0] == text_hash(request.text):
+                        future: Future = Future()
+                        future.set_result((checkpoint[1], True))
+                    else:
+                        future = executor.submit(
+                            self._translate_and_record, dedup, job, index, request
+                        )
+                    with progress_lock:
+                        submitted += 1
+                    pending.append(future)
+                    future.add_done_callback(report_progress)
+                    while len(pending) >= window:
+                        drain_oldest()
+
+                with progress_lock:
+                    exhausted = True
+                    if submitted and finished == submitted:
+                        self.progress_updated.emit(finished, submitted)
+                while pending:
+                    drain_oldest()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        if job is not None and complete:
+            self._journal.discard(job)
+
+        return translated if has_content else None
+
+    def _translate_and_record(
+        self,
+        dedup: SegmentDeduplicator,
+        job: Optional[FileJobKey],
+        index: int,
+        request: TranslationRequest,
+    ) -> tuple[str, bool]:
+        text, ok = self._translate_chunk(request, dedup)
+        if job is not None and ok:
+            self._journal.record(job, index, text_hash(request.text), text)
+        return text, ok
+
+    def _translate_chunk(
+        self, request: TranslationRequest, dedup: SegmentDeduplicator
+    ) -> tuple[str, bool]:
+        pieces = self._layout(request.text, by_sentence=self._engine_manager.memory is not None)
+        segments = [
+            TranslationRequest(text=text, from_lang=request.from_lang, to_lang=request.to_lang)
+            for text, translatable in pieces
+            if translatable
+        ]
+        if not segments:
+            return request.text, True
+
+        batch_results = self._translate_unique(segments, dedup)
+        results = iter(batch_results)
+        separator = "" if request.to_lang in UNSPACED_LANGUAGES else " "
+        parts: list[str] = []
+        follows_unit = False
+        for text, translatable in pieces:
+            if translatable:
+                if follows_unit:
+                    parts.append(separator)
+                parts.append(self._format_result(next(results)))
+            elif text:
+                parts.append(text)
+            follows_unit = translatable or (follows_unit and not text)
+        return "".join(parts), all(result.success for result in batch_results)
+
+    @staticmethod
+    def _layout(text: str, by_sentence: bool) -> list[tuple[str, bool]]:
+        pieces: list[tuple[str, bool]] = []
+        for index, paragraph in enumerate(split_paragraphs(text)):
+            if index:
+                pieces.append(("\n", False))
+            units = split_sentences(paragraph) if by_sentence else [paragraph]
+            for unit in units:
+                core = unit.strip()
+                if not core:
+                    pieces.append((unit, False))
+                    continue
+                start = unit.index(core)
+                pieces.append((unit[:start], False))
+                pieces.append((core, True))
+                pieces.append((unit[start + len(core):], False))
+        return pieces
+
+    def _translate_unique(
+        self, segments: list[TranslationRequest], dedup: SegmentDeduplicator
+    ) -> list[TranslationResult]:
+        claims = [dedup.claim(segment.text) for segment in segments]
+        owned = [index for index, (_, leader) in enumerate(claims) if leader]
+
+        try:
+            fresh = (
+                self._engine_manager.translate_batch([segments[i] for i in owned])
+                if owned
+                else []
+            )
+        except BaseException as exc:
+            for index in owned:
+                claims[index][0].set_exception(exc)
+            raise
+
+        for index, result in zip(owned, fresh):
+            claims[index][0].set_result(result)
+
+        return [future.result() for future, _ in claims]
+
+    @staticmethod
+    def _format_result(result: TranslationResult) -> str:
+        if result.success:
+            return result.translated_text
+        return f"[翻译失败: {result.error}]"
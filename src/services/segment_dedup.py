@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+from src.utils.text_utils import normalize_text
+
+
+class SegmentDeduplicator:
+
+    def __init__(self) -> None:
+        self._segments: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._saved_segments = 0
+        self._saved_chars = 0
+
+    @property
+    def unique_segments(self) -> int:
+        with self._lock:
+            return len(self._segments)
+
+    @property
+    def saved_segments(self) -> int:
+        with self._lock:
+            return self._saved_segments
+
+    @property
+    def saved_chars(self) -> int:
+        with self._lock:
+            return self._saved_chars
+
+    def claim(self, text: str) -> tuple[Future, bool]:
+        key = normalize_text(text)
+        with self._lock:
+            future = self._segments.get(key)
+            if future is not None:
+                self._saved_segments += 1
+                self._saved_chars += len(text)
+                return future, False
+            future = Future()
+            self._segments[key] = future
+            return future, True
+
@@ -1,35 +1,165 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
 from PyQt5.QtCore import QObject, pyqtSignal
 
 from src.history.repository import TranslationRepository
+from src.translation.dictionary_engine import LocalDictionaryEngine
 from src.translation.engine_manager import EngineManager
 from src.translation.models import TranslationRequest, TranslationResult
+from src.translation.rate_limiter import TokenBucket
+from src.utils.lru_cache import LruCache
+from src.utils.text_utils import is_single_word, normalize_text
+
+CacheKey = tuple[Optional[str], str, str, str]
 
 
 class TranslationService(QObject):
     translation_completed = pyqtSignal(TranslationResult)
+    translation_partial = pyqtSignal(str, str)
 
     def __init__(
         self,
         engine_manager: EngineManager,
         repository: TranslationRepository,
+        result_cache: Optional[LruCache[TranslationResult]] = None,
+        prefetch_budget: Optional[TokenBucket] = None,
+        dictionary: Optional[LocalDictionaryEngine] = None,
     ) -> None:
         super().__init__()
         self._engine_manager = engine_manager
         self._repository = repository
+        self._result_cache = result_cache
+        self._prefetch_budget = prefetch_budget
+        self._dictionary = dictionary
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: dict[CacheKey, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def translate_text(self, text: str, from_lang: str = "auto", to_lang: str = "zh") -> None:
-        request = TranslationRequest(text=text, from_lang=from_lang, to_lang=to_lang)
+        cache_key = self._cache_key(text, from_lang, to_lang)
 
-        result = self._engine_manager.translate(request)
+        result = self._cached_or_inflight(cache_key)
 
-        if result.success and result.is_word:
-            word_result = self._engine_manager.lookup_word(text, from_lang, to_lang)
-            if word_result.success and word_result.word_detail:
-                result = word_result
+        if result is None:
+            result = self._translate_uncached(text, from_lang, to_lang)
+            if result.success and self._result_cache is not None:
+                self._result_cache.put(cache_key, result)
+        else:
+            result = result.model_copy(update={"source_text": text})
+
+        self.translation_completed.emit(result)
 
         if result.success:
             self._repository.create_from_result(result)
 
-        self.translation_completed.emit(result)
+    def prefetch(self, text: str, from_lang: str = "auto", to_lang: str = "zh") -> bool:
+        if self._result_cache is None:
+            return False
+
+        cache_key = self._cache_key(text, from_lang, to_lang)
+        with self._inflight_lock:
+            if cache_key in self._inflight or self._result_cache.get(cache_key) is not None:
+                return False
+            if self._prefetch_budget is not None and not self._prefetch_budget.try_acquire():
+                return False
+            self._inflight[cache_key] = self._get_prefetch_executor().submit(
+                self._run_prefetch, cache_key, text, from_lang, to_lang
+            )
+        return True
+
+    def set_prefetch_budget(self, budget: Optional[TokenBucket]) -> None:
+        self._prefetch_budget = budget
+
+    def set_dictionary(self, dictionary: Optional[LocalDictionaryEngine]) -> None:
+        previous, self._dictionary = self._dictionary, dictionary
+        if previous is not None and previous is not dictionary:
+            previous.close()
+
+    def clear_cache(self) -> None:
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def _cache_key(self, text: str, from_lang: str, to_lang: str) -> CacheKey:
+        return (
+            self._engine_manager.current_engine_name,
+            from_lang,
+            to_lang,
+            normalize_text(text),
+        )
+
+    def _cached_or_inflight(self, cache_key: CacheKey) -> Optional[TranslationResult]:
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+
+        if future is not None:
+            try:
+                prefetched = future.result()
+            except Exception:
+                prefetched = None
+            if prefetched is not None and prefetched.success:
+                return prefetched
+
+        if self._result_cache is None:
+            return None
+
+        cached = self._result_cache.get(cache_key)
+        self._engine_manager.metrics.record_cache(
+            "result_cache", hits=int(cached is not None), misses=int(cached is None)
+        )
+        return cached
+
+    def _run_prefetch(
+        self, cache_key: CacheKey, text: str, from_lang: str, to_lang: str
+    ) -> TranslationResult:
+        try:
+            result = self._translate_uncached(text, from_lang, to_lang, interactive=False)
+            if result.success:
+                self._result_cache.put(cache_key, result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _get_prefetch_executor(self) -> ThreadPoolExecutor:
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="prefetch"
+            )
+        return self._prefetch_executor
+
+    def _lookup_local(
+        self, word: str, from_lang: str, to_lang: str
+    ) -> Optional[TranslationResult]:
+        dictionary = self._dictionary
+        if dictionary is None or not dictionary.supports(word, from_lang, to_lang):
+            return None
+
+        result = dictionary.lookup_word(word, from_lang, to_lang)
+        self._engine_manager.metrics.record_cache(
+            "local_dictionary", hits=int(result.success), misses=int(not result.success)
+        )
+        return result if result.success else None
+
+    def _translate_uncached(
+        self, text: str, from_lang: str, to_lang: str, interactive: bool = True
+    ) -> TranslationResult:
+        if is_single_word(text):
+            result = self._lookup_local(text, from_lang, to_lang)
+            if result is not None:
+                return result
+            return self._engine_manager.lookup_word(
+                text, from_lang, to_lang, interactive=interactive
+            )
+
+        request = TranslationRequest(text=text, from_lang=from_lang, to_lang=to_lang)
+        if not interactive:
+            return self._engine_manager.translate(request)
+        return self._engine_manager.translate_stream(
+            request,
+            lambda partial: self.translation_partial.emit(text, partial),
+            interactive=True,
+        )
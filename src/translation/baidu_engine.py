@@ -4,10 +4,21 @@ import hashlib
 import random
 import string
 
+from typing import Optional
+
 import httpx
 
-from src.config.constants import BAIDU_API_URL, BAIDU_LANGUAGE_CODES
+from src.config.constants import (
+    BAIDU_API_URL,
+    BAIDU_LANGUAGE_CODES,
+    BAIDU_MAX_QUERY_BYTES,
+    BAIDU_RATE_LIMIT_ERROR_CODES,
+    BAIDU_RETRYABLE_ERROR_CODES,
+    NETWORK_ERROR_CODE,
+)
 from src.translation.base_engine import TranslationEngine
+from src.translation.batching import group_requests
+from src.translation.http_flow import HttpCall, HttpFlow, T, run_flow
 from src.translation.models import (
     TranslationRequest,
     TranslationResult,
@@ -16,13 +27,14 @@ from src.translation.models import (
 from src.utils.text_utils import is_single_word
 
 
-class BaiduEngine(TranslationEngine):
+class _BaiduProtocol:
+
+    _timeout = 10.0
 
-    def __init__(self, app_id: str, secret_key: str, api_url: str = BAIDU_API_URL) -> None:
+    def __init__(self, app_id: str, secret_key: str, api_url: str) -> None:
         self._app_id = app_id
         self._secret_key = secret_key
         self._api_url = api_url
-        self._client = httpx.Client(timeout=10.0)
 
     @property
     def name(self) -> str:
@@ -35,21 +47,38 @@ class BaiduEngine(TranslationEngine):
     def _map_lang_code(self, lang: str) -> str:
         return BAIDU_LANGUAGE_CODES.get(lang, lang)
 
-    def translate(self, request: TranslationRequest) -> TranslationResult:
-        if not self._app_id or not self._secret_key:
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error="百度翻译 API 密钥未配置",
-            )
+    def _has_credentials(self) -> bool:
+        return bool(self._app_id and self._secret_key)
+
+    @property
+    def rate_limit_error_codes(self) -> frozenset[str]:
+        return BAIDU_RATE_LIMIT_ERROR_CODES
+
+    @property
+    def retryable_error_codes(self) -> frozenset[str]:
+        return BAIDU_RETRYABLE_ERROR_CODES
 
+    def _error_result(
+        self,
+        request: TranslationRequest,
+        error: str,
+        error_code: Optional[str] = None,
+    ) -> TranslationResult:
+        return TranslationResult(
+            source_text=request.text,
+            translated_text="",
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            engine_name=self.name,
+            error=error,
+            error_code=error_code,
+        )
+
+    def _build_params(self, request: TranslationRequest) -> dict[str, str]:
         salt = "".join(random.choices(string.digits, k=10))
         sign = self._generate_sign(request.text, salt)
 
-        params = {
+        return {
             "q": request.text,
             "from": self._map_lang_code(request.from_lang),
             "to": self._map_lang_code(request.to_lang),
@@ -58,28 +87,12 @@ class BaiduEngine(TranslationEngine):
             "sign": sign,
         }
 
-        try:
-            response = self._client.get(self._api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-        except httpx.HTTPError as exc:
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error=f"网络请求失败: {exc}",
-            )
-
+    def _parse_response(self, request: TranslationRequest, data: dict) -> TranslationResult:
         if "error_code" in data:
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error=f"百度API错误 {data['error_code']}: {data.get('error_msg', '')}",
+            return self._error_result(
+                request,
+                f"百度API错误 {data['error_code']}: {data.get('error_msg', '')}",
+                error_code=str(data["error_code"]),
             )
 
         trans_result = data.get("trans_result", [])
@@ -100,10 +113,74 @@ class BaiduEngine(TranslationEngine):
             is_word=word_check,
         )
 
-    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
-        request = TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang)
-        result = self.translate(request)
+    @property
+    def max_segment_size(self) -> int:
+        return BAIDU_MAX_QUERY_BYTES
+
+    def measure_segment(self, text: str) -> int:
+        return len(text.encode("utf-8"))
+
+    def estimate_batch_calls(self, requests: list[TranslationRequest]) -> int:
+        return len(self._batch_groups(requests))
+
+    def _batch_groups(self, requests: list[TranslationRequest]) -> list[list[int]]:
+        return group_requests(
+            requests,
+            BAIDU_MAX_QUERY_BYTES + 1,
+            lambda text: self.measure_segment(text) + 1,
+        )
+
+    def _batch_lines(self, request: TranslationRequest) -> list[str]:
+        return [line for line in request.text.split("\n") if line.strip()]
+
+    def _build_batch_params(self, batch: list[TranslationRequest]) -> dict[str, str]:
+        lines = [line for request in batch for line in self._batch_lines(request)]
+        joined = TranslationRequest(
+            text="\n".join(lines),
+            from_lang=batch[0].from_lang,
+            to_lang=batch[0].to_lang,
+        )
+        return self._build_params(joined)
+
+    def _parse_batch_response(
+        self, batch: list[TranslationRequest], data: dict
+    ) -> Optional[list[TranslationResult]]:
+        if "error_code" in data:
+            return [self._parse_response(request, data) for request in batch]
+
+        trans_result = data.get("trans_result", [])
+        line_counts = [len(self._batch_lines(request)) for request in batch]
+        if len(trans_result) != sum(line_counts):
+            return None
 
+        detected_from = data.get("from", batch[0].from_lang)
+        detected_to = data.get("to", batch[0].to_lang)
+
+        results = []
+        position = 0
+        for request, count in zip(batch, line_counts):
+            translated = iter(
+                item.get("dst", "") for item in trans_result[position:position + count]
+            )
+            position += count
+            translated_text = "\n".join(
+                next(translated) if line.strip() else ""
+                for line in request.text.split("\n")
+            )
+            results.append(
+                TranslationResult(
+                    source_text=request.text,
+                    translated_text=translated_text,
+                    from_lang=detected_from,
+                    to_lang=detected_to,
+                    engine_name=self.name,
+                    is_word=is_single_word(request.text),
+                )
+            )
+
+        return results
+
+    def _to_word_result(self, word: str, result: TranslationResult) -> TranslationResult:
         if not result.success:
             return result
 
@@ -122,5 +199,98 @@ class BaiduEngine(TranslationEngine):
             word_detail=detail,
         )
 
+    def _get(self, params: dict[str, str]) -> HttpCall:
+        return "get", self._api_url, {"params": params, "timeout": self._timeout}
+
+    def _network_error(
+        self, requests: list[TranslationRequest], exc: httpx.HTTPError
+    ) -> list[TranslationResult]:
+        return [
+            self._error_result(r, f"网络请求失败: {exc}", error_code=NETWORK_ERROR_CODE)
+            for r in requests
+        ]
+
+    def _translate_flow(self, request: TranslationRequest) -> HttpFlow[TranslationResult]:
+        if not self._has_credentials():
+            return self._error_result(request, "百度翻译 API 密钥未配置")
+
+        try:
+            response = yield self._get(self._build_params(request))
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError as exc:
+            return self._network_error([request], exc)[0]
+
+        return self._parse_response(request, data)
+
+    def _lookup_word_flow(
+        self, word: str, from_lang: str, to_lang: str
+    ) -> HttpFlow[TranslationResult]:
+        request = TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang)
+        result = yield from self._translate_flow(request)
+        return self._to_word_result(word, result)
+
+    def _translate_batch_flow(
+        self, requests: list[TranslationRequest]
+    ) -> HttpFlow[list[TranslationResult]]:
+        if not self._has_credentials():
+            return [self._error_result(r, "百度翻译 API 密钥未配置") for r in requests]
+
+        results: list[Optional[TranslationResult]] = [None] * len(requests)
+
+        for group in self._batch_groups(requests):
+            batch = [requests[i] for i in group]
+            if len(batch) == 1:
+                group_results = [(yield from self._translate_flow(batch[0]))]
+            else:
+                try:
+                    response = yield self._get(self._build_batch_params(batch))
+                    response.raise_for_status()
+                    data = response.json()
+                except httpx.HTTPError as exc:
+                    group_results = self._network_error(batch, exc)
+                else:
+                    group_results = self._parse_batch_response(batch, data)
+                    if group_results is None:
+                        group_results = []
+                        for request in batch:
+                            group_results.append((yield from self._translate_flow(request)))
+
+            for index, result in zip(group, group_results):
+                results[index] = result
+
+        return results
+
+
+class BaiduEngine(_BaiduProtocol, TranslationEngine):
+
+    def __init__(
+        self,
+        app_id: str,
+        secret_key: str,
+        api_url: str = BAIDU_API_URL,
+        client: Optional[httpx.Client] = None,
+    ) -> None:
+        super().__init__(app_id, secret_key, api_url)
+        self._owns_client = client is None
+        self._client = client or httpx.Client(timeout=self._timeout)
+
+    @property
+    def uses_request_hook(self) -> bool:
+        return True
+
+    def _run(self, flow: HttpFlow[T]) -> T:
+        return run_flow(self._client, flow, self._request_hook)
+
+    def translate(self, request: TranslationRequest) -> TranslationResult:
+        return self._run(self._translate_flow(request))
+
+    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
+        return self._run(self._lookup_word_flow(word, from_lang, to_lang))
+
+    def translate_batch(self, requests: list[TranslationRequest]) -> list[TranslationResult]:
+        return self._run(self._translate_batch_flow(requests))
+
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
+from src.config.constants import MAX_TEXT_CHUNK_SIZE
 from src.translation.models import TranslationRequest, TranslationResult
 
 
 class TranslationEngine(ABC):
 
+    _request_hook: Optional[Callable[[], object]] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -19,3 +23,47 @@ class TranslationEngine(ABC):
     @abstractmethod
     def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
         ...
+
+    @property
+    def supports_word_detail_in_translate(self) -> bool:
+        return False
+
+    @property
+    def max_segment_size(self) -> int:
+        return MAX_TEXT_CHUNK_SIZE
+
+    def measure_segment(self, text: str) -> int:
+        return len(text)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return False
+
+    def translate_stream(
+        self, request: TranslationRequest, on_partial: Callable[[str], None]
+    ) -> TranslationResult:
+        result = self.translate(request)
+        if result.success:
+            on_partial(result.translated_text)
+        return result
+
+    @property
+    def rate_limit_error_codes(self) -> frozenset[str]:
+        return frozenset()
+
+    @property
+    def retryable_error_codes(self) -> frozenset[str]:
+        return frozenset()
+
+    @property
+    def uses_request_hook(self) -> bool:
+        return False
+
+    def set_request_hook(self, hook: Optional[Callable[[], object]]) -> None:
+        self._request_hook = hook
+
+    def estimate_batch_calls(self, requests: list[TranslationRequest]) -> int:
+        return len(requests)
+
+    def translate_batch(self, requests: list[TranslationRequest]) -> list[TranslationResult]:
+        return [self.translate(request) for request in requests]
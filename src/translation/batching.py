@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from src.translation.models import TranslationRequest
+
+
+def group_requests(
+    requests: list[TranslationRequest],
+    max_size: int,
+    size_fn: Callable[[str], int] = len,
+    max_items: Optional[int] = None,
+) -> list[list[int]]:
+    groups: list[list[int]] = []
+    open_groups: dict[tuple[str, str], tuple[list[int], int]] = {}
+
+    for index, request in enumerate(requests):
+        pair = (request.from_lang, request.to_lang)
+        size = size_fn(request.text)
+
+        current = open_groups.get(pair)
+        if (
+            current is not None
+            and current[1] + size <= max_size
+            and (max_items is None or len(current[0]) < max_items)
+        ):
+            current[0].append(index)
+            open_groups[pair] = (current[0], current[1] + size)
+            continue
+
+        group = [index]
+        groups.append(group)
+        open_groups[pair] = (group, size)
+
+    return groups
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Optional
+
+from src.config.constants import DICTIONARY_MISS_ERROR_CODE
+from src.translation.base_engine import TranslationEngine
+from src.translation.local_dictionary import LocalDictionary
+from src.translation.models import TranslationRequest, TranslationResult
+
+_SOURCE_LANGS = frozenset({"en", "auto"})
+_TARGET_LANGS = frozenset({"zh"})
+
+
+class LocalDictionaryEngine(TranslationEngine):
+
+    def __init__(self, dictionary: LocalDictionary) -> None:
+        self._dictionary = dictionary
+
+    @property
+    def name(self) -> str:
+        return "dictionary"
+
+    @property
+    def supports_word_detail_in_translate(self) -> bool:
+        return True
+
+    def supports(self, word: str, from_lang: str, to_lang: str) -> bool:
+        return (
+            from_lang in _SOURCE_LANGS
+            and to_lang in _TARGET_LANGS
+            and word.strip().isascii()
+        )
+
+    def translate(self, request: TranslationRequest) -> TranslationResult:
+        return self.lookup_word(request.text, request.from_lang, request.to_lang)
+
+    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
+        request = TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang)
+
+        if not self.supports(word, from_lang, to_lang):
+            return self._error_result(request, "本地词典仅支持英译中单词查询")
+
+        try:
+            detail = self._dictionary.lookup(word)
+        except sqlite3.Error as exc:
+            return self._error_result(request, f"本地词典查询失败: {exc}")
+
+        if detail is None:
+            return self._error_result(
+                request, f"本地词典未收录: {word}", DICTIONARY_MISS_ERROR_CODE
+            )
+
+        return TranslationResult(
+            source_text=word,
+            translated_text="\n".join(detail.explains),
+            from_lang=from_lang,
+            to_lang=to_lang,
+            engine_name=self.name,
+            is_word=True,
+            word_detail=detail,
+        )
+
+    def _error_result(
+        self,
+        request: TranslationRequest,
+        error: str,
+        error_code: Optional[str] = None,
+    ) -> TranslationResult:
+        return TranslationResult(
+            source_text=request.text,
+            translated_text="",
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            engine_name=self.name,
+            is_word=True,
+            error=error,
+            error_code=error_code,
+        )
+
+    def close(self) -> None:
+        self._dictionary.close()
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import Optional
+
+import httpx
+
 from src.config.settings import ApiKeys
 from src.translation.baidu_engine import BaiduEngine
 from src.translation.base_engine import TranslationEngine
@@ -10,33 +14,56 @@ from src.translation.youdao_engine import YoudaoEngine
 class EngineFactory:
 
     @staticmethod
-    def create_baidu_engine(api_keys: ApiKeys) -> BaiduEngine:
+    def create_baidu_engine(
+        api_keys: ApiKeys, client: Optional[httpx.Client] = None
+    ) -> BaiduEngine:
         return BaiduEngine(
             app_id=api_keys.baidu_app_id,
             secret_key=api_keys.baidu_secret_key,
             api_url=api_keys.baidu_api_url,
+            client=client,
         )
 
     @staticmethod
-    def create_youdao_engine(api_keys: ApiKeys) -> YoudaoEngine:
+    def create_youdao_engine(
+        api_keys: ApiKeys, client: Optional[httpx.Client] = None
+    ) -> YoudaoEngine:
         return YoudaoEngine(
             app_key=api_keys.youdao_app_key,
             app_secret=api_keys.youdao_app_secret,
             api_url=api_keys.youdao_api_url,
+            client=client,
         )
 
     @staticmethod
-    def create_llm_engine(api_keys: ApiKeys) -> LlmEngine:
+    def create_llm_engine(
+        api_keys: ApiKeys, client: Optional[httpx.Client] = None
+    ) -> LlmEngine:
         return LlmEngine(
             api_url=api_keys.llm_api_url,
             api_key=api_keys.llm_api_key,
             model_name=api_keys.llm_model_name,
+            client=client,
         )
 
     @staticmethod
-    def create_all_engines(api_keys: ApiKeys) -> list[TranslationEngine]:
+    def create_all_engines(
+        api_keys: ApiKeys, client: Optional[httpx.Client] = None
+    ) -> list[TranslationEngine]:
         return [
-            EngineFactory.create_baidu_engine(api_keys),
-            EngineFactory.create_youdao_engine(api_keys),
-            EngineFactory.create_llm_engine(api_keys),
+            EngineFactory.create_baidu_engine(api_keys, client),
+            EngineFactory.create_youdao_engine(api_keys, client),
+            EngineFactory.create_llm_engine(api_keys, client),
         ]
+
+    @staticmethod
+    def engine_urls(api_keys: ApiKeys) -> list[str]:
+        urls = []
+        if api_keys.baidu_app_id and api_keys.baidu_secret_key:
+            urls.append(api_keys.baidu_api_url)
+        if api_keys.youdao_app_key and api_keys.youdao_app_secret:
+            urls.append(api_keys.youdao_api_url)
+        if api_keys.llm_api_url and api_keys.llm_api_key:
+            urls.append(api_keys.llm_api_url)
+        return urls
+
@@ -1,19 +1,59 @@
 from __future__ import annotations
 
-from typing import Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Optional
 
+from src.config.constants import (
+    CIRCUIT_OPEN_ERROR_CODE,
+    DEFAULT_HEDGE_DELAY_SECONDS,
+    MIN_HEDGE_DELAY_SECONDS,
+)
+from src.history.translation_memory import TranslationMemory
 from src.translation.base_engine import TranslationEngine
+from src.translation.circuit_breaker import OPEN as CIRCUIT_OPEN
+from src.translation.circuit_breaker import CircuitBreaker
+from src.translation.latency_window import LatencyWindow
+from src.translation.metrics import MetricsRegistry
 from src.translation.models import TranslationRequest, TranslationResult
+from src.translation.rate_limiter import TokenBucket
+from src.translation.retry_policy import RetryPolicy
+from src.translation.single_flight import SingleFlight
+from src.utils.text_utils import normalize_text
+
+FlightKey = tuple[Optional[str], str, str, str, bool]
+
+_HEDGE_WORKERS = 4
 
 
 class EngineManager:
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        memory: Optional[TranslationMemory] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
         self._engines: dict[str, TranslationEngine] = {}
         self._current_engine_name: Optional[str] = None
+        self._memory = memory
+        self._rate_limiters: dict[str, TokenBucket] = {}
+        self._retry_policy: Optional[RetryPolicy] = None
+        self._fallback_chain: list[str] = []
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._state_lock = threading.Lock()
+        self._breaker_failure_threshold = 5
+        self._breaker_cooldown_seconds = 30.0
+        self._hedging_enabled = False
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedges_in_flight = 0
+        self._latencies: dict[str, LatencyWindow] = {}
+        self._flights: SingleFlight[FlightKey, TranslationResult] = SingleFlight()
+        self._metrics = metrics or MetricsRegistry()
 
     def register_engine(self, engine: TranslationEngine) -> None:
         self._engines[engine.name] = engine
+        self._install_request_hook(engine)
         if self._current_engine_name is None:
             self._current_engine_name = engine.name
 
@@ -36,11 +76,531 @@ class EngineManager:
     def available_engines(self) -> list[str]:
         return list(self._engines.keys())
 
-    def translate(self, request: TranslationRequest) -> TranslationResult:
-        return self.current_engine.translate(request)
+    @property
+    def metrics(self) -> MetricsRegistry:
+        return self._metrics
+
+    @property
+    def memory(self) -> Optional[TranslationMemory]:
+        return self._memory
+
+    def configure_rate_limits(self, limits: dict[str, float]) -> None:
+        self._rate_limiters = {
+            name: TokenBucket(rate) for name, rate in limits.items() if rate > 0
+        }
+        for engine in self._engines.values():
+            self._install_request_hook(engine)
+
+    def set_retry_policy(self, policy: Optional[RetryPolicy]) -> None:
+        self._retry_policy = policy
+
+    def set_fallback_chain(self, names: list[str]) -> None:
+        self._fallback_chain = list(names)
+
+    def configure_circuit_breakers(
+        self, failure_threshold: int, cooldown_seconds: float
+    ) -> None:
+        with self._state_lock:
+            self._breaker_failure_threshold = failure_threshold
+            self._breaker_cooldown_seconds = cooldown_seconds
+            self._breakers = {}
+
+    def set_hedging(self, enabled: bool) -> None:
+        self._hedging_enabled = enabled
+
+    def set_memory(self, memory: Optional[TranslationMemory]) -> None:
+        previous, self._memory = self._memory, memory
+        if previous is not None and previous is not memory:
+            previous.flush()
+
+    def translate(
+        self, request: TranslationRequest, interactive: bool = False
+    ) -> TranslationResult:
+        dispatch = self._dispatcher(interactive)
+        return self._coalesce(
+            request,
+            False,
+            lambda: dispatch(request, False, lambda engine: engine.translate(request)),
+        )
+
+    def translate_stream(
+        self,
+        request: TranslationRequest,
+        on_partial: Callable[[str], None],
+        interactive: bool = False,
+    ) -> TranslationResult:
+        if not self.current_engine.supports_streaming:
+            return self.translate(request, interactive)
+        return self._coalesce(
+            request,
+            False,
+            lambda: self._translate_with_failover(
+                request,
+                False,
+                lambda engine: engine.translate_stream(request, on_partial),
+            ),
+        )
+
+    def lookup_word(
+        self, word: str, from_lang: str, to_lang: str, interactive: bool = False
+    ) -> TranslationResult:
+        request = TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang)
+        dispatch = self._dispatcher(interactive)
+        return self._coalesce(
+            request,
+            True,
+            lambda: dispatch(
+                request,
+                True,
+                lambda engine: engine.lookup_word(word, from_lang, to_lang),
+            ),
+        )
+
+    def _dispatcher(
+        self, interactive: bool
+    ) -> Callable[
+        [TranslationRequest, bool, Callable[[TranslationEngine], TranslationResult]],
+        TranslationResult,
+    ]:
+        if interactive and self._hedging_enabled:
+            return self._translate_hedged
+        return self._translate_with_failover
+
+    def translate_batch(self, requests: list[TranslationRequest]) -> list[TranslationResult]:
+        results: list[Optional[TranslationResult]] = [None] * len(requests)
+        owned: list[tuple[int, FlightKey, Future]] = []
+        joined: list[tuple[int, Future]] = []
+
+        for index, request in enumerate(requests):
+            key = self._flight_key(request, False)
+            future, leader = self._flights.claim(key)
+            if leader:
+                owned.append((index, key, future))
+            else:
+                joined.append((index, future))
+
+        try:
+            fresh = self._translate_batch_uncoalesced([requests[i] for i, _, _ in owned])
+        except BaseException as exc:
+            for _, key, future in owned:
+                self._flights.release(key, future, error=exc)
+            raise
+
+        for (index, key, future), result in zip(owned, fresh):
+            results[index] = result
+            self._flights.release(key, future, result)
+
+        for index, future in joined:
+            results[index] = self._for_request(future.result(), requests[index])
+
+        return results
+
+    def _translate_batch_uncoalesced(
+        self, requests: list[TranslationRequest]
+    ) -> list[TranslationResult]:
+        results: list[Optional[TranslationResult]] = [None] * len(requests)
+        pending = list(range(len(requests)))
+
+        for engine in self._engine_chain():
+            if not pending:
+                break
+
+            remaining: list[int] = []
+            cached_results = self._memory_get_many(engine, [requests[i] for i in pending])
+            for index, cached in zip(pending, cached_results):
+                if cached is not None:
+                    results[index] = cached
+                else:
+                    remaining.append(index)
+
+            if not remaining or not self._breaker(engine).allow_request():
+                pending = remaining
+                continue
+
+            try:
+                fresh = self._invoke_batch(engine, [requests[i] for i in remaining])
+            except BaseException:
+                self._breaker(engine).record_failure()
+                raise
+            pending = []
+            for index, result in zip(remaining, fresh):
+                if result.success:
+                    results[index] = result
+                else:
+                    pending.append(index)
+                    if results[index] is None:
+                        results[index] = result
+            self._memory_put_many(
+                engine, [(requests[i], result) for i, result in zip(remaining, fresh)]
+            )
+            self._record_health(engine, fresh)
+
+        for index in pending:
+            if results[index] is None:
+                results[index] = self._unavailable_result(requests[index])
+
+        return results
+
+    def _coalesce(
+        self,
+        request: TranslationRequest,
+        with_detail: bool,
+        call: Callable[[], TranslationResult],
+    ) -> TranslationResult:
+        result = self._flights.run(self._flight_key(request, with_detail), call)
+        return self._for_request(result, request)
+
+    def _flight_key(self, request: TranslationRequest, with_detail: bool) -> FlightKey:
+        return (
+            self._current_engine_name,
+            request.from_lang,
+            request.to_lang,
+            normalize_text(request.text),
+            with_detail,
+        )
+
+    @staticmethod
+    def _for_request(
+        result: TranslationResult, request: TranslationRequest
+    ) -> TranslationResult:
+        if result.source_text == request.text:
+            return result
+        return result.model_copy(update={"source_text": request.text})
+
+    def engine_health(self) -> dict[str, str]:
+        return {name: self._breaker_for(name).state for name in self._engines}
+
+    def _translate_with_failover(
+        self,
+        request: TranslationRequest,
+        with_detail: bool,
+        call: Callable[[TranslationEngine], TranslationResult],
+    ) -> TranslationResult:
+        return self._failover(self._engine_chain(), request, with_detail, call)
+
+    def _failover(
+        self,
+        engines: list[TranslationEngine],
+        request: TranslationRequest,
+        with_detail: bool,
+        call: Callable[[TranslationEngine], TranslationResult],
+        first_failure: Optional[TranslationResult] = None,
+    ) -> TranslationResult:
+        for engine in engines:
+            result = self._try_engine(engine, request, with_detail, call)
+            if result is None:
+                continue
+            if result.success:
+                return result
+            if first_failure is None:
+                first_failure = result
+
+        return first_failure or self._unavailable_result(request)
+
+    def _translate_hedged(
+        self,
+        request: TranslationRequest,
+        with_detail: bool,
+        call: Callable[[TranslationEngine], TranslationResult],
+    ) -> TranslationResult:
+        primary, *fallbacks = self._engine_chain()
+        hedge_index = next(
+            (
+                i for i, engine in enumerate(fallbacks)
+                if self._breaker(engine).state != CIRCUIT_OPEN
+            ),
+            None,
+        )
+        if hedge_index is None:
+            return self._failover([primary], request, with_detail, call)
+
+        cached = self._memory_get(primary, request, with_detail)
+        if cached is not None:
+            return cached
+
+        if not self._reserve_hedge_slots(2):
+            return self._failover(self._engine_chain(), request, with_detail, call)
+
+        cancelled = threading.Event()
+        try:
+            return self._run_hedged(
+                primary, fallbacks, hedge_index, request, with_detail, call, cancelled
+            )
+        finally:
+            cancelled.set()
+
+    def _run_hedged(
+        self,
+        primary: TranslationEngine,
+        fallbacks: list[TranslationEngine],
+        hedge_index: int,
+        request: TranslationRequest,
+        with_detail: bool,
+        call: Callable[[TranslationEngine], TranslationResult],
+        cancelled: threading.Event,
+    ) -> TranslationResult:
+        futures = {
+            self._submit_hedge(primary, request, with_detail, call, cancelled): primary
+        }
+        done, _ = wait(futures, timeout=self._hedge_delay(primary))
+        if done:
+            self._release_hedge_slots(1)
+            result = next(iter(done)).result()
+            if result is not None and result.success:
+                return result
+            return self._failover(fallbacks, request, with_detail, call, result)
+
+        hedge_engine = fallbacks[hedge_index]
+        futures[
+            self._submit_hedge(hedge_engine, request, with_detail, call, cancelled)
+        ] = hedge_engine
+
+        failures: dict[str, TranslationResult] = {}
+        for future in as_completed(futures):
+            result = future.result()
+            if result is not None and result.success:
+                return result
+            if result is not None:
+                failures[futures[future].name] = result
+
+        remaining = fallbacks[:hedge_index] + fallbacks[hedge_index + 1:]
+        first_failure = failures.get(primary.name) or failures.get(hedge_engine.name)
+        return self._failover(remaining, request, with_detail, call, first_failure)
+
+    def _submit_hedge(
+        self,
+        engine: TranslationEngine,
+        request: TranslationRequest,
+        with_detail: bool,
+        call: Callable[[TranslationEngine], TranslationResult],
+        cancelled: threading.Event,
+    ) -> Future:
+        future = self._get_hedge_executor().submit(
+            self._try_engine, engine, request, with_detail, call, cancelled
+        )
+        future.add_done_callback(lambda _: self._release_hedge_slots(1))
+        return future
+
+    def _reserve_hedge_slots(self, count: int) -> bool:
+        with self._state_lock:
+            if self._hedges_in_flight + count > _HEDGE_WORKERS:
+                return False
+            self._hedges_in_flight += count
+            return True
+
+    def _release_hedge_slots(self, count: int) -> None:
+        with self._state_lock:
+            self._hedges_in_flight -= count
+
+    def _try_engine(
+        self,
+        engine: TranslationEngine,
+        request: TranslationRequest,
+        with_detail: bool,
+        call: Callable[[TranslationEngine], TranslationResult],
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[TranslationResult]:
+        cached = self._memory_get(engine, request, with_detail)
+        if cached is not None:
+            return cached
+
+        if not self._breaker(engine).allow_request():
+            return None
+
+        operation = "lookup_word" if with_detail else "translate"
+        try:
+            result = self._invoke(engine, lambda: call(engine), request, operation, cancelled)
+        except BaseException:
+            self._breaker(engine).record_failure()
+            raise
+        self._record_health(engine, [result])
+
+        if result.success:
+            self._memory_put(engine, request, result, with_detail)
+            if (
+                not with_detail
+                and result.word_detail is not None
+                and engine.supports_word_detail_in_translate
+            ):
+                self._memory_put(engine, request, result, with_detail=True)
+        return result
+
+    def _hedge_delay(self, engine: TranslationEngine) -> float:
+        p90 = self._latency_window(engine).percentile(90)
+        if p90 is None:
+            return DEFAULT_HEDGE_DELAY_SECONDS
+        return max(MIN_HEDGE_DELAY_SECONDS, p90)
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._state_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=_HEDGE_WORKERS, thread_name_prefix="hedge"
+                )
+            return self._hedge_executor
+
+    def _latency_window(self, engine: TranslationEngine) -> LatencyWindow:
+        with self._state_lock:
+            window = self._latencies.get(engine.name)
+            if window is None:
+                window = LatencyWindow()
+                self._latencies[engine.name] = window
+            return window
+
+    def _engine_chain(self) -> list[TranslationEngine]:
+        primary = self.current_engine
+        chain = [primary]
+        for name in self._fallback_chain:
+            engine = self._engines.get(name)
+            if engine is not None and engine not in chain:
+                chain.append(engine)
+        return chain
+
+    def _breaker(self, engine: TranslationEngine) -> CircuitBreaker:
+        return self._breaker_for(engine.name)
+
+    def _breaker_for(self, name: str) -> CircuitBreaker:
+        with self._state_lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self._breaker_failure_threshold, self._breaker_cooldown_seconds
+                )
+                self._breakers[name] = breaker
+            return breaker
+
+    def _record_health(
+        self, engine: TranslationEngine, results: list[TranslationResult]
+    ) -> None:
+        breaker = self._breaker(engine)
+        if any(r.success for r in results) or not results:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+    def _memory_get(
+        self, engine: TranslationEngine, request: TranslationRequest, with_detail: bool
+    ) -> Optional[TranslationResult]:
+        if self._memory is None:
+            return None
+        cached = self._memory.get(engine.name, request, with_detail=with_detail)
+        self._metrics.record_cache(
+            "memory", hits=int(cached is not None), misses=int(cached is None)
+        )
+        return cached
+
+    def _memory_put(
+        self,
+        engine: TranslationEngine,
+        request: TranslationRequest,
+        result: TranslationResult,
+        with_detail: bool,
+    ) -> None:
+        if self._memory is not None:
+            self._memory.put(engine.name, request, result, with_detail=with_detail)
+
+    def _memory_get_many(
+        self, engine: TranslationEngine, requests: list[TranslationRequest]
+    ) -> list[Optional[TranslationResult]]:
+        if self._memory is None:
+            return [None] * len(requests)
+        cached = self._memory.get_many(engine.name, requests)
+        hits = sum(1 for result in cached if result is not None)
+        self._metrics.record_cache("memory", hits=hits, misses=len(cached) - hits)
+        return cached
+
+    def _memory_put_many(
+        self,
+        engine: TranslationEngine,
+        entries: list[tuple[TranslationRequest, TranslationResult]],
+    ) -> None:
+        if self._memory is not None:
+            self._memory.put_many(engine.name, entries)
+
+    def _unavailable_result(self, request: TranslationRequest) -> TranslationResult:
+        return TranslationResult(
+            source_text=request.text,
+            translated_text="",
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            engine_name=self._current_engine_name or "",
+            error="翻译引擎暂时不可用（已熔断），请稍后重试",
+            error_code=CIRCUIT_OPEN_ERROR_CODE,
+        )
+
+    def _invoke(
+        self,
+        engine: TranslationEngine,
+        call: Callable[[], TranslationResult],
+        request: TranslationRequest,
+        operation: str,
+        cancelled: Optional[threading.Event] = None,
+    ) -> TranslationResult:
+        def attempt() -> TranslationResult:
+            self._acquire(engine)
+            started = time.monotonic()
+            result = call()
+            elapsed = time.monotonic() - started
+            self._latency_window(engine).record(elapsed)
+            self._metrics.record_call(
+                engine.name, operation, elapsed, len(request.text), [result]
+            )
+            self._observe_rate_limit(engine, [result])
+            return result
+
+        if self._retry_policy is None:
+            return attempt()
+        return self._retry_policy.run(
+            attempt, lambda r: self._is_retryable(engine, r), cancelled
+        )
+
+    def _invoke_batch(
+        self,
+        engine: TranslationEngine,
+        requests: list[TranslationRequest],
+    ) -> list[TranslationResult]:
+        def attempt(batch: list[TranslationRequest]) -> list[TranslationResult]:
+            self._acquire(engine, engine.estimate_batch_calls(batch))
+            started = time.monotonic()
+            results = engine.translate_batch(batch)
+            self._metrics.record_call(
+                engine.name,
+                "translate_batch",
+                time.monotonic() - started,
+                sum(len(r.text) for r in batch),
+                results,
+            )
+            self._observe_rate_limit(engine, results)
+            return results
+
+        if self._retry_policy is None:
+            return attempt(requests)
+        return self._retry_policy.run_batch(
+            attempt, requests, lambda r: self._is_retryable(engine, r)
+        )
+
+    def _install_request_hook(self, engine: TranslationEngine) -> None:
+        if engine.uses_request_hook:
+            limiter = self._rate_limiters.get(engine.name)
+            engine.set_request_hook(limiter.acquire if limiter is not None else None)
+
+    def _acquire(self, engine: TranslationEngine, tokens: int = 1) -> None:
+        limiter = self._rate_limiters.get(engine.name)
+        if limiter is not None and not engine.uses_request_hook:
+            limiter.acquire(tokens)
+
+    def _observe_rate_limit(
+        self, engine: TranslationEngine, results: list[TranslationResult]
+    ) -> None:
+        limiter = self._rate_limiters.get(engine.name)
+        if limiter is not None and any(
+            r.error_code in engine.rate_limit_error_codes for r in results
+        ):
+            limiter.penalize()
 
-    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
-        return self.current_engine.lookup_word(word, from_lang, to_lang)
+    @staticmethod
+    def _is_retryable(engine: TranslationEngine, result: TranslationResult) -> bool:
+        return result.error_code in engine.retryable_error_codes
 
     def reload_engines(self, engines: list[TranslationEngine], default_name: str = "") -> None:
         self.close_all()
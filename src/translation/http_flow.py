@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from contextlib import ExitStack
+from typing import Any, Callable, Generator, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+HttpCall = tuple[str, str, dict[str, Any]]
+HttpFlow = Generator[HttpCall, Any, T]
+
+POST_STREAM = "post_stream"
+READ_BODY: HttpCall = ("read_body", "", {})
+NEXT_LINE: HttpCall = ("next_line", "", {})
+
+_RESPONSE_STEPS = frozenset({READ_BODY[0], NEXT_LINE[0]})
+
+
+def run_flow(
+    client: httpx.Client,
+    flow: HttpFlow[T],
+    before_request: Optional[Callable[[], object]] = None,
+) -> T:
+    with ExitStack() as stack:
+        response: Optional[httpx.Response] = None
+        lines = None
+        try:
+            method, url, options = next(flow)
+            while True:
+                try:
+                    if before_request is not None and method not in _RESPONSE_STEPS:
+                        before_request()
+                    if method == POST_STREAM:
+                        response = stack.enter_context(client.stream("POST", url, **options))
+                        reply = response
+                    elif method == READ_BODY[0]:
+                        response.read()
+                        reply = response
+                    elif method == NEXT_LINE[0]:
+                        if lines is None:
+                            lines = iter(response.iter_lines())
+                        reply = next(lines, None)
+                    else:
+                        reply = getattr(client, method)(url, **options)
+                except httpx.HTTPError as exc:
+                    method, url, options = flow.throw(exc)
+                else:
+                    method, url, options = flow.send(reply)
+        except StopIteration as stop:
+            return stop.value
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import threading
+import time
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpPool:
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 120.0,
+        http2: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._http2 = http2 and http2_available()
+        if http2 and not self._http2:
+            logger.warning("h2 is not installed, falling back to HTTP/1.1")
+
+        self._keepalive_expiry = keepalive_expiry
+        self._clock = clock
+        self._last_used: Optional[float] = None
+        self._origins: list[str] = []
+        self._warming = threading.Lock()
+
+        self._client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=self._http2,
+            event_hooks={"request": [self._touch]},
+        )
+
+    @property
+    def client(self) -> httpx.Client:
+        return self._client
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    @property
+    def warm_targets(self) -> list[str]:
+        return list(self._origins)
+
+    def set_warm_targets(self, urls: Iterable[str]) -> None:
+        origins = set()
+        for url in urls:
+            parts = urlsplit(url)
+            if parts.scheme in ("http", "https") and parts.netloc:
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        self._origins = sorted(origins)
+
+    def is_idle(self) -> bool:
+        return (
+            self._last_used is None
+            or self._clock() - self._last_used >= self._keepalive_expiry
+        )
+
+    def warm_up(self) -> None:
+        if not self._warming.acquire(blocking=False):
+            return
+        try:
+            for origin in self._origins:
+                try:
+                    self._client.head(origin, timeout=5.0)
+                except httpx.HTTPError:
+                    logger.debug("Warm-up request to %s failed", origin, exc_info=True)
+        finally:
+            self._warming.release()
+
+    def warm_up_in_background(self, only_if_idle: bool = False) -> None:
+        if not self._origins or (only_if_idle and not self.is_idle()):
+            return
+        threading.Thread(target=self.warm_up, name="http-warm-up", daemon=True).start()
+
+    def close(self) -> None:
+        self._client.close()
+
+    def _touch(self, request: httpx.Request) -> None:
+        self._last_used = self._clock()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Optional
+
+
+class LatencyWindow:
+
+    def __init__(self, size: int = 100, min_samples: int = 10) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+
+        rank = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        return ordered[rank]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
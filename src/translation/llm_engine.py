@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import json
+import re
+from typing import Callable, Optional
+
 import httpx
 
-from src.config.constants import LLM_LANGUAGE_NAMES
+from src.config.constants import (
+    LLM_LANGUAGE_NAMES,
+    LLM_MAX_BATCH_SEGMENTS,
+    LLM_MAX_BATCH_TOKENS,
+    LLM_RATE_LIMIT_ERROR_CODES,
+    LLM_RETRYABLE_ERROR_CODES,
+    NETWORK_ERROR_CODE,
+)
 from src.translation.base_engine import TranslationEngine
+from src.translation.batching import group_requests
+from src.translation.http_flow import (
+    NEXT_LINE,
+    POST_STREAM,
+    READ_BODY,
+    HttpCall,
+    HttpFlow,
+    T,
+    run_flow,
+)
 from src.translation.models import (
     TranslationRequest,
     TranslationResult,
     WordDetail,
 )
-from src.utils.text_utils import is_single_word
+from src.utils.text_utils import estimate_tokens, is_single_word
 
 _SYSTEM_PROMPT = (
     "You are a professional translator. "
@@ -17,14 +38,30 @@ _SYSTEM_PROMPT = (
     "Output ONLY the translated text, nothing else."
 )
 
+_BATCH_SYSTEM_PROMPT = (
+    "You are a professional translator. "
+    "The user sends a JSON object whose values are text segments in {from_lang}. "
+    "Translate every value to {to_lang}. "
+    "Reply with ONLY a JSON object that has exactly the same keys, "
+    "each mapped to its translation. Never merge, split or skip segments."
+)
+
+_STREAM_DONE = "[DONE]"
 
-class LlmEngine(TranslationEngine):
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+_MERGE_LENGTH_RATIO = 1.8
+_MERGE_MIN_SEGMENTS = 3
+
+
+class _LlmProtocol:
+
+    _timeout = 30.0
 
     def __init__(self, api_url: str, api_key: str, model_name: str) -> None:
         self._api_url = api_url.rstrip("/")
         self._api_key = api_key
         self._model_name = model_name
-        self._client = httpx.Client(timeout=30.0)
 
     @property
     def name(self) -> str:
@@ -33,12 +70,131 @@ class LlmEngine(TranslationEngine):
     def _lang_name(self, code: str) -> str:
         return LLM_LANGUAGE_NAMES.get(code, code)
 
-    def _chat(self, system: str, user_text: str) -> str:
-        url = f"{self._api_url}/chat/completions"
-        headers = {
+    def _is_configured(self) -> bool:
+        return bool(self._api_url and self._api_key and self._model_name)
+
+    @property
+    def rate_limit_error_codes(self) -> frozenset[str]:
+        return LLM_RATE_LIMIT_ERROR_CODES
+
+    @property
+    def retryable_error_codes(self) -> frozenset[str]:
+        return LLM_RETRYABLE_ERROR_CODES
+
+    def _error_result(
+        self,
+        request: TranslationRequest,
+        error: str,
+        error_code: Optional[str] = None,
+    ) -> TranslationResult:
+        return TranslationResult(
+            source_text=request.text,
+            translated_text="",
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            engine_name=self.name,
+            error=error,
+            error_code=error_code,
+        )
+
+    def _system_prompt(self, request: TranslationRequest, template: str = _SYSTEM_PROMPT) -> str:
+        from_name = self._lang_name(request.from_lang)
+        to_name = self._lang_name(request.to_lang)
+        return template.format(from_lang=from_name, to_lang=to_name)
+
+    @property
+    def max_segment_size(self) -> int:
+        return LLM_MAX_BATCH_TOKENS
+
+    def measure_segment(self, text: str) -> int:
+        return estimate_tokens(text)
+
+    def estimate_batch_calls(self, requests: list[TranslationRequest]) -> int:
+        return len(self._batch_groups(requests))
+
+    def _batch_groups(self, requests: list[TranslationRequest]) -> list[list[int]]:
+        return group_requests(
+            requests,
+            LLM_MAX_BATCH_TOKENS,
+            self.measure_segment,
+            max_items=LLM_MAX_BATCH_SEGMENTS,
+        )
+
+    def _batch_system_prompt(self, batch: list[TranslationRequest]) -> str:
+        return self._system_prompt(batch[0], _BATCH_SYSTEM_PROMPT)
+
+    def _batch_user_text(self, batch: list[TranslationRequest]) -> str:
+        segments = {str(i): request.text for i, request in enumerate(batch, 1)}
+        return json.dumps(segments, ensure_ascii=False)
+
+    def _parse_batch_content(
+        self, batch: list[TranslationRequest], content: str
+    ) -> list[Optional[TranslationResult]]:
+        try:
+            data = json.loads(_CODE_FENCE.sub("", content.strip()))
+        except ValueError:
+            return [None] * len(batch)
+
+        if isinstance(data, list) and len(data) == len(batch):
+            data = {str(i): value for i, value in enumerate(data, 1)}
+        if not isinstance(data, dict):
+            return [None] * len(batch)
+
+        replies: list[Optional[str]] = []
+        for i in range(1, len(batch) + 1):
+            translated = data.get(str(i))
+            if isinstance(translated, str) and translated.strip():
+                replies.append(translated.strip())
+            else:
+                replies.append(None)
+
+        suspects = self._merge_suspects(batch, replies)
+        return [
+            None if reply is None or i in suspects else self._success_result(request, reply)
+            for i, (request, reply) in enumerate(zip(batch, replies))
+        ]
+
+    @staticmethod
+    def _merge_suspects(batch: list[TranslationRequest], replies: list[Optional[str]]) -> set[int]:
+        ratios = {
+            i: len(reply) / len(request.text)
+            for i, (request, reply) in enumerate(zip(batch, replies))
+            if reply is not None and request.text
+        }
+        flagged = {i for i, reply in enumerate(replies) if reply is None}
+        if len(ratios) >= _MERGE_MIN_SEGMENTS:
+            typical = sorted(ratios.values())[len(ratios) // 2]
+            flagged.update(
+                i for i, ratio in ratios.items() if ratio > typical * _MERGE_LENGTH_RATIO
+            )
+        return {
+            neighbour
+            for i in flagged
+            for neighbour in (i - 1, i, i + 1)
+            if 0 <= neighbour < len(batch)
+        }
+
+    def _chat_url(self) -> str:
+        return f"{self._api_url}/chat/completions"
+
+    def _chat_headers(self) -> dict[str, str]:
+        return {
             "Authorization": f"Bearer {self._api_key}",
             "Content-Type": "application/json",
         }
+
+    def _chat_call(self, system: str, user_text: str, stream: bool = False) -> HttpCall:
+        return (
+            POST_STREAM if stream else "post",
+            self._chat_url(),
+            {
+                "json": self._chat_body(system, user_text, stream),
+                "headers": self._chat_headers(),
+                "timeout": self._timeout,
+            },
+        )
+
+    def _chat_body(self, system: str, user_text: str, stream: bool = False) -> dict:
         body = {
             "model": self._model_name,
             "messages": [
@@ -47,9 +203,11 @@ class LlmEngine(TranslationEngine):
             ],
             "temperature": 0.3,
         }
+        if stream:
+            body["stream"] = True
+        return body
 
-        response = self._client.post(url, json=body, headers=headers)
-
+    def _raise_for_status(self, response: httpx.Response) -> None:
         if response.status_code != 200:
             try:
                 detail = response.json().get("error", {}).get("message", response.text)
@@ -61,45 +219,45 @@ class LlmEngine(TranslationEngine):
                 response=response,
             )
 
+    def _parse_chat_response(self, response: httpx.Response) -> str:
+        self._raise_for_status(response)
         data = response.json()
         return data["choices"][0]["message"]["content"].strip()
 
-    def translate(self, request: TranslationRequest) -> TranslationResult:
-        if not self._api_url or not self._api_key or not self._model_name:
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error="LLM API 未配置（需要地址、密钥和模型名）",
-            )
+    @staticmethod
+    def _is_event_stream(response: httpx.Response) -> bool:
+        return response.headers.get("content-type", "").startswith("text/event-stream")
 
-        from_name = self._lang_name(request.from_lang)
-        to_name = self._lang_name(request.to_lang)
-        system = _SYSTEM_PROMPT.format(from_lang=from_name, to_lang=to_name)
+    @staticmethod
+    def _parse_stream_line(line: str) -> Optional[str]:
+        if not line.startswith("data:"):
+            return None
 
-        try:
-            translated = self._chat(system, request.text)
-        except httpx.HTTPError as exc:
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error=f"LLM 请求失败: {exc}",
+        payload = line[len("data:"):].strip()
+        if not payload or payload == _STREAM_DONE:
+            return None
+
+        choices = json.loads(payload).get("choices") or []
+        if not choices:
+            return None
+        return choices[0].get("delta", {}).get("content") or None
+
+    def _chat_error_result(
+        self, request: TranslationRequest, exc: Exception
+    ) -> TranslationResult:
+        if isinstance(exc, httpx.HTTPStatusError):
+            return self._error_result(
+                request,
+                f"LLM 请求失败: {exc}",
+                error_code=str(exc.response.status_code),
             )
-        except (KeyError, IndexError):
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error="LLM 返回数据格式异常",
+        if isinstance(exc, httpx.HTTPError):
+            return self._error_result(
+                request, f"LLM 请求失败: {exc}", error_code=NETWORK_ERROR_CODE
             )
+        return self._error_result(request, "LLM 返回数据格式异常")
 
+    def _success_result(self, request: TranslationRequest, translated: str) -> TranslationResult:
         return TranslationResult(
             source_text=request.text,
             translated_text=translated,
@@ -109,10 +267,7 @@ class LlmEngine(TranslationEngine):
             is_word=is_single_word(request.text),
         )
 
-    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
-        request = TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang)
-        result = self.translate(request)
-
+    def _to_word_result(self, word: str, result: TranslationResult) -> TranslationResult:
         if not result.success:
             return result
 
@@ -131,5 +286,138 @@ class LlmEngine(TranslationEngine):
             word_detail=detail,
         )
 
+    def _chat_flow(self, system: str, user_text: str) -> HttpFlow[str]:
+        response = yield self._chat_call(system, user_text)
+        return self._parse_chat_response(response)
+
+    def _chat_stream_flow(
+        self, system: str, user_text: str, on_partial: Callable[[str], None]
+    ) -> HttpFlow[str]:
+        response = yield self._chat_call(system, user_text, stream=True)
+        if response.status_code != 200 or not self._is_event_stream(response):
+            yield READ_BODY
+            translated = self._parse_chat_response(response)
+            on_partial(translated)
+            return translated
+
+        text = ""
+        while True:
+            line = yield NEXT_LINE
+            if line is None:
+                break
+            delta = self._parse_stream_line(line)
+            if delta:
+                text += delta
+                on_partial(text.lstrip())
+
+        return text.strip()
+
+    def _complete_flow(
+        self, request: TranslationRequest, chat: HttpFlow[str]
+    ) -> HttpFlow[TranslationResult]:
+        if not self._is_configured():
+            chat.close()
+            return self._error_result(request, "LLM API 未配置（需要地址、密钥和模型名）")
+
+        try:
+            translated = yield from chat
+        except (httpx.HTTPError, KeyError, IndexError, ValueError) as exc:
+            return self._chat_error_result(request, exc)
+
+        return self._success_result(request, translated)
+
+    def _translate_flow(self, request: TranslationRequest) -> HttpFlow[TranslationResult]:
+        chat = self._chat_flow(self._system_prompt(request), request.text)
+        return (yield from self._complete_flow(request, chat))
+
+    def _translate_stream_flow(
+        self, request: TranslationRequest, on_partial: Callable[[str], None]
+    ) -> HttpFlow[TranslationResult]:
+        chat = self._chat_stream_flow(self._system_prompt(request), request.text, on_partial)
+        return (yield from self._complete_flow(request, chat))
+
+    def _lookup_word_flow(
+        self, word: str, from_lang: str, to_lang: str
+    ) -> HttpFlow[TranslationResult]:
+        request = TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang)
+        result = yield from self._translate_flow(request)
+        return self._to_word_result(word, result)
+
+    def _translate_batch_flow(
+        self, requests: list[TranslationRequest]
+    ) -> HttpFlow[list[TranslationResult]]:
+        if not self._is_configured():
+            return [
+                self._error_result(r, "LLM API 未配置（需要地址、密钥和模型名）")
+                for r in requests
+            ]
+
+        results: list[Optional[TranslationResult]] = [None] * len(requests)
+
+        for group in self._batch_groups(requests):
+            batch = [requests[i] for i in group]
+            if len(batch) == 1:
+                group_results = [(yield from self._translate_flow(batch[0]))]
+            else:
+                try:
+                    content = yield from self._chat_flow(
+                        self._batch_system_prompt(batch), self._batch_user_text(batch)
+                    )
+                except (httpx.HTTPError, KeyError, IndexError, ValueError) as exc:
+                    group_results = [self._chat_error_result(r, exc) for r in batch]
+                else:
+                    group_results = []
+                    for request, result in zip(
+                        batch, self._parse_batch_content(batch, content)
+                    ):
+                        if result is None:
+                            result = yield from self._translate_flow(request)
+                        group_results.append(result)
+
+            for index, result in zip(group, group_results):
+                results[index] = result
+
+        return results
+
+
+class LlmEngine(_LlmProtocol, TranslationEngine):
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        model_name: str,
+        client: Optional[httpx.Client] = None,
+    ) -> None:
+        super().__init__(api_url, api_key, model_name)
+        self._owns_client = client is None
+        self._client = client or httpx.Client(timeout=self._timeout)
+
+    @property
+    def uses_request_hook(self) -> bool:
+        return True
+
+    def _run(self, flow: HttpFlow[T]) -> T:
+        return run_flow(self._client, flow, self._request_hook)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return True
+
+    def translate(self, request: TranslationRequest) -> TranslationResult:
+        return self._run(self._translate_flow(request))
+
+    def translate_stream(
+        self, request: TranslationRequest, on_partial: Callable[[str], None]
+    ) -> TranslationResult:
+        return self._run(self._translate_stream_flow(request, on_partial))
+
+    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
+        return self._run(self._lookup_word_flow(word, from_lang, to_lang))
+
+    def translate_batch(self, requests: list[TranslationRequest]) -> list[TranslationResult]:
+        return self._run(self._translate_batch_flow(requests))
+
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import csv
+import logging
+import sqlite3
+import threading
+import weakref
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.config.constants import DATA_DIR_NAME, LOCAL_DICTIONARY_FILE
+from src.translation.models import WordDetail
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS words ("
+    "key TEXT PRIMARY KEY, word TEXT NOT NULL, phonetic TEXT NOT NULL, "
+    "translation TEXT NOT NULL) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS lemmas ("
+    "form TEXT PRIMARY KEY, lemma TEXT NOT NULL) WITHOUT ROWID",
+)
+_INFLECTION_TYPES = frozenset("pdi3rts")
+_INSERT_BATCH_SIZE = 5000
+_MMAP_SIZE = 256 * 1024 * 1024
+_VOWELS = frozenset("aeiou")
+
+_open_dictionaries: weakref.WeakSet[LocalDictionary] = weakref.WeakSet()
+_open_dictionaries_lock = threading.Lock()
+
+
+def default_dictionary_path() -> Path:
+    return Path.home() / DATA_DIR_NAME / LOCAL_DICTIONARY_FILE
+
+
+def resolve_dictionary_path(configured: str) -> Path:
+    return Path(configured).expanduser() if configured else default_dictionary_path()
+
+
+def lemma_candidates(word: str) -> list[str]:
+    candidates: list[str] = []
+
+    def add(stem: str) -> None:
+        if len(stem) >= 2 and stem != word and stem not in candidates:
+            candidates.append(stem)
+
+    def add_stem(stem: str) -> None:
+        add(stem)
+        add(stem + "e")
+        if len(stem) >= 3 and stem[-1] == stem[-2] and stem[-1] not in _VOWELS:
+            add(stem[:-1])
+
+    if word.endswith("ies") or word.endswith("ied"):
+        add(word[:-3] + "y")
+    if word.endswith("ier"):
+        add(word[:-3] + "y")
+    if word.endswith("iest"):
+        add(word[:-4] + "y")
+    if word.endswith("es"):
+        add(word[:-2])
+    if word.endswith("s") and not word.endswith("ss"):
+        add(word[:-1])
+    for suffix in ("ing", "ed", "est", "er"):
+        if word.endswith(suffix):
+            add_stem(word[: -len(suffix)])
+    return candidates
+
+
+def _parse_exchange(exchange: str) -> Iterator[tuple[str, str]]:
+    for part in exchange.split("/"):
+        kind, _, value = part.partition(":")
+        if kind and value:
+            yield kind, value
+
+
+def _explains(translation: str) -> tuple[str, ...]:
+    lines = translation.replace("\\n", "\n").split("\n")
+    return tuple(line.strip() for line in lines if line.strip())
+
+
+def import_ecdict(csv_path: Path, db_path: Path) -> int:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    connection = sqlite3.connect(tmp_path)
+    try:
+        for statement in _SCHEMA:
+            connection.execute(statement)
+
+        count = 0
+        with csv_path.open(encoding="utf-8", newline="") as handle:
+            for rows in _batched(csv.DictReader(handle), _INSERT_BATCH_SIZE):
+                words, lemmas = _rows_to_records(rows)
+                connection.executemany(
+                    "INSERT OR IGNORE INTO words VALUES (?, ?, ?, ?)", words
+                )
+                connection.executemany(
+                    "INSERT OR IGNORE INTO lemmas VALUES (?, ?)", lemmas
+                )
+                count += len(words)
+
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+    _swap_into_place(tmp_path, db_path)
+    logger.info("Imported %d dictionary entries into %s", count, db_path)
+    return count
+
+
+def _swap_into_place(tmp_path: Path, db_path: Path) -> None:
+    target = db_path.resolve()
+    with _open_dictionaries_lock:
+        live = [d for d in _open_dictionaries if d.resolved_path == target]
+
+    with ExitStack() as stack:
+        for dictionary in live:
+            stack.enter_context(dictionary.reopened())
+        tmp_path.replace(db_path)
+
+
+def _batched(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _rows_to_records(
+    rows: list[dict],
+) -> tuple[list[tuple[str, str, str, str]], list[tuple[str, str]]]:
+    words = []
+    lemmas = []
+    for row in rows:
+        word = (row.get("word") or "").strip()
+        translation = "\n".join(_explains(row.get("translation") or ""))
+        if not word or not translation:
+            continue
+
+        key = word.lower()
+        words.append((key, word, (row.get("phonetic") or "").strip(), translation))
+
+        for kind, value in _parse_exchange(row.get("exchange") or ""):
+            if kind == "0":
+                lemmas.append((key, value.lower()))
+            elif kind in _INFLECTION_TYPES:
+                lemmas.append((value.lower(), key))
+    return words, lemmas
+
+
+class LocalDictionary:
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._resolved_path = db_path.resolve()
+        self._connection = self._connect()
+        self._lock = threading.Lock()
+        with _open_dictionaries_lock:
+            _open_dictionaries.add(self)
+
+    @property
+    def path(self) -> Path:
+        return self._db_path
+
+    @property
+    def resolved_path(self) -> Path:
+        return self._resolved_path
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            f"{self._resolved_path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        connection.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        return connection
+
+    @contextmanager
+    def reopened(self) -> Iterator[None]:
+        with self._lock:
+            self._connection.close()
+            try:
+                yield
+            finally:
+                self._connection = self._connect()
+
+    def lookup(self, word: str) -> Optional[WordDetail]:
+        key = word.strip().lower()
+        if not key:
+            return None
+
+        with self._lock:
+            row = self._find(key)
+            if row is None:
+                for candidate in self._lemmas(key):
+                    row = self._find(candidate)
+                    if row is not None:
+                        break
+
+        if row is None:
+            return None
+
+        headword, phonetic, translation = row
+        return WordDetail(
+            word=headword,
+            phonetic=phonetic,
+            explains=_explains(translation),
+        )
+
+    def _find(self, key: str) -> Optional[tuple[str, str, str]]:
+        return self._connection.execute(
+            "SELECT word, phonetic, translation FROM words WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _lemmas(self, key: str) -> list[str]:
+        row = self._connection.execute(
+            "SELECT lemma FROM lemmas WHERE form = ?", (key,)
+        ).fetchone()
+        known = [row[0]] if row is not None and row[0] != key else []
+        return known + [c for c in lemma_candidates(key) if c not in known]
+
+    def close(self) -> None:
+        with _open_dictionaries_lock:
+            _open_dictionaries.discard(self)
+        with self._lock:
+            self._connection.close()
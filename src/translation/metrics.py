@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.translation.models import TranslationResult
+
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+_SIZE_BUCKETS = (16, 64, 256, 1024, 4096, 16384)
+
+
+class Histogram:
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._maximum = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._total += value
+        self._maximum = max(self._maximum, value)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if self._count == 0:
+            return None
+
+        rank = percent / 100 * self._count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(self._bounds):
+                    return min(self._bounds[index], self._maximum)
+                return self._maximum
+        return self._maximum
+
+    def snapshot(self) -> dict:
+        labels = [f"<={bound:g}" for bound in self._bounds] + ["+Inf"]
+        return {
+            "count": self._count,
+            "sum": self._total,
+            "mean": self._total / self._count if self._count else None,
+            "max": self._maximum if self._count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, self._counts)),
+        }
+
+
+class _EngineStats:
+
+    def __init__(self) -> None:
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.latency = Histogram(_LATENCY_BUCKETS)
+        self.request_chars = Histogram(_SIZE_BUCKETS)
+        self.response_chars = Histogram(_SIZE_BUCKETS)
+        self.chars_translated = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "errors": dict(self.errors),
+            "error_count": sum(self.errors.values()),
+            "chars_translated": self.chars_translated,
+            "latency_seconds": self.latency.snapshot(),
+            "request_chars": self.request_chars.snapshot(),
+            "response_chars": self.response_chars.snapshot(),
+        }
+
+
+class MetricsRegistry:
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._engines: dict[str, _EngineStats] = {}
+        self._caches: dict[str, Counter[str]] = {}
+        self._started_at = clock()
+
+    def record_call(
+        self,
+        engine_name: str,
+        operation: str,
+        seconds: float,
+        request_chars: int,
+        results: list[TranslationResult],
+    ) -> None:
+        response_chars = sum(len(r.translated_text) for r in results)
+        translated_chars = sum(len(r.source_text) for r in results if r.success)
+
+        with self._lock:
+            stats = self._engines.get(engine_name)
+            if stats is None:
+                stats = _EngineStats()
+                self._engines[engine_name] = stats
+
+            stats.requests[operation] += 1
+            stats.latency.observe(seconds)
+            stats.request_chars.observe(request_chars)
+            stats.response_chars.observe(response_chars)
+            stats.chars_translated += translated_chars
+            for result in results:
+                if not result.success:
+                    stats.errors[result.error_code or "unknown"] += 1
+
+    def record_cache(self, cache_name: str, hits: int = 0, misses: int = 0) -> None:
+        if not hits and not misses:
+            return
+        with self._lock:
+            counter = self._caches.setdefault(cache_name, Counter())
+            counter["hits"] += hits
+            counter["misses"] += misses
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            engines = {name: stats.snapshot() for name, stats in self._engines.items()}
+            caches = {}
+            for name, counter in self._caches.items():
+                total = counter["hits"] + counter["misses"]
+                caches[name] = {
+                    "hits": counter["hits"],
+                    "misses": counter["misses"],
+                    "hit_rate": counter["hits"] / total if total else None,
+                }
+            started_at = self._started_at
+
+        return {
+            "started_at": started_at,
+            "captured_at": self._clock(),
+            "engines": engines,
+            "caches": caches,
+        }
+
+    def export(self, path: Path) -> None:
+        path.write_text(
+            json.dumps(self.snapshot(), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._engines = {}
+            self._caches = {}
+            self._started_at = self._clock()
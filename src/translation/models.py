@@ -34,6 +34,8 @@ class TranslationResult(BaseModel, frozen=True):
     is_word: bool = False
     word_detail: Optional[WordDetail] = None
     error: Optional[str] = None
+    error_code: Optional[str] = None
+    attempts: int = 1
 
     @property
     def success(self) -> bool:
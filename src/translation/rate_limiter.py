@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate_ratio: float = 0.1,
+        recovery_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("速率必须大于 0")
+        self._max_rate = rate
+        self._rate = rate
+        self._min_rate = rate * min_rate_ratio
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._recovery_per_second = rate / recovery_seconds
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def penalize(self) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = max(self._min_rate, self._rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed <= 0:
+            return
+
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        if self._rate < self._max_rate:
+            self._rate = min(self._max_rate, self._rate + elapsed * self._recovery_per_second)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from src.translation.models import TranslationRequest, TranslationResult
+
+
+class RetryPolicy:
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        time_budget: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self._max_attempts = max(1, max_attempts)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._time_budget = time_budget
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self._max_delay, self._base_delay * (2 ** (attempt - 1)))
+        return ceiling * self._jitter()
+
+    def run(
+        self,
+        call: Callable[[], TranslationResult],
+        is_retryable: Callable[[TranslationResult], bool],
+        cancelled: Optional[threading.Event] = None,
+    ) -> TranslationResult:
+        started = self._clock()
+        attempt = 1
+        result = call()
+
+        while (
+            not result.success
+            and is_retryable(result)
+            and self._wait(attempt, started, cancelled)
+        ):
+            attempt += 1
+            result = call()
+
+        return result.model_copy(update={"attempts": attempt})
+
+    def run_batch(
+        self,
+        call: Callable[[list[TranslationRequest]], list[TranslationResult]],
+        requests: list[TranslationRequest],
+        is_retryable: Callable[[TranslationResult], bool],
+    ) -> list[TranslationResult]:
+        started = self._clock()
+        attempt = 1
+        results = call(requests)
+        attempts = [1] * len(requests)
+
+        while True:
+            pending = [
+                i for i, r in enumerate(results) if not r.success and is_retryable(r)
+            ]
+            if not pending or not self._wait(attempt, started):
+                break
+
+            attempt += 1
+            retried = call([requests[i] for i in pending])
+            for index, result in zip(pending, retried):
+                results[index] = result
+                attempts[index] = attempt
+
+        return [
+            result.model_copy(update={"attempts": count})
+            for result, count in zip(results, attempts)
+        ]
+
+    def _wait(
+        self, attempt: int, started: float, cancelled: Optional[threading.Event] = None
+    ) -> bool:
+        if attempt >= self._max_attempts:
+            return False
+        if cancelled is not None and cancelled.is_set():
+            return False
+
+        delay = self.backoff(attempt)
+        if self._clock() - started + delay > self._time_budget:
+            return False
+
+        if cancelled is not None:
+            return not cancelled.wait(delay)
+        self._sleep(delay)
+        return True
@@ -3,11 +3,22 @@ from __future__ import annotations
 import hashlib
 import time
 import uuid
+from typing import Optional
 
 import httpx
 
-from src.config.constants import YOUDAO_API_URL, YOUDAO_LANGUAGE_CODES
+from src.config.constants import (
+    NETWORK_ERROR_CODE,
+    YOUDAO_API_URL,
+    YOUDAO_BATCH_API_URL,
+    YOUDAO_LANGUAGE_CODES,
+    YOUDAO_MAX_BATCH_CHARS,
+    YOUDAO_RATE_LIMIT_ERROR_CODES,
+    YOUDAO_RETRYABLE_ERROR_CODES,
+)
 from src.translation.base_engine import TranslationEngine
+from src.translation.batching import group_requests
+from src.translation.http_flow import HttpCall, HttpFlow, T, run_flow
 from src.translation.models import (
     TranslationRequest,
     TranslationResult,
@@ -17,13 +28,28 @@ from src.translation.models import (
 from src.utils.text_utils import is_single_word
 
 
-class YoudaoEngine(TranslationEngine):
+class _YoudaoProtocol:
+
+    _timeout = 10.0
 
-    def __init__(self, app_key: str, app_secret: str, api_url: str = YOUDAO_API_URL) -> None:
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        api_url: str,
+        batch_api_url: Optional[str] = None,
+    ) -> None:
         self._app_key = app_key
         self._app_secret = app_secret
         self._api_url = api_url
-        self._client = httpx.Client(timeout=10.0)
+        self._batch_api_url = batch_api_url or self._derive_batch_url(api_url)
+
+    @staticmethod
+    def _derive_batch_url(api_url: str) -> str:
+        if api_url == YOUDAO_API_URL:
+            return YOUDAO_BATCH_API_URL
+        base, _, tail = api_url.rstrip("/").rpartition("/")
+        return f"{base}/v2/{tail}" if base else YOUDAO_BATCH_API_URL
 
     @property
     def name(self) -> str:
@@ -42,22 +68,52 @@ class YoudaoEngine(TranslationEngine):
     def _map_lang_code(self, lang: str) -> str:
         return YOUDAO_LANGUAGE_CODES.get(lang, lang)
 
-    def translate(self, request: TranslationRequest) -> TranslationResult:
-        if not self._app_key or not self._app_secret:
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error="有道翻译 API 密钥未配置",
-            )
+    def _has_credentials(self) -> bool:
+        return bool(self._app_key and self._app_secret)
+
+    @property
+    def supports_word_detail_in_translate(self) -> bool:
+        return True
+
+    @property
+    def rate_limit_error_codes(self) -> frozenset[str]:
+        return YOUDAO_RATE_LIMIT_ERROR_CODES
+
+    @property
+    def retryable_error_codes(self) -> frozenset[str]:
+        return YOUDAO_RETRYABLE_ERROR_CODES
+
+    @property
+    def max_segment_size(self) -> int:
+        return YOUDAO_MAX_BATCH_CHARS
 
+    def estimate_batch_calls(self, requests: list[TranslationRequest]) -> int:
+        return len(group_requests(requests, YOUDAO_MAX_BATCH_CHARS))
+
+    def _error_result(
+        self,
+        request: TranslationRequest,
+        error: str,
+        is_word: bool = False,
+        error_code: Optional[str] = None,
+    ) -> TranslationResult:
+        return TranslationResult(
+            source_text=request.text,
+            translated_text="",
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            engine_name=self.name,
+            is_word=is_word,
+            error=error,
+            error_code=error_code,
+        )
+
+    def _build_data(self, request: TranslationRequest) -> dict[str, str]:
         salt = str(uuid.uuid4())
         cur_time = str(int(time.time()))
         sign = self._generate_sign(request.text, salt, cur_time)
 
-        data = {
+        return {
             "q": request.text,
             "from": self._map_lang_code(request.from_lang),
             "to": self._map_lang_code(request.to_lang),
@@ -68,64 +124,16 @@ class YoudaoEngine(TranslationEngine):
             "curtime": cur_time,
         }
 
-        try:
-            response = self._client.post(self._api_url, data=data)
-            response.raise_for_status()
-            result_data = response.json()
-        except httpx.HTTPError as exc:
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error=f"网络请求失败: {exc}",
-            )
-
-        error_code = result_data.get("errorCode")
-        if error_code and error_code != "0":
-            return TranslationResult(
-                source_text=request.text,
-                translated_text="",
-                from_lang=request.from_lang,
-                to_lang=request.to_lang,
-                engine_name=self.name,
-                error=f"有道API错误 {error_code}",
-            )
-
-        translation = result_data.get("translation", [])
-        translated_text = "\n".join(translation) if translation else ""
-
-        word_check = is_single_word(request.text)
-
-        return TranslationResult(
-            source_text=request.text,
-            translated_text=translated_text,
-            from_lang=request.from_lang,
-            to_lang=request.to_lang,
-            engine_name=self.name,
-            is_word=word_check,
-        )
-
-    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
-        if not self._app_key or not self._app_secret:
-            return TranslationResult(
-                source_text=word,
-                translated_text="",
-                from_lang=from_lang,
-                to_lang=to_lang,
-                engine_name=self.name,
-                error="有道翻译 API 密钥未配置",
-            )
-
+    def _build_batch_data(self, batch: list[TranslationRequest]) -> dict:
+        queries = [request.text for request in batch]
         salt = str(uuid.uuid4())
         cur_time = str(int(time.time()))
-        sign = self._generate_sign(word, salt, cur_time)
+        sign = self._generate_sign("".join(queries), salt, cur_time)
 
-        data = {
-            "q": word,
-            "from": self._map_lang_code(from_lang),
-            "to": self._map_lang_code(to_lang),
+        return {
+            "q": queries,
+            "from": self._map_lang_code(batch[0].from_lang),
+            "to": self._map_lang_code(batch[0].to_lang),
             "appKey": self._app_key,
             "salt": salt,
             "sign": sign,
@@ -133,36 +141,71 @@ class YoudaoEngine(TranslationEngine):
             "curtime": cur_time,
         }
 
-        try:
-            response = self._client.post(self._api_url, data=data)
-            response.raise_for_status()
-            result_data = response.json()
-        except httpx.HTTPError as exc:
-            return TranslationResult(
-                source_text=word,
-                translated_text="",
-                from_lang=from_lang,
-                to_lang=to_lang,
-                engine_name=self.name,
-                is_word=True,
-                error=f"网络请求失败: {exc}",
+    def _parse_batch_response(
+        self, batch: list[TranslationRequest], result_data: dict
+    ) -> list[Optional[TranslationResult]]:
+        error_code = result_data.get("errorCode")
+        if error_code and error_code != "0":
+            return [
+                self._error_result(r, f"有道API错误 {error_code}", error_code=str(error_code))
+                for r in batch
+            ]
+
+        translations = {
+            item.get("query", ""): item.get("translation", "")
+            for item in result_data.get("translateResults", [])
+        }
+
+        results: list[Optional[TranslationResult]] = []
+        for request in batch:
+            if request.text not in translations:
+                results.append(None)
+                continue
+            results.append(
+                TranslationResult(
+                    source_text=request.text,
+                    translated_text=translations[request.text],
+                    from_lang=request.from_lang,
+                    to_lang=request.to_lang,
+                    engine_name=self.name,
+                    is_word=is_single_word(request.text),
+                )
             )
 
+        return results
+
+    def _parse_translation(
+        self, request: TranslationRequest, result_data: dict, word_lookup: bool = False
+    ) -> TranslationResult:
         error_code = result_data.get("errorCode")
         if error_code and error_code != "0":
-            return TranslationResult(
-                source_text=word,
-                translated_text="",
-                from_lang=from_lang,
-                to_lang=to_lang,
-                engine_name=self.name,
-                is_word=True,
-                error=f"有道API错误 {error_code}",
+            return self._error_result(
+                request,
+                f"有道API错误 {error_code}",
+                is_word=word_lookup,
+                error_code=str(error_code),
             )
 
         translation = result_data.get("translation", [])
         translated_text = "\n".join(translation) if translation else ""
 
+        word_check = word_lookup or is_single_word(request.text)
+
+        word_detail = None
+        if word_lookup or (word_check and "basic" in result_data):
+            word_detail = self._parse_word_detail(request.text, result_data)
+
+        return TranslationResult(
+            source_text=request.text,
+            translated_text=translated_text,
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            engine_name=self.name,
+            is_word=word_check,
+            word_detail=word_detail,
+        )
+
+    def _parse_word_detail(self, word: str, result_data: dict) -> WordDetail:
         basic = result_data.get("basic", {})
         phonetic = basic.get("phonetic", "")
         uk_phonetic = basic.get("uk-phonetic", "")
@@ -177,7 +220,7 @@ class YoudaoEngine(TranslationEngine):
             if key and values:
                 examples.append(WordExample(source=key, target="; ".join(values)))
 
-        detail = WordDetail(
+        return WordDetail(
             word=word,
             phonetic=phonetic,
             uk_phonetic=uk_phonetic,
@@ -186,15 +229,109 @@ class YoudaoEngine(TranslationEngine):
             examples=tuple(examples),
         )
 
-        return TranslationResult(
-            source_text=word,
-            translated_text=translated_text,
-            from_lang=from_lang,
-            to_lang=to_lang,
-            engine_name=self.name,
-            is_word=True,
-            word_detail=detail,
-        )
+    def _post(self, url: str, data: dict) -> HttpCall:
+        return "post", url, {"data": data, "timeout": self._timeout}
+
+    def _network_error(
+        self,
+        requests: list[TranslationRequest],
+        exc: httpx.HTTPError,
+        is_word: bool = False,
+    ) -> list[TranslationResult]:
+        return [
+            self._error_result(
+                r, f"网络请求失败: {exc}", is_word=is_word, error_code=NETWORK_ERROR_CODE
+            )
+            for r in requests
+        ]
+
+    def _translate_flow(
+        self, request: TranslationRequest, word_lookup: bool = False
+    ) -> HttpFlow[TranslationResult]:
+        if not self._has_credentials():
+            return self._error_result(request, "有道翻译 API 密钥未配置")
+
+        try:
+            response = yield self._post(self._api_url, self._build_data(request))
+            response.raise_for_status()
+            result_data = response.json()
+        except httpx.HTTPError as exc:
+            return self._network_error([request], exc, is_word=word_lookup)[0]
+
+        return self._parse_translation(request, result_data, word_lookup=word_lookup)
+
+    def _lookup_word_flow(
+        self, word: str, from_lang: str, to_lang: str
+    ) -> HttpFlow[TranslationResult]:
+        request = TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang)
+        return (yield from self._translate_flow(request, word_lookup=True))
+
+    def _translate_batch_flow(
+        self, requests: list[TranslationRequest]
+    ) -> HttpFlow[list[TranslationResult]]:
+        if not self._has_credentials():
+            return [self._error_result(r, "有道翻译 API 密钥未配置") for r in requests]
+
+        results: list[Optional[TranslationResult]] = [None] * len(requests)
+
+        for group in group_requests(requests, YOUDAO_MAX_BATCH_CHARS):
+            batch = [requests[i] for i in group]
+            if len(batch) == 1:
+                group_results = [(yield from self._translate_flow(batch[0]))]
+            else:
+                try:
+                    response = yield self._post(
+                        self._batch_api_url, self._build_batch_data(batch)
+                    )
+                    response.raise_for_status()
+                    result_data = response.json()
+                except httpx.HTTPError as exc:
+                    group_results = self._network_error(batch, exc)
+                else:
+                    group_results = []
+                    for request, result in zip(
+                        batch, self._parse_batch_response(batch, result_data)
+                    ):
+                        if result is None:
+                            result = yield from self._translate_flow(request)
+                        group_results.append(result)
+
+            for index, result in zip(group, group_results):
+                results[index] = result
+
+        return results
+
+
+class YoudaoEngine(_YoudaoProtocol, TranslationEngine):
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        api_url: str = YOUDAO_API_URL,
+        batch_api_url: Optional[str] = None,
+        client: Optional[httpx.Client] = None,
+    ) -> None:
+        super().__init__(app_key, app_secret, api_url, batch_api_url)
+        self._owns_client = client is None
+        self._client = client or httpx.Client(timeout=self._timeout)
+
+    @property
+    def uses_request_hook(self) -> bool:
+        return True
+
+    def _run(self, flow: HttpFlow[T]) -> T:
+        return run_flow(self._client, flow, self._request_hook)
+
+    def translate(self, request: TranslationRequest) -> TranslationResult:
+        return self._run(self._translate_flow(request))
+
+    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
+        return self._run(self._lookup_word_flow(word, from_lang, to_lang))
+
+    def translate_batch(self, requests: list[TranslationRequest]) -> list[TranslationResult]:
+        return self._run(self._translate_batch_flow(requests))
 
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
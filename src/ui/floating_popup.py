@@ -35,6 +35,8 @@ class FloatingPopup(QWidget):
         self._auto_hide_timer.setSingleShot(True)
         self._auto_hide_timer.timeout.connect(self.hide)
 
+        self._streaming = False
+
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -88,10 +90,30 @@ class FloatingPopup(QWidget):
 
         self.adjustSize()
 
-        cursor_pos = QCursor.pos()
-        self.move(cursor_pos.x() + 20, cursor_pos.y() + 20)
+        if not self._streaming:
+            self._move_to_cursor()
+        self._streaming = False
 
         self.show()
         self.raise_()
 
         self._auto_hide_timer.start(5000)
+
+    def show_partial(self, source_text: str, partial_text: str) -> None:
+        self._auto_hide_timer.stop()
+
+        self._title_label.setText("翻译中...")
+        self._source_label.setText(f"原文: {source_text}")
+        self._result_label.setText(partial_text)
+
+        self.adjustSize()
+
+        if not self._streaming:
+            self._streaming = True
+            self._move_to_cursor()
+            self.show()
+            self.raise_()
+
+    def _move_to_cursor(self) -> None:
+        cursor_pos = QCursor.pos()
+        self.move(cursor_pos.x() + 20, cursor_pos.y() + 20)
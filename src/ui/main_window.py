@@ -13,6 +13,7 @@ from PyQt5.QtWidgets import (
 from src.history.repository import TranslationRepository
 from src.translation.engine_manager import EngineManager
 from src.ui.styles.theme import MAIN_WINDOW_STYLE
+from src.ui.widgets.diagnostics_dialog import DiagnosticsDialog
 from src.ui.widgets.file_translate_panel import FileTranslatePanel
 from src.ui.widgets.history_panel import HistoryPanel
 from src.ui.widgets.settings_dialog import SettingsDialog
@@ -48,7 +49,8 @@ class MainWindow(QMainWindow):
         self._tab_widget = QTabWidget()
 
         self._translation_panel = TranslationPanel(
-            translate_fn=self._engine_manager.translate
+            translate_fn=self._engine_manager.translate,
+            stream_fn=self._engine_manager.translate_stream,
         )
         self._tab_widget.addTab(self._translation_panel, "文本翻译")
 
@@ -79,6 +81,10 @@ class MainWindow(QMainWindow):
 
         help_menu = menubar.addMenu("帮助")
 
+        diagnostics_action = QAction("诊断信息", self)
+        diagnostics_action.triggered.connect(self._open_diagnostics)
+        help_menu.addAction(diagnostics_action)
+
         about_action = QAction("关于", self)
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
@@ -88,6 +94,10 @@ class MainWindow(QMainWindow):
         if dialog.exec_() == SettingsDialog.Accepted:
             self.settings_changed.emit()
 
+    def _open_diagnostics(self) -> None:
+        dialog = DiagnosticsDialog(self._engine_manager.metrics, self)
+        dialog.exec_()
+
     def _show_about(self) -> None:
         from PyQt5.QtWidgets import QMessageBox
 
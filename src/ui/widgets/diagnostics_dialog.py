@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from PyQt5.QtWidgets import (
+    QDialog,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from src.translation.metrics import MetricsRegistry
+
+_COLUMNS = ["引擎", "请求数", "错误数", "平均延迟", "P50", "P95", "P99", "翻译字符数", "错误码"]
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    return f"{value * 1000:.0f} ms"
+
+
+class DiagnosticsDialog(QDialog):
+
+    def __init__(self, metrics: MetricsRegistry, parent=None) -> None:
+        super().__init__(parent)
+
+        self._metrics = metrics
+
+        self.setWindowTitle("诊断信息")
+        self.setMinimumSize(760, 360)
+
+        self._init_ui()
+        self.refresh()
+
+    def _init_ui(self) -> None:
+        layout = QVBoxLayout(self)
+
+        self._table = QTableWidget(0, len(_COLUMNS))
+        self._table.setHorizontalHeaderLabels(_COLUMNS)
+        self._table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self._table)
+
+        self._cache_label = QLabel()
+        layout.addWidget(self._cache_label)
+
+        button_layout = QHBoxLayout()
+
+        refresh_btn = QPushButton("刷新")
+        refresh_btn.clicked.connect(self.refresh)
+        button_layout.addWidget(refresh_btn)
+
+        export_btn = QPushButton("导出...")
+        export_btn.clicked.connect(self._on_export_clicked)
+        button_layout.addWidget(export_btn)
+
+        reset_btn = QPushButton("重置")
+        reset_btn.clicked.connect(self._on_reset_clicked)
+        button_layout.addWidget(reset_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("关闭")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def refresh(self) -> None:
+        snapshot = self._metrics.snapshot()
+        engines = snapshot["engines"]
+
+        self._table.setRowCount(len(engines))
+        for row, (name, stats) in enumerate(sorted(engines.items())):
+            latency = stats["latency_seconds"]
+            errors = ", ".join(f"{code}×{count}" for code, count in stats["errors"].items())
+            values = [
+                name,
+                str(sum(stats["requests"].values())),
+                str(stats["error_count"]),
+                _format_seconds(latency["mean"]),
+                _format_seconds(latency["p50"]),
+                _format_seconds(latency["p95"]),
+                _format_seconds(latency["p99"]),
+                str(stats["chars_translated"]),
+                errors or "-",
+            ]
+            for column, value in enumerate(values):
+                self._table.setItem(row, column, QTableWidgetItem(value))
+
+        cache_parts = []
+        for name, cache in sorted(snapshot["caches"].items()):
+            rate = cache["hit_rate"]
+            rate_text = f"{rate:.0%}" if rate is not None else "-"
+            cache_parts.append(f"{name}: {cache['hits']}/{cache['hits'] + cache['misses']} ({rate_text})")
+        self._cache_label.setText("缓存命中: " + ("; ".join(cache_parts) or "暂无数据"))
+
+    def _on_export_clicked(self) -> None:
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "导出诊断数据",
+            "translation_metrics.json",
+            "JSON 文件 (*.json)",
+        )
+        if not file_path:
+            return
+
+        try:
+            self._metrics.export(Path(file_path))
+        except OSError as exc:
+            QMessageBox.critical(self, "错误", f"导出失败: {exc}")
+            return
+
+        QMessageBox.information(self, "成功", f"诊断数据已导出到:\n{file_path}")
+
+    def _on_reset_clicked(self) -> None:
+        self._metrics.reset()
+        self.refresh()
@@ -15,7 +15,9 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from src.config.settings import get_settings
 from src.file_parser.parser_factory import ParserFactory
+from src.history.file_job_journal import FileJobJournal
 from src.services.file_translation_service import FileTranslationService
 from src.translation.engine_manager import EngineManager
 from src.ui.widgets.language_selector import LanguageSelector
@@ -30,6 +32,7 @@ class FileTranslatePanel(QWidget):
         self._engine_manager = engine_manager
         self._thread_pool = QThreadPool.globalInstance()
         self._current_file_path = None
+        self._dedup_summary = ""
 
         self._init_ui()
 
@@ -112,9 +115,16 @@ class FileTranslatePanel(QWidget):
         self._progress_bar.setValue(0)
         self._result_text.clear()
 
-        service = FileTranslationService(self._engine_manager)
+        prefs = get_settings().preferences
+        service = FileTranslationService(
+            self._engine_manager,
+            prefs.file_translation_workers,
+            FileJobJournal() if prefs.file_job_resume_enabled else None,
+        )
 
+        self._dedup_summary = ""
         service.progress_updated.connect(self._on_progress_updated)
+        service.duplicates_saved.connect(self._on_duplicates_saved)
         service.translation_completed.connect(self._on_translation_completed)
         service.error_occurred.connect(self._on_error_occurred)
 
@@ -134,11 +144,15 @@ class FileTranslatePanel(QWidget):
         self._progress_bar.setMaximum(total)
         self._progress_bar.setValue(current)
 
+    def _on_duplicates_saved(self, segments: int, chars: int) -> None:
+        if segments:
+            self._dedup_summary = f"\n重复片段复用 {segments} 处，节省 {chars} 字符"
+
     def _on_translation_completed(self, translated_text: str) -> None:
         self._translate_btn.setEnabled(True)
         self._progress_bar.setVisible(False)
         self._result_text.setPlainText(translated_text)
-        QMessageBox.information(self, "完成", "文件翻译完成！")
+        QMessageBox.information(self, "完成", f"文件翻译完成！{self._dedup_summary}")
 
     def _on_error_occurred(self, error_msg: str) -> None:
         self._translate_btn.setEnabled(True)
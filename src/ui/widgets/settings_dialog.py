@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+from PyQt5.QtCore import QThreadPool
 from PyQt5.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
+    QFileDialog,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
@@ -15,7 +20,13 @@ from PyQt5.QtWidgets import (
 )
 
 from src.config.settings import AppSettings, get_settings, update_settings
+from src.translation.local_dictionary import (
+    default_dictionary_path,
+    import_ecdict,
+    resolve_dictionary_path,
+)
 from src.ui.widgets.language_selector import LanguageSelector
+from src.utils.async_worker import AsyncWorker
 
 
 class SettingsDialog(QDialog):
@@ -107,12 +118,29 @@ class SettingsDialog(QDialog):
         prefs_group.setLayout(prefs_layout)
         layout.addWidget(prefs_group)
 
-        buttons = QDialogButtonBox(
+        dictionary_group = QGroupBox("本地词典（离线单词查询）")
+        dictionary_layout = QFormLayout()
+
+        self._dictionary_enabled_checkbox = QCheckBox("单词优先使用本地词典")
+        dictionary_layout.addRow(self._dictionary_enabled_checkbox)
+
+        self._dictionary_path_input = QLineEdit()
+        self._dictionary_path_input.setPlaceholderText(str(default_dictionary_path()))
+        dictionary_layout.addRow("词典文件:", self._dictionary_path_input)
+
+        self._dictionary_import_btn = QPushButton("导入 ECDICT CSV...")
+        self._dictionary_import_btn.clicked.connect(self._on_import_dictionary)
+        dictionary_layout.addRow(self._dictionary_import_btn)
+
+        dictionary_group.setLayout(dictionary_layout)
+        layout.addWidget(dictionary_group)
+
+        self._buttons = QDialogButtonBox(
             QDialogButtonBox.Ok | QDialogButtonBox.Cancel
         )
-        buttons.accepted.connect(self._on_save)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        self._buttons.accepted.connect(self._on_save)
+        self._buttons.rejected.connect(self.reject)
+        layout.addWidget(self._buttons)
 
         self.setLayout(layout)
 
@@ -156,6 +184,42 @@ class SettingsDialog(QDialog):
         self._from_lang_selector.set_selected_code(settings.preferences.default_from_lang)
         self._to_lang_selector.set_selected_code(settings.preferences.default_to_lang)
         self._hotkey_input.setText(settings.preferences.hotkey)
+        self._dictionary_enabled_checkbox.setChecked(
+            settings.preferences.local_dictionary_enabled
+        )
+        self._dictionary_path_input.setText(settings.preferences.local_dictionary_path)
+
+    def _on_import_dictionary(self) -> None:
+        csv_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "选择 ECDICT 词典文件",
+            "",
+            "CSV 文件 (*.csv)",
+        )
+        if not csv_path:
+            return
+
+        db_path = resolve_dictionary_path(self._dictionary_path_input.text().strip())
+        self._set_importing(True)
+
+        worker = AsyncWorker(import_ecdict, Path(csv_path), db_path)
+        worker.signals.finished.connect(self._on_import_finished)
+        worker.signals.error.connect(self._on_import_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_import_finished(self, count: int) -> None:
+        self._set_importing(False)
+        self._dictionary_enabled_checkbox.setChecked(True)
+        QMessageBox.information(self, "成功", f"已导入 {count} 个词条，保存设置后生效。")
+
+    def _on_import_failed(self, exc: Exception) -> None:
+        self._set_importing(False)
+        QMessageBox.critical(self, "错误", f"导入词典失败: {exc}")
+
+    def _set_importing(self, importing: bool) -> None:
+        self._dictionary_import_btn.setEnabled(not importing)
+        self._dictionary_import_btn.setText("正在导入..." if importing else "导入 ECDICT CSV...")
+        self._buttons.setEnabled(not importing)
 
     def _on_save(self) -> None:
         try:
@@ -178,6 +242,8 @@ class SettingsDialog(QDialog):
                 default_from_lang=self._from_lang_selector.get_selected_code(),
                 default_to_lang=self._to_lang_selector.get_selected_code(),
                 hotkey=self._hotkey_input.text().strip(),
+                local_dictionary_enabled=self._dictionary_enabled_checkbox.isChecked(),
+                local_dictionary_path=self._dictionary_path_input.text().strip(),
             )
 
             update_settings(new_settings)
@@ -19,11 +19,13 @@ from src.utils.async_worker import AsyncWorker
 class TranslationPanel(QWidget):
     translation_requested = pyqtSignal(TranslationRequest)
     translation_completed = pyqtSignal(TranslationResult)
+    partial_received = pyqtSignal(str)
 
-    def __init__(self, translate_fn, parent=None) -> None:
+    def __init__(self, translate_fn, stream_fn=None, parent=None) -> None:
         super().__init__(parent)
 
         self._translate_fn = translate_fn
+        self._stream_fn = stream_fn
         self._thread_pool = QThreadPool.globalInstance()
 
         self._init_ui()
@@ -62,6 +64,8 @@ class TranslationPanel(QWidget):
 
         self.setLayout(layout)
 
+        self.partial_received.connect(self._output_text.setPlainText)
+
     def _on_translate_clicked(self) -> None:
         text = self._input_text.toPlainText().strip()
 
@@ -79,7 +83,11 @@ class TranslationPanel(QWidget):
 
         self.translation_requested.emit(request)
 
-        worker = AsyncWorker(self._translate_fn, request)
+        if self._stream_fn is not None:
+            self._output_text.clear()
+            worker = AsyncWorker(self._stream_fn, request, self.partial_received.emit)
+        else:
+            worker = AsyncWorker(self._translate_fn, request)
         worker.signals.finished.connect(self._on_translation_finished)
         worker.signals.error.connect(self._on_translation_error)
         self._thread_pool.start(worker)
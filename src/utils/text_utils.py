@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import re
+import unicodedata
+from typing import Callable, Iterable, Iterator
 
 from src.config.constants import MAX_TEXT_CHUNK_SIZE
 
+_HORIZONTAL_SPACE = re.compile(r"[ \t\u3000\xa0]+")
+_SENTENCE_END = re.compile(
+    r"(?:[。！？；…]+[」』”’）]*|[.!?;]+[\"'”’)\]]*(?=\s|$))\s*"
+)
+_SOFT_BREAK_BEFORE = re.compile(r"(?:[,\-–—(]|[，、（])$")
+_SOFT_BREAK_AFTER = re.compile(r"^[a-z]")
+_UNSPACED_JOIN = re.compile(r"(?:[\-，、（]|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff])$")
+_WIDE_CHAR = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]")
+
 
 def is_single_word(text: str) -> bool:
     stripped = text.strip()
@@ -16,31 +28,169 @@ def is_single_word(text: str) -> bool:
     return False
 
 
-def split_text_chunks(text: str, max_size: int = MAX_TEXT_CHUNK_SIZE) -> list[str]:
-    if len(text) <= max_size:
+def normalize_text(text: str) -> str:
+    normalized = unicodedata.normalize("NFC", text)
+    lines = (_HORIZONTAL_SPACE.sub(" ", line).strip() for line in normalized.split("\n"))
+    return "\n".join(lines).strip()
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    wide = len(_WIDE_CHAR.findall(text))
+    return wide + (len(text) - wide + 3) // 4
+
+
+def split_sentences(text: str) -> list[str]:
+    sentences: list[str] = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        if match.end() > start:
+            sentences.append(text[start:match.end()])
+            start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
+
+
+def split_paragraphs(text: str) -> list[str]:
+    paragraphs: list[str] = []
+    for line in text.split("\n"):
+        if paragraphs and _is_soft_break(paragraphs[-1], line):
+            previous = paragraphs[-1].rstrip()
+            joiner = "" if _UNSPACED_JOIN.search(previous) else " "
+            paragraphs[-1] = previous + joiner + line.lstrip()
+        else:
+            paragraphs.append(line)
+    return paragraphs
+
+
+def _is_soft_break(previous: str, line: str) -> bool:
+    previous = previous.rstrip()
+    line = line.lstrip()
+    if not previous or not line:
+        return False
+    return bool(_SOFT_BREAK_BEFORE.search(previous) or _SOFT_BREAK_AFTER.match(line))
+
+
+def segment_text(
+    text: str,
+    max_size: int = MAX_TEXT_CHUNK_SIZE,
+    size_fn: Callable[[str], int] = len,
+) -> list[str]:
+    if size_fn(text) <= max_size:
         return [text]
 
     chunks: list[str] = []
-    paragraphs = text.split("\n")
-    current_chunk = ""
-
-    for paragraph in paragraphs:
-        if len(current_chunk) + len(paragraph) + 1 > max_size:
-            if current_chunk:
-                chunks.append(current_chunk)
-            if len(paragraph) > max_size:
-                for i in range(0, len(paragraph), max_size):
-                    chunks.append(paragraph[i:i + max_size])
-                current_chunk = ""
-            else:
-                current_chunk = paragraph
+    current: list[str] = []
+    current_size = 0
+    newline_size = size_fn("\n")
+
+    for paragraph in text.split("\n"):
+        for position, unit in enumerate(_paragraph_units(paragraph, max_size, size_fn)):
+            separator = "\n" if position == 0 and current else ""
+            unit_size = size_fn(unit)
+            size = unit_size + (newline_size if separator else 0)
+
+            if current and current_size + size > max_size:
+                joined_size = size_fn("".join(current) + separator + unit)
+                if joined_size <= max_size:
+                    current.extend((separator, unit) if separator else (unit,))
+                    current_size = joined_size
+                    continue
+
+                chunks.append("".join(current))
+                current = [unit]
+                current_size = unit_size
+                continue
+
+            if separator:
+                current.append(separator)
+            current.append(unit)
+            current_size += size
+
+    if current:
+        chunks.append("".join(current))
+
+    return chunks
+
+
+def pack_segments(
+    segments: Iterable[str],
+    max_size: int = MAX_TEXT_CHUNK_SIZE,
+    size_fn: Callable[[str], int] = len,
+) -> Iterator[str]:
+    parts: list[str] = []
+    parts_size = 0
+    newline_size = size_fn("\n")
+
+    for segment in segments:
+        segment_size = size_fn(segment)
+        if segment_size <= max_size:
+            pieces = [(segment, segment_size)]
         else:
-            if current_chunk:
-                current_chunk += "\n" + paragraph
+            pieces = [(piece, size_fn(piece)) for piece in segment_text(segment, max_size, size_fn)]
+
+        for piece, piece_size in pieces:
+            if parts and parts_size + newline_size + piece_size > max_size:
+                joined_size = size_fn("\n".join(parts) + "\n" + piece)
+                if joined_size <= max_size:
+                    parts.append(piece)
+                    parts_size = joined_size
+                    continue
+
+                yield "\n".join(parts)
+                parts = []
+                parts_size = 0
+
+            parts_size += piece_size + (newline_size if parts else 0)
+            parts.append(piece)
+
+    if parts:
+        yield "\n".join(parts)
+
+
+def split_text_chunks(text: str, max_size: int = MAX_TEXT_CHUNK_SIZE) -> list[str]:
+    return segment_text(text, max_size)
+
+
+def _paragraph_units(
+    paragraph: str, max_size: int, size_fn: Callable[[str], int]
+) -> list[str]:
+    if size_fn(paragraph) <= max_size:
+        return [paragraph]
+
+    units: list[str] = []
+    for sentence in split_sentences(paragraph):
+        if size_fn(sentence) <= max_size:
+            units.append(sentence)
+        else:
+            units.extend(_hard_split(sentence, max_size, size_fn))
+    return units
+
+
+def _hard_split(text: str, max_size: int, size_fn: Callable[[str], int]) -> list[str]:
+    parts: list[str] = []
+    start = 0
+
+    while start < len(text):
+        low, high = 1, min(len(text) - start, max_size * 4)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if size_fn(text[start:start + middle]) <= max_size:
+                low = middle
             else:
-                current_chunk = paragraph
+                high = middle - 1
 
-    if current_chunk:
-        chunks.append(current_chunk)
+        end = start + low
+        if end < len(text):
+            space = text.rfind(" ", start, end)
+            if space > start + low // 2:
+                end = space + 1
 
-    return chunks
+        parts.append(text[start:end])
+        start = end
+
+    return parts
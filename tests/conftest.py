@@ -3,4 +3,17 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def test_db(tmp_path: Path):
+    from src.database.connection import init_database
+    from src.database.migrations import create_tables, drop_tables
+
+    init_database(tmp_path / "test.db")
+    create_tables()
+    yield
+    drop_tables()
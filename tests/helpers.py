@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.translation.base_engine import TranslationEngine
+from src.translation.models import TranslationRequest, TranslationResult
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StubEngine(TranslationEngine):
+
+    def __init__(
+        self,
+        name: str = "stub",
+        healthy: bool = True,
+        error_code: Optional[str] = None,
+        delay: float = 0.0,
+        transform: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        self._name = name
+        self.healthy = healthy
+        self.error_code = error_code
+        self.delay = delay
+        self.transform = transform or (lambda text: f"{name}:{text}")
+        self.fail_on: Optional[str] = None
+        self.gate: Optional[threading.Event] = None
+        self.calls = 0
+        self.texts: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def retryable_error_codes(self) -> frozenset[str]:
+        return frozenset({self.error_code}) if self.error_code else frozenset()
+
+    def translate(self, request: TranslationRequest) -> TranslationResult:
+        if self.fail_on is not None and request.text.startswith(self.fail_on):
+            raise ConnectionError("connection dropped")
+        with self._lock:
+            self.calls += 1
+            self.texts.append(request.text)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self.wait(request)
+        finally:
+            with self._lock:
+                self.active -= 1
+        return self.respond(request)
+
+    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
+        return self.translate(TranslationRequest(text=word, from_lang=from_lang, to_lang=to_lang))
+
+    def wait(self, request: TranslationRequest) -> None:
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if self.delay:
+            time.sleep(self.delay)
+
+    def respond(self, request: TranslationRequest) -> TranslationResult:
+        if self.healthy:
+            return self.result(request, self.transform(request.text))
+        return self.result(
+            request, "", error=f"{self._name} 不可用", error_code=self.error_code
+        )
+
+    def result(
+        self,
+        request: TranslationRequest,
+        translated_text: str,
+        error: Optional[str] = None,
+        error_code: Optional[str] = None,
+    ) -> TranslationResult:
+        return TranslationResult(
+            source_text=request.text,
+            translated_text=translated_text,
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            engine_name=self._name,
+            error=error,
+            error_code=error_code,
+        )
+
+
+def write_chunked_file(tmp_path: Path, count: int) -> Path:
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text("\n".join(f"{i}" + "x" * 4990 for i in range(count)), encoding="utf-8")
+    return file_path
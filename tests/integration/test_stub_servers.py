@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.run_benchmarks import create_engine, run_benchmark
+from benchmarks.stub_servers import STUB_HANDLERS, StubConfig, StubServer
+from src.translation.engine_manager import EngineManager
+from src.translation.models import TranslationRequest
+
+
+@pytest.fixture(params=sorted(STUB_HANDLERS))
+def stub_engine(request):
+    with StubServer(STUB_HANDLERS[request.param], StubConfig(latency=0.0)) as server:
+        engine = create_engine(request.param, server.url)
+        yield engine, server
+        engine.close()
+
+
+def test_stub_translate(stub_engine):
+    engine, _ = stub_engine
+
+    result = engine.translate(TranslationRequest(text="Hello world", from_lang="en", to_lang="zh"))
+
+    assert result.success
+    assert result.translated_text == "[译]Hello world"
+
+
+def test_stub_lookup_word(stub_engine):
+    engine, _ = stub_engine
+
+    result = engine.lookup_word("hello", "en", "zh")
+
+    assert result.success
+    assert "hello" in result.translated_text
+
+
+def test_stub_translate_batch(stub_engine):
+    engine, server = stub_engine
+    requests = [
+        TranslationRequest(text=f"Sentence {i}.", from_lang="en", to_lang="zh")
+        for i in range(3)
+    ]
+
+    results = engine.translate_batch(requests)
+
+    assert [r.translated_text for r in results] == [f"[译]Sentence {i}." for i in range(3)]
+    assert server.request_count == 1
+
+
+def test_stub_llm_translate_stream():
+    with StubServer(STUB_HANDLERS["llm"], StubConfig(latency=0.0)) as server:
+        engine = create_engine("llm", server.url)
+        partials: list[str] = []
+
+        result = engine.translate_stream(
+            TranslationRequest(text="Streaming text", from_lang="en", to_lang="zh"),
+            partials.append,
+        )
+        engine.close()
+
+    assert result.success
+    assert result.translated_text == "[译]Streaming text"
+    assert len(partials) > 1
+
+
+def test_stub_throttling_surfaces_rate_limit_error():
+    config = StubConfig(latency=0.0, qps=1)
+    with StubServer(STUB_HANDLERS["baidu"], config) as server:
+        engine = create_engine("baidu", server.url)
+        request = TranslationRequest(text="Hello", from_lang="en", to_lang="zh")
+
+        first = engine.translate(request)
+        second = engine.translate(request)
+        engine.close()
+
+    assert first.success
+    assert not second.success
+    assert second.error_code in engine.rate_limit_error_codes
+
+
+def test_run_benchmark_reports_counts():
+    row = run_benchmark("youdao", "text", StubConfig(latency=0.0), 5, 2, 1, 0.0)
+
+    assert row["operations"] == 5
+    assert row["http_requests"] == 5
+    assert row["errors"] == 0
+    assert row["p95"] is not None
+
+
+@pytest.mark.parametrize("engine_name", sorted(STUB_HANDLERS))
+def test_stub_adds_no_latency_of_its_own(engine_name):
+    row = run_benchmark(engine_name, "text", StubConfig(latency=0.0), 20, 1, 1, 0.0)
+
+    assert row["errors"] == 0
+    assert row["p50"] < 0.02
+
+
+def test_rate_limit_paces_every_batch_http_call():
+    with StubServer(STUB_HANDLERS["baidu"], StubConfig(latency=0.0, qps=8)) as server:
+        engine = create_engine("baidu", server.url)
+        manager = EngineManager()
+        manager.register_engine(engine)
+        manager.configure_rate_limits({"baidu": 4.0})
+        requests = [
+            TranslationRequest(text=f"{i} " + "x" * 4000, from_lang="en", to_lang="zh")
+            for i in range(10)
+        ]
+
+        results = manager.translate_batch(requests)
+        engine.close()
+        times = server.request_times
+
+    assert all(r.success for r in results)
+    assert len(times) == 10
+    assert all(
+        sum(1 for t in times if start <= t < start + 1.0) <= 8 for start in times
+    )
+    assert times[-1] - times[0] >= 1.2
@@ -122,3 +122,96 @@ def test_baidu_engine_lookup_word(mock_client_class):
     assert result.word_detail is not None
     assert result.word_detail.word == "apple"
     assert "苹果" in result.word_detail.explains
+
+
+@patch("src.translation.baidu_engine.httpx.Client")
+def test_baidu_engine_translate_batch_single_request(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "from": "en",
+        "to": "zh",
+        "trans_result": [
+            {"src": "hello", "dst": "你好"},
+            {"src": "good morning", "dst": "早上好"},
+            {"src": "world", "dst": "世界"},
+        ],
+    }
+    mock_client.get.return_value = mock_response
+
+    engine = BaiduEngine("test_id", "test_key")
+    requests = [
+        TranslationRequest(text="hello\n\ngood morning", from_lang="en", to_lang="zh"),
+        TranslationRequest(text="world", from_lang="en", to_lang="zh"),
+    ]
+
+    results = engine.translate_batch(requests)
+
+    assert mock_client.get.call_count == 1
+    sent_query = mock_client.get.call_args.kwargs["params"]["q"]
+    assert sent_query == "hello\ngood morning\nworld"
+    assert [r.translated_text for r in results] == ["你好\n\n早上好", "世界"]
+    assert results[0].source_text == "hello\n\ngood morning"
+
+
+@patch("src.translation.baidu_engine.httpx.Client")
+def test_baidu_engine_translate_batch_falls_back_on_mismatch(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+
+    batch_response = MagicMock()
+    batch_response.json.return_value = {
+        "trans_result": [{"src": "hello world", "dst": "你好世界"}],
+    }
+    single_response = MagicMock()
+    single_response.json.return_value = {
+        "trans_result": [{"src": "x", "dst": "译文"}],
+    }
+    mock_client.get.side_effect = [batch_response, single_response, single_response]
+
+    engine = BaiduEngine("test_id", "test_key")
+    requests = [
+        TranslationRequest(text="hello", from_lang="en", to_lang="zh"),
+        TranslationRequest(text="world", from_lang="en", to_lang="zh"),
+    ]
+
+    results = engine.translate_batch(requests)
+
+    assert mock_client.get.call_count == 3
+    assert all(r.translated_text == "译文" for r in results)
+
+
+def test_baidu_engine_translate_batch_missing_credentials():
+    engine = BaiduEngine("", "")
+    requests = [TranslationRequest(text="hello"), TranslationRequest(text="world")]
+
+    results = engine.translate_batch(requests)
+
+    assert len(results) == 2
+    assert all("密钥未配置" in r.error for r in results)
+
+
+@patch("src.translation.baidu_engine.httpx.Client")
+def test_baidu_engine_reports_error_code(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"error_code": "54003", "error_msg": "Invalid Access Limit"}
+    mock_client.get.return_value = mock_response
+
+    engine = BaiduEngine("test_id", "test_key")
+    result = engine.translate(TranslationRequest(text="hello", from_lang="en", to_lang="zh"))
+
+    assert result.error_code == "54003"
+    assert result.error_code in engine.rate_limit_error_codes
+
+
+def test_baidu_engine_measures_segments_in_bytes():
+    engine = BaiduEngine("id", "key")
+
+    assert engine.max_segment_size == 6000
+    assert engine.measure_segment("你好") == 6
+    assert engine.measure_segment("hi") == 2
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from src.translation.batching import group_requests
+from src.translation.models import TranslationRequest
+
+
+def test_group_requests_respects_size_limit():
+    requests = [TranslationRequest(text="a" * 4) for _ in range(5)]
+
+    groups = group_requests(requests, max_size=10)
+
+    assert groups == [[0, 1], [2, 3], [4]]
+
+
+def test_group_requests_separates_language_pairs():
+    requests = [
+        TranslationRequest(text="a", from_lang="en", to_lang="zh"),
+        TranslationRequest(text="b", from_lang="en", to_lang="jp"),
+        TranslationRequest(text="c", from_lang="en", to_lang="zh"),
+    ]
+
+    groups = group_requests(requests, max_size=100)
+
+    assert groups == [[0, 2], [1]]
+
+
+def test_group_requests_oversized_request_gets_own_group():
+    requests = [TranslationRequest(text="a" * 20), TranslationRequest(text="b")]
+
+    groups = group_requests(requests, max_size=10)
+
+    assert groups == [[0], [1]]
+
+
+def test_group_requests_respects_max_items():
+    requests = [TranslationRequest(text="a", from_lang="en", to_lang="zh") for _ in range(5)]
+
+    assert group_requests(requests, 100, max_items=2) == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import pytest
+
+from src.translation.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.translation.engine_manager import EngineManager
+from src.translation.models import TranslationRequest
+from tests.helpers import FakeClock, StubEngine
+
+
+def test_circuit_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=10, clock=FakeClock())
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.allow_request() is False
+
+
+def test_circuit_breaker_half_open_allows_single_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request() is True
+
+
+def test_circuit_breaker_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=10, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 10
+    breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    clock.now = 15
+    assert breaker.allow_request() is False
+
+
+def _manager(*engines: StubEngine) -> EngineManager:
+    manager = EngineManager()
+    for engine in engines:
+        manager.register_engine(engine)
+    manager.set_fallback_chain([engine.name for engine in engines])
+    return manager
+
+
+def test_engine_manager_fails_over_to_healthy_engine():
+    primary = StubEngine("baidu", healthy=False)
+    secondary = StubEngine("youdao", healthy=True)
+    manager = _manager(primary, secondary)
+
+    result = manager.translate(TranslationRequest(text="hello"))
+
+    assert result.success
+    assert result.engine_name == "youdao"
+
+
+def test_engine_manager_skips_open_circuit():
+    primary = StubEngine("baidu", healthy=False)
+    secondary = StubEngine("youdao", healthy=True)
+    manager = _manager(primary, secondary)
+    manager.configure_circuit_breakers(failure_threshold=2, cooldown_seconds=60)
+
+    for _ in range(5):
+        manager.translate(TranslationRequest(text="hello"))
+
+    assert primary.calls == 2
+    assert secondary.calls == 5
+    assert manager.engine_health()["baidu"] == OPEN
+
+
+def test_engine_manager_returns_primary_error_when_all_fail():
+    primary = StubEngine("baidu", healthy=False)
+    secondary = StubEngine("youdao", healthy=False)
+    manager = _manager(primary, secondary)
+
+    result = manager.translate(TranslationRequest(text="hello"))
+
+    assert not result.success
+    assert result.engine_name == "baidu"
+
+
+def test_engine_manager_batch_fails_over_failed_items():
+    primary = StubEngine("baidu", healthy=False)
+    secondary = StubEngine("youdao", healthy=True)
+    manager = _manager(primary, secondary)
+
+    results = manager.translate_batch(
+        [TranslationRequest(text="a"), TranslationRequest(text="b")]
+    )
+
+    assert [r.engine_name for r in results] == ["youdao", "youdao"]
+    assert all(r.success for r in results)
+
+
+def test_engine_manager_reports_unavailable_when_all_circuits_open():
+    primary = StubEngine("baidu", healthy=False)
+    manager = _manager(primary)
+    manager.configure_circuit_breakers(failure_threshold=1, cooldown_seconds=60)
+
+    manager.translate(TranslationRequest(text="hello"))
+    result = manager.translate(TranslationRequest(text="hello"))
+
+    assert primary.calls == 1
+    assert result.error_code == "circuit_open"
+
+
+def test_engine_manager_releases_probe_when_engine_raises():
+    engine = StubEngine("baidu", healthy=False)
+    manager = _manager(engine)
+    manager.configure_circuit_breakers(failure_threshold=1, cooldown_seconds=0)
+    manager.translate(TranslationRequest(text="first"))
+
+    engine.fail_on = ""
+    with pytest.raises(ConnectionError):
+        manager.translate(TranslationRequest(text="probe"))
+
+    engine.healthy = True
+    engine.fail_on = None
+    result = manager.translate(TranslationRequest(text="recovered"))
+
+    assert result.success
+    assert manager.engine_health()["baidu"] == CLOSED
+
+
+def test_engine_manager_batch_releases_probe_when_engine_raises():
+    engine = StubEngine("baidu", healthy=False)
+    manager = _manager(engine)
+    manager.configure_circuit_breakers(failure_threshold=1, cooldown_seconds=0)
+    batch = [TranslationRequest(text="a"), TranslationRequest(text="b")]
+    manager.translate_batch(batch)
+
+    engine.fail_on = ""
+    with pytest.raises(ConnectionError):
+        manager.translate_batch(batch)
+
+    engine.healthy = True
+    engine.fail_on = None
+    results = manager.translate_batch(batch)
+
+    assert all(r.success for r in results)
+    assert manager.engine_health()["baidu"] == CLOSED
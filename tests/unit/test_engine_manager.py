@@ -79,3 +79,29 @@ def test_engine_manager_lookup_word_delegates():
 
     assert result.engine_name == "baidu"
     assert result.is_word is True
+
+
+def test_engine_manager_translate_batch_generic_fallback():
+    manager = EngineManager()
+    manager.register_engine(BaiduEngine("", ""))
+
+    requests = [
+        TranslationRequest(text="hello", from_lang="en", to_lang="zh"),
+        TranslationRequest(text="world", from_lang="en", to_lang="zh"),
+    ]
+    results = manager.translate_batch(requests)
+
+    assert [r.source_text for r in results] == ["hello", "world"]
+    assert all(not r.success for r in results)
+
+
+def test_engine_manager_translate_stream_without_streaming_engine():
+    manager = EngineManager()
+    manager.register_engine(BaiduEngine("", ""))
+    partials = []
+
+    request = TranslationRequest(text="hello", from_lang="en", to_lang="zh")
+    result = manager.translate_stream(request, partials.append)
+
+    assert result.engine_name == "baidu"
+    assert partials == []
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.history.file_job_journal import FileJobJournal, FileJobKey, hash_file
+from src.services.file_translation_service import FileTranslationService
+from src.translation.base_engine import TranslationEngine
+from src.translation.engine_manager import EngineManager
+from tests.helpers import StubEngine, write_chunked_file
+
+
+def _flaky(fail_on: str | None = None) -> StubEngine:
+    engine = StubEngine("flaky", transform=str.upper)
+    engine.fail_on = fail_on
+    return engine
+
+
+def _job(file_hash: str = "a" * 64) -> FileJobKey:
+    return FileJobKey(file_hash=file_hash, from_lang="en", to_lang="zh", engine_name="baidu")
+
+
+def _translate(engine: TranslationEngine, journal: FileJobJournal, file_path: Path) -> list[str]:
+    manager = EngineManager()
+    manager.register_engine(engine)
+    service = FileTranslationService(manager, journal=journal)
+    output: list[str] = []
+    service.translation_completed.connect(output.append)
+    service.error_occurred.connect(output.append)
+    service.translate_file(file_path, "en", "zh")
+    return output
+
+
+def test_journal_record_load_and_discard(test_db):
+    journal = FileJobJournal()
+    job = _job()
+
+    journal.record(job, 0, "h0", "第一段")
+    journal.record(job, 1, "h1", "第二段")
+    journal.record(job, 1, "h1b", "第二段修订")
+
+    assert journal.load(job) == {0: ("h0", "第一段"), 1: ("h1b", "第二段修订")}
+    assert journal.load(_job("b" * 64)) == {}
+
+    assert journal.discard(job) == 2
+    assert journal.load(job) == {}
+
+
+def test_hash_file_depends_on_content(tmp_path: Path):
+    first = tmp_path / "a.txt"
+    second = tmp_path / "b.txt"
+    first.write_text("same", encoding="utf-8")
+    second.write_text("same", encoding="utf-8")
+
+    assert hash_file(first) == hash_file(second)
+
+    second.write_text("different", encoding="utf-8")
+    assert hash_file(first) != hash_file(second)
+
+
+def test_interrupted_job_resumes_from_checkpoint(test_db, tmp_path: Path):
+    journal = FileJobJournal()
+    file_path = write_chunked_file(tmp_path, 4)
+
+    first = _translate(_flaky("2"), journal, file_path)
+    assert first[0].startswith("文件翻译出错")
+
+    engine = _flaky()
+    second = _translate(engine, journal, file_path)
+
+    assert [text[0] for text in engine.texts] in (["2", "3"], ["2"])
+    assert [chunk[0] for chunk in second[0].split("\n\n")] == ["0", "1", "2", "3"]
+
+
+def test_completed_job_clears_journal(test_db, tmp_path: Path):
+    journal = FileJobJournal()
+    file_path = write_chunked_file(tmp_path, 2)
+
+    _translate(_flaky(), journal, file_path)
+
+    job = FileJobKey(
+        file_hash=hash_file(file_path), from_lang="en", to_lang="zh", engine_name="flaky"
+    )
+    assert journal.load(job) == {}
+
+
+def test_changed_file_is_not_resumed(test_db, tmp_path: Path):
+    journal = FileJobJournal()
+    file_path = write_chunked_file(tmp_path, 3)
+    _translate(_flaky("2"), journal, file_path)
+
+    file_path.write_text(file_path.read_text(encoding="utf-8") + "\nExtra.", encoding="utf-8")
+    engine = _flaky()
+    _translate(engine, journal, file_path)
+
+    assert [text[0] for text in engine.texts] == ["0", "1", "2", "E"]
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from src.file_parser.parser_factory import ParserFactory
-from src.file_parser.txt_parser import TxtParser
+from src.file_parser.txt_parser import TxtParser, detect_encoding
 
 
 def test_txt_parser_utf8(tmp_path: Path):
@@ -56,3 +56,116 @@ def test_parser_factory_is_supported(tmp_path: Path):
     assert ParserFactory.is_supported(docx_file) is True
     assert ParserFactory.is_supported(pdf_file) is True
     assert ParserFactory.is_supported(xyz_file) is False
+
+
+def test_txt_parser_iter_segments_splits_on_line_boundaries(tmp_path: Path):
+    lines = [f"第{i}行 line {i}" for i in range(20000)]
+    txt_file = tmp_path / "big.txt"
+    txt_file.write_text("\n".join(lines), encoding="utf-8")
+
+    segments = list(TxtParser().iter_segments(txt_file))
+
+    assert len(segments) > 1
+    assert "\n".join(segments).split("\n") == lines
+
+
+def test_txt_parser_iter_segments_matches_parse_for_gbk(tmp_path: Path):
+    txt_file = tmp_path / "gbk.txt"
+    txt_file.write_bytes("你好世界\n第二行".encode("gbk"))
+
+    parser = TxtParser()
+
+    assert "\n".join(parser.iter_segments(txt_file)) == parser.parse(txt_file)
+
+
+def test_txt_parser_empty_file(tmp_path: Path):
+    txt_file = tmp_path / "empty.txt"
+    txt_file.write_bytes(b"")
+
+    assert list(TxtParser().iter_segments(txt_file)) == []
+    assert TxtParser().parse(txt_file) == ""
+
+
+def test_txt_parser_utf8_bom_and_split_multibyte_characters(tmp_path: Path):
+    text = "\n".join("中文段落" * 50 for _ in range(2000))
+    txt_file = tmp_path / "bom.txt"
+    txt_file.write_bytes(text.encode("utf-8-sig"))
+
+    assert TxtParser().parse(txt_file) == text
+
+
+def test_detect_encoding_recognises_gbk():
+    assert detect_encoding("你好世界，欢迎使用翻译工具。".encode("gbk") * 20) == "gb18030"
+
+
+def test_txt_parser_redetects_encoding_after_long_ascii_prefix(tmp_path: Path):
+    ascii_lines = [f"INFO request {i} completed in 12ms" for i in range(40000)]
+    gbk_lines = ["错误：数据库连接失败", "警告：重试第 3 次"]
+    txt_file = tmp_path / "service.log"
+    txt_file.write_bytes("\n".join(ascii_lines + gbk_lines).encode("gbk"))
+    assert txt_file.stat().st_size > 1024 * 1024
+
+    parser = TxtParser()
+    content = parser.parse(txt_file)
+
+    assert content.split("\n")[-2:] == gbk_lines
+    assert "\n".join(parser.iter_segments(txt_file)) == content
+
+
+def test_txt_parser_marks_undecodable_bytes(tmp_path: Path):
+    txt_file = tmp_path / "broken.txt"
+    line = "你好世界，欢迎使用。\n".encode("utf-8")
+    txt_file.write_bytes(line * 40000 + b"\xff" + line * 10)
+
+    content = TxtParser().parse(txt_file)
+
+    assert content == "你好世界，欢迎使用。\n" * 40000 + "\ufffd" + "你好世界，欢迎使用。\n" * 10
+
+
+def test_txt_parser_caps_pending_text_for_very_long_lines(tmp_path: Path):
+    txt_file = tmp_path / "one_line.txt"
+    txt_file.write_text("a" * (3 * 1024 * 1024), encoding="utf-8")
+
+    segments = list(TxtParser().iter_segments(txt_file))
+
+    assert len(segments) >= 3
+    assert max(len(segment) for segment in segments) <= 1024 * 1024 + 64 * 1024
+    assert "".join(segments) == "a" * (3 * 1024 * 1024)
+
+
+def _write_pdf(path: Path, pages: int) -> None:
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        if i % 10 != 9:
+            page.insert_text((72, 72), f"Page {i} body text.")
+    doc.save(path)
+    doc.close()
+
+
+def test_pdf_parser_parallel_matches_serial(tmp_path: Path):
+    from src.file_parser.pdf_parser import PdfParser
+
+    pdf_file = tmp_path / "manual.pdf"
+    _write_pdf(pdf_file, 40)
+
+    serial = PdfParser(max_workers=1).parse(pdf_file)
+    parallel = list(
+        PdfParser(max_workers=2, parallel_min_pages=10, pages_per_task=3).iter_segments(pdf_file)
+    )
+
+    assert "\n".join(parallel) == serial
+    assert len(parallel) == 36
+    assert parallel[0].startswith("Page 0 ")
+    assert parallel[-1].startswith("Page 38 ")
+
+
+def test_pdf_parser_rejects_invalid_file(tmp_path: Path):
+    from src.file_parser.pdf_parser import PdfParser
+
+    pdf_file = tmp_path / "broken.pdf"
+    pdf_file.write_bytes(b"not a pdf")
+
+    with pytest.raises(ValueError):
+        PdfParser().parse(pdf_file)
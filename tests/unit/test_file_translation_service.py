@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+from PyQt5.QtCore import Qt
+
+from src.file_parser.base_parser import FileParser
+from src.services.file_translation_service import FileTranslationService
+from src.translation.engine_manager import EngineManager
+from src.translation.models import TranslationRequest, TranslationResult
+from tests.helpers import StubEngine, write_chunked_file
+
+
+class SlowEngine(StubEngine):
+
+    def __init__(self) -> None:
+        super().__init__("slow", transform=str.upper)
+
+    def wait(self, request: TranslationRequest) -> None:
+        time.sleep(0.05 if request.text.startswith("0") else 0.01)
+
+
+def _run(service: FileTranslationService, file_path: Path) -> tuple[list[str], list[tuple[int, int]]]:
+    completed: list[str] = []
+    progress: list[tuple[int, int]] = []
+    service.translation_completed.connect(completed.append)
+    service.progress_updated.connect(
+        lambda current, total: progress.append((current, total)), Qt.DirectConnection
+    )
+    service.error_occurred.connect(completed.append)
+    service.translate_file(file_path, "en", "zh")
+    return completed, progress
+
+
+def test_translate_file_sequential(tmp_path: Path):
+    engine = SlowEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    file_path = write_chunked_file(tmp_path, 3)
+
+    completed, progress = _run(FileTranslationService(manager), file_path)
+
+    assert engine.max_active == 1
+    assert progress[:2] == [(1, 0), (2, 0)]
+    assert progress[-1] == (3, 3)
+    assert completed[0].split("\n\n")[0].startswith("0X")
+
+
+def test_translate_file_concurrent_preserves_order(tmp_path: Path):
+    engine = SlowEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    file_path = write_chunked_file(tmp_path, 6)
+
+    service = FileTranslationService(manager, {"slow": 3})
+    completed, progress = _run(service, file_path)
+
+    chunks = completed[0].split("\n\n")
+    assert engine.max_active > 1
+    assert [chunk[0] for chunk in chunks] == [str(i) for i in range(6)]
+    assert [current for current, _ in progress[:6]] == list(range(1, 7))
+    assert progress[-1] == (6, 6)
+
+
+class BlockingFirstEngine(SlowEngine):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.released_by_progress = False
+
+    def wait(self, request: TranslationRequest) -> None:
+        if request.text.startswith("0"):
+            self.released_by_progress = self.release.wait(timeout=2)
+        super().wait(request)
+
+
+def test_translate_file_reports_progress_before_oldest_chunk_finishes(tmp_path: Path):
+    engine = BlockingFirstEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    file_path = write_chunked_file(tmp_path, 4)
+    service = FileTranslationService(manager, {"slow": 2})
+    service.progress_updated.connect(
+        lambda current, _: current == 3 and engine.release.set(), Qt.DirectConnection
+    )
+
+    completed, progress = _run(service, file_path)
+
+    assert engine.released_by_progress
+    assert [chunk[0] for chunk in completed[0].split("\n\n")] == ["0", "1", "2", "3"]
+    assert progress[-1] == (4, 4)
+
+
+class BatchRecordingEngine(SlowEngine):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def translate_batch(self, requests: list[TranslationRequest]) -> list[TranslationResult]:
+        self.batches.append([r.text for r in requests])
+        return [self.translate(r) for r in requests]
+
+
+def test_translate_file_batches_chunk_paragraphs(tmp_path: Path):
+    engine = BatchRecordingEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    file_path = tmp_path / "subs.txt"
+    file_path.write_text("hello\n\nworld\nagain", encoding="utf-8")
+
+    completed, _ = _run(FileTranslationService(manager), file_path)
+
+    assert engine.batches == [["hello", "world again"]]
+    assert completed == ["HELLO\n\nWORLD AGAIN"]
+
+
+def test_translate_file_sends_whole_paragraphs_without_memory(tmp_path: Path):
+    engine = BatchRecordingEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text(
+        "First point. Second point.\nThird point,\nwrapped here.\n  Indented.", encoding="utf-8"
+    )
+
+    completed, _ = _run(FileTranslationService(manager), file_path)
+
+    assert engine.batches == [
+        ["First point. Second point.", "Third point, wrapped here.", "Indented."]
+    ]
+    assert completed == ["FIRST POINT. SECOND POINT.\nTHIRD POINT, WRAPPED HERE.\n  INDENTED."]
+
+
+class CountingParser(FileParser):
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.yielded = 0
+
+    @property
+    def supported_extensions(self) -> set[str]:
+        return {".txt"}
+
+    def parse(self, file_path: Path) -> str:
+        return "\n".join(self.iter_segments(file_path))
+
+    def iter_segments(self, file_path: Path) -> Iterator[str]:
+        for i in range(self.count):
+            self.yielded += 1
+            yield f"{i}" + "x" * 4990
+
+
+def test_translate_file_streams_segments_with_backpressure(tmp_path: Path):
+    engine = SlowEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    parser = CountingParser(10)
+    yielded_at_first_progress: list[int] = []
+
+    service = FileTranslationService(manager, {"slow": 2})
+    service.progress_updated.connect(
+        lambda current, _: current == 1 and yielded_at_first_progress.append(parser.yielded),
+        Qt.DirectConnection,
+    )
+
+    with patch(
+        "src.services.file_translation_service.ParserFactory.get_parser",
+        return_value=parser,
+    ):
+        completed, progress = _run(service, tmp_path / "doc.txt")
+
+    chunks = completed[0].split("\n\n")
+    assert [chunk[0] for chunk in chunks] == [str(i) for i in range(10)]
+    assert yielded_at_first_progress[0] <= 5
+    assert all(total == 0 for _, total in progress[:6])
+    assert progress[-1] == (10, 10)
+
+
+def test_translate_file_reports_empty_content(tmp_path: Path):
+    manager = EngineManager()
+    manager.register_engine(SlowEngine())
+    file_path = tmp_path / "blank.txt"
+    file_path.write_text("  \n\n ", encoding="utf-8")
+
+    completed, _ = _run(FileTranslationService(manager), file_path)
+
+    assert completed == ["文件内容为空"]
+
+
+def test_translate_file_translates_repeated_segments_once(tmp_path: Path):
+    engine = BatchRecordingEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    file_path = tmp_path / "catalogue.txt"
+    file_path.write_text(
+        "\n".join(["Page header.", "Item one.", "Page  header.", "Item two.", "Page header."]),
+        encoding="utf-8",
+    )
+    saved: list[tuple[int, int]] = []
+    service = FileTranslationService(manager)
+    service.duplicates_saved.connect(lambda segments, chars: saved.append((segments, chars)))
+
+    completed, _ = _run(service, file_path)
+
+    assert engine.batches == [["Page header.", "Item one.", "Item two."]]
+    assert completed == ["PAGE HEADER.\nITEM ONE.\nPAGE HEADER.\nITEM TWO.\nPAGE HEADER."]
+    assert saved == [(2, len("Page  header.") + len("Page header."))]
+    assert manager.metrics.snapshot()["caches"]["file_dedup"]["hits"] == 2
+
+
+def test_translate_file_dedups_across_chunks(tmp_path: Path):
+    engine = BatchRecordingEngine()
+    manager = EngineManager()
+    manager.register_engine(engine)
+    file_path = tmp_path / "doc.txt"
+    footer = "Confidential footer."
+    file_path.write_text(
+        "\n".join(f"{i}" + "x" * 4970 + f"\n{footer}" for i in range(3)), encoding="utf-8"
+    )
+
+    service = FileTranslationService(manager, {"slow": 3})
+    completed, _ = _run(service, file_path)
+
+    sent = [text for batch in engine.batches for text in batch]
+    assert sent.count(footer) == 1
+    assert completed[0].count(footer.upper()) == 3
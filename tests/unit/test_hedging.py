@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import time
+
+from src.translation.engine_manager import EngineManager
+from src.translation.latency_window import LatencyWindow
+from src.translation.models import TranslationRequest
+from src.translation.retry_policy import RetryPolicy
+from tests.helpers import StubEngine
+
+
+def _delayed(name: str, delay: float, healthy: bool = True) -> StubEngine:
+    return StubEngine(name, healthy=healthy, error_code="network", delay=delay)
+
+
+def _manager(primary: StubEngine, secondary: StubEngine) -> EngineManager:
+    manager = EngineManager()
+    manager.register_engine(primary)
+    manager.register_engine(secondary)
+    manager.set_fallback_chain([primary.name, secondary.name])
+    manager.set_hedging(True)
+    return manager
+
+
+def _warm_up(
+    manager: EngineManager, engine: StubEngine, latency: float, samples: int = 20
+) -> None:
+    window = manager._latency_window(engine)
+    for _ in range(samples):
+        window.record(latency)
+
+
+def test_latency_window_percentile():
+    window = LatencyWindow(size=100, min_samples=5)
+    for value in range(1, 11):
+        window.record(value / 10)
+
+    assert window.percentile(90) == 0.9
+    assert window.percentile(50) == 0.5
+
+
+def test_latency_window_requires_min_samples():
+    window = LatencyWindow(min_samples=3)
+    window.record(1.0)
+
+    assert window.percentile(90) is None
+
+
+def test_hedged_request_uses_faster_secondary():
+    primary = _delayed("baidu", delay=1.0)
+    secondary = _delayed("youdao", delay=0.01)
+    manager = _manager(primary, secondary)
+    _warm_up(manager, primary, 0.05)
+
+    started = time.monotonic()
+    result = manager.translate(TranslationRequest(text="hello"), interactive=True)
+    elapsed = time.monotonic() - started
+
+    assert result.engine_name == "youdao"
+    assert elapsed < 0.9
+
+
+def test_fast_primary_is_not_hedged():
+    primary = _delayed("baidu", delay=0.01)
+    secondary = _delayed("youdao", delay=0.01)
+    manager = _manager(primary, secondary)
+    _warm_up(manager, primary, 0.5)
+
+    result = manager.translate(TranslationRequest(text="hello"), interactive=True)
+
+    assert result.engine_name == "baidu"
+    assert secondary.calls == 0
+
+
+def test_hedging_only_applies_to_interactive_requests():
+    primary = _delayed("baidu", delay=0.3)
+    secondary = _delayed("youdao", delay=0.01)
+    manager = _manager(primary, secondary)
+    _warm_up(manager, primary, 0.01)
+
+    result = manager.translate(TranslationRequest(text="hello"))
+
+    assert result.engine_name == "baidu"
+    assert secondary.calls == 0
+
+
+def test_failed_primary_falls_back_without_waiting():
+    primary = _delayed("baidu", delay=0.01, healthy=False)
+    secondary = _delayed("youdao", delay=0.01)
+    manager = _manager(primary, secondary)
+
+    result = manager.translate(TranslationRequest(text="hello"), interactive=True)
+
+    assert result.engine_name == "youdao"
+    assert secondary.calls == 1
+
+
+def test_repeated_hedges_stop_losing_attempts():
+    primary = _delayed("baidu", delay=0.3, healthy=False)
+    secondary = _delayed("youdao", delay=0.01)
+    manager = _manager(primary, secondary)
+    manager.set_retry_policy(RetryPolicy(max_attempts=4, base_delay=0.5, jitter=lambda: 1.0))
+    _warm_up(manager, primary, 0.05, samples=90)
+
+    for index in range(5):
+        started = time.monotonic()
+        result = manager.translate(TranslationRequest(text=f"hello {index}"), interactive=True)
+        elapsed = time.monotonic() - started
+
+        assert result.engine_name == "youdao"
+        assert elapsed < 0.3
+
+    time.sleep(0.5)
+    assert primary.calls == 5
+    assert manager._hedges_in_flight == 0
+
+
+def test_saturated_hedge_executor_skips_hedging():
+    primary = _delayed("baidu", delay=0.3)
+    secondary = _delayed("youdao", delay=0.01)
+    manager = _manager(primary, secondary)
+    _warm_up(manager, primary, 0.05)
+    assert manager._reserve_hedge_slots(3)
+
+    result = manager.translate(TranslationRequest(text="hello"), interactive=True)
+
+    assert result.engine_name == "baidu"
+    assert secondary.calls == 0
@@ -1,24 +1,9 @@
 from __future__ import annotations
 
-from pathlib import Path
-
-import pytest
-
-from src.database.connection import init_database
-from src.database.migrations import create_tables, drop_tables
 from src.history.repository import TranslationRepository
 from src.translation.models import TranslationResult, WordDetail
 
 
-@pytest.fixture
-def test_db(tmp_path: Path):
-    db_path = tmp_path / "test.db"
-    init_database(db_path)
-    create_tables()
-    yield
-    drop_tables()
-
-
 def test_create_from_result(test_db):
     repo = TranslationRepository()
 
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from src.translation.baidu_engine import BaiduEngine
+from src.translation.http_pool import HttpPool
+from tests.helpers import FakeClock
+
+
+@patch("src.translation.http_pool.httpx.Client")
+def test_http_pool_warm_targets_are_unique_origins(mock_client_class):
+    pool = HttpPool()
+
+    pool.set_warm_targets([
+        "https://fanyi-api.baidu.com/api/trans/vip/translate",
+        "https://fanyi-api.baidu.com/other",
+        "https://openapi.youdao.com/api",
+        "",
+    ])
+
+    assert pool.warm_targets == [
+        "https://fanyi-api.baidu.com",
+        "https://openapi.youdao.com",
+    ]
+
+
+@patch("src.translation.http_pool.httpx.Client")
+def test_http_pool_warm_up_connects_each_origin(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+    pool = HttpPool()
+    pool.set_warm_targets(["https://a.example.com/x", "https://b.example.com/y"])
+
+    pool.warm_up()
+
+    assert [c.args[0] for c in mock_client.head.call_args_list] == [
+        "https://a.example.com",
+        "https://b.example.com",
+    ]
+
+
+@patch("src.translation.http_pool.httpx.Client")
+def test_http_pool_idle_tracking(mock_client_class):
+    clock = FakeClock()
+    pool = HttpPool(keepalive_expiry=60.0, clock=clock)
+
+    assert pool.is_idle()
+
+    pool._touch(MagicMock())
+    clock.now = 30.0
+    assert not pool.is_idle()
+
+    clock.now = 61.0
+    assert pool.is_idle()
+
+
+@patch("src.translation.http_pool.http2_available", return_value=False)
+@patch("src.translation.http_pool.httpx.Client")
+def test_http_pool_falls_back_without_h2(mock_client_class, _):
+    pool = HttpPool(http2=True)
+
+    assert pool.http2 is False
+    assert mock_client_class.call_args.kwargs["http2"] is False
+
+
+def test_engine_does_not_close_shared_client():
+    shared = MagicMock()
+    engine = BaiduEngine("id", "key", client=shared)
+
+    engine.close()
+
+    shared.close.assert_not_called()
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+from src.translation.llm_engine import LlmEngine
+from src.translation.models import TranslationRequest
+
+
+def _sse(*deltas: str) -> list[str]:
+    lines = []
+    for delta in deltas:
+        chunk = {"choices": [{"delta": {"content": delta}}]}
+        lines.append(f"data: {json.dumps(chunk)}")
+        lines.append("")
+    lines.append("data: [DONE]")
+    return lines
+
+
+def _stream_response(status_code: int = 200, content_type: str = "text/event-stream"):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"content-type": content_type}
+    return response
+
+
+def _mock_stream(mock_client_class, response) -> MagicMock:
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+    mock_client.stream.return_value.__enter__.return_value = response
+    return mock_client
+
+
+def _engine() -> LlmEngine:
+    return LlmEngine("https://llm.example.com/v1", "key", "model")
+
+
+def _request() -> TranslationRequest:
+    return TranslationRequest(text="Hello world", from_lang="en", to_lang="zh")
+
+
+def test_llm_engine_parse_stream_line():
+    engine = _engine()
+
+    assert engine._parse_stream_line('data: {"choices": [{"delta": {"content": "你"}}]}') == "你"
+    assert engine._parse_stream_line("data: [DONE]") is None
+    assert engine._parse_stream_line(": keep-alive") is None
+    assert engine._parse_stream_line('data: {"choices": [{"delta": {"role": "assistant"}}]}') is None
+
+
+@patch("src.translation.llm_engine.httpx.Client")
+def test_llm_engine_translate_stream_emits_partials(mock_client_class):
+    response = _stream_response()
+    response.iter_lines.return_value = _sse("你好", "，", "世界")
+    mock_client = _mock_stream(mock_client_class, response)
+    partials = []
+
+    result = _engine().translate_stream(_request(), partials.append)
+
+    assert partials == ["你好", "你好，", "你好，世界"]
+    assert result.success
+    assert result.translated_text == "你好，世界"
+    assert mock_client.stream.call_args.kwargs["json"]["stream"] is True
+
+
+@patch("src.translation.llm_engine.httpx.Client")
+def test_llm_engine_translate_stream_handles_non_streaming_server(mock_client_class):
+    response = _stream_response(content_type="application/json")
+    response.json.return_value = {"choices": [{"message": {"content": "你好世界"}}]}
+    _mock_stream(mock_client_class, response)
+    partials = []
+
+    result = _engine().translate_stream(_request(), partials.append)
+
+    response.read.assert_called_once()
+    assert partials == ["你好世界"]
+    assert result.translated_text == "你好世界"
+
+
+@patch("src.translation.llm_engine.httpx.Client")
+def test_llm_engine_translate_stream_http_error(mock_client_class):
+    response = _stream_response(status_code=429, content_type="application/json")
+    response.json.return_value = {"error": {"message": "rate limited"}}
+    _mock_stream(mock_client_class, response)
+    partials = []
+
+    result = _engine().translate_stream(_request(), partials.append)
+
+    assert not result.success
+    assert result.error_code == "429"
+    assert partials == []
+
+
+def test_llm_engine_translate_stream_requires_config():
+    engine = LlmEngine("", "", "")
+
+    result = engine.translate_stream(_request(), lambda partial: None)
+
+    assert not result.success
+    assert "未配置" in result.error
+
+
+def _chat_response(content: str) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    return response
+
+
+@patch("src.translation.llm_engine.httpx.Client")
+def test_llm_engine_translate_batch_packs_segments(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+    mock_client.post.return_value = _chat_response('```json\n{"1": "一", "2": "二", "3": "三"}\n```')
+
+    requests = [
+        TranslationRequest(text=text, from_lang="en", to_lang="zh")
+        for text in ("one", "two", "three")
+    ]
+    results = _engine().translate_batch(requests)
+
+    assert [r.translated_text for r in results] == ["一", "二", "三"]
+    assert mock_client.post.call_count == 1
+    user_text = mock_client.post.call_args.kwargs["json"]["messages"][1]["content"]
+    assert json.loads(user_text) == {"1": "one", "2": "two", "3": "three"}
+
+
+@patch("src.translation.llm_engine.httpx.Client")
+def test_llm_engine_translate_batch_reruns_merged_segments(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+    mock_client.post.side_effect = [
+        _chat_response('{"1": "一二", "2": ""}'),
+        _chat_response("一"),
+        _chat_response("二"),
+    ]
+
+    requests = [
+        TranslationRequest(text=text, from_lang="en", to_lang="zh")
+        for text in ("one", "two")
+    ]
+    results = _engine().translate_batch(requests)
+
+    assert [r.translated_text for r in results] == ["一", "二"]
+    assert mock_client.post.call_count == 3
+
+
+@patch("src.translation.llm_engine.httpx.Client")
+def test_llm_engine_translate_batch_reruns_oversized_reply_and_neighbours(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+    mock_client.post.side_effect = [
+        _chat_response('{"1": "第一行", "2": "第二行", "3": "第三行第四行", "4": "第四行", "5": "第五行"}'),
+        _chat_response("第二行"),
+        _chat_response("第三行"),
+        _chat_response("第四行"),
+    ]
+
+    requests = [
+        TranslationRequest(text=text, from_lang="en", to_lang="zh")
+        for text in ("first", "second", "third", "fourth", "fifth")
+    ]
+    results = _engine().translate_batch(requests)
+
+    texts = [r.translated_text for r in results]
+    assert texts == ["第一行", "第二行", "第三行", "第四行", "第五行"]
+    assert mock_client.post.call_count == 4
+
+
+def test_llm_engine_estimate_batch_calls_respects_budget():
+    engine = _engine()
+    short = [
+        TranslationRequest(text=f"line {i}", from_lang="en", to_lang="zh")
+        for i in range(150)
+    ]
+    mixed = short[:2] + [TranslationRequest(text="hello", from_lang="en", to_lang="ja")]
+
+    assert engine.estimate_batch_calls(short) == 2
+    assert engine.estimate_batch_calls(mixed) == 2
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import csv
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config.constants import DICTIONARY_MISS_ERROR_CODE
+from src.translation.dictionary_engine import LocalDictionaryEngine
+from src.translation.local_dictionary import (
+    LocalDictionary,
+    import_ecdict,
+    lemma_candidates,
+    resolve_dictionary_path,
+)
+
+_FIELDS = ["word", "phonetic", "definition", "translation", "exchange"]
+_ROWS = [
+    ("run", "rʌn", "move fast", "v. 跑, 奔跑\\nn. 跑步", "p:ran/d:run/i:running/3:runs"),
+    ("apple", "'æpl", "fruit", "n. 苹果", "s:apples"),
+    ("study", "'stʌdi", "learn", "v. 学习\\nn. 研究", "p:studied/d:studied/3:studies"),
+    ("stop", "stɒp", "cease", "v. 停止", ""),
+    ("ghost", "", "", "", ""),
+]
+
+
+@pytest.fixture
+def dictionary_path(tmp_path: Path) -> Path:
+    csv_path = tmp_path / "ecdict.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(_FIELDS)
+        writer.writerows(_ROWS)
+
+    db_path = tmp_path / "dict" / "ecdict.db"
+    assert import_ecdict(csv_path, db_path) == 4
+    return db_path
+
+
+@pytest.fixture
+def dictionary(dictionary_path: Path):
+    store = LocalDictionary(dictionary_path)
+    yield store
+    store.close()
+
+
+def test_lookup_exact_word(dictionary):
+    detail = dictionary.lookup("Apple")
+
+    assert detail is not None
+    assert detail.word == "apple"
+    assert detail.phonetic == "'æpl"
+    assert detail.explains == ("n. 苹果",)
+
+
+def test_lookup_splits_escaped_newlines(dictionary):
+    detail = dictionary.lookup("run")
+
+    assert detail.explains == ("v. 跑, 奔跑", "n. 跑步")
+
+
+def test_lookup_uses_exchange_lemmas(dictionary):
+    assert dictionary.lookup("running").word == "run"
+    assert dictionary.lookup("ran").word == "run"
+    assert dictionary.lookup("studies").word == "study"
+
+
+def test_lookup_falls_back_to_suffix_rules(dictionary):
+    assert dictionary.lookup("stopped").word == "stop"
+    assert dictionary.lookup("stopping").word == "stop"
+
+
+def test_lookup_skips_entries_without_translation(dictionary):
+    assert dictionary.lookup("ghost") is None
+    assert dictionary.lookup("unknown") is None
+
+
+def test_lookup_is_fast(dictionary):
+    started = time.perf_counter()
+    for _ in range(100):
+        dictionary.lookup("running")
+    assert (time.perf_counter() - started) / 100 < 0.01
+
+
+def test_lemma_candidates():
+    assert "try" in lemma_candidates("tries")
+    assert "make" in lemma_candidates("making")
+    assert "big" in lemma_candidates("bigger")
+    assert lemma_candidates("class") == []
+
+
+def test_resolve_dictionary_path_defaults_to_data_dir(tmp_path: Path):
+    assert resolve_dictionary_path(str(tmp_path / "a.db")) == tmp_path / "a.db"
+    assert resolve_dictionary_path("").name == "ecdict.db"
+
+
+def test_engine_lookup_word_fills_word_detail(dictionary):
+    engine = LocalDictionaryEngine(dictionary)
+
+    result = engine.lookup_word("runs", "en", "zh")
+
+    assert result.success
+    assert result.is_word
+    assert result.source_text == "runs"
+    assert result.translated_text == "v. 跑, 奔跑\nn. 跑步"
+    assert result.word_detail.word == "run"
+
+
+def test_engine_reports_missing_word(dictionary):
+    engine = LocalDictionaryEngine(dictionary)
+
+    result = engine.lookup_word("zebra", "auto", "zh")
+
+    assert not result.success
+    assert result.error_code == DICTIONARY_MISS_ERROR_CODE
+
+
+def test_engine_rejects_unsupported_language_pair(dictionary):
+    engine = LocalDictionaryEngine(dictionary)
+
+    assert not engine.supports("apple", "en", "jp")
+    assert not engine.supports("苹果", "auto", "zh")
+    assert not engine.lookup_word("apple", "fra", "zh").success
+
+
+def test_import_reopens_live_dictionary(dictionary, dictionary_path: Path, tmp_path: Path):
+    csv_path = tmp_path / "update.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(_FIELDS)
+        writer.writerow(("banana", "bə'nɑːnə", "fruit", "n. 香蕉", ""))
+
+    assert dictionary.lookup("apple") is not None
+    assert import_ecdict(csv_path, dictionary_path) == 1
+
+    assert dictionary.lookup("apple") is None
+    assert dictionary.lookup("banana").explains == ("n. 香蕉",)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from src.utils.lru_cache import LruCache
+from tests.helpers import FakeClock
+
+
+def test_lru_cache_get_and_put():
+    cache = LruCache(max_size=2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LruCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_expires_entries():
+    clock = FakeClock()
+    cache = LruCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 5
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_zero_size_disables_caching():
+    cache = LruCache(max_size=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_lru_cache_clear():
+    cache = LruCache()
+    cache.put("a", 1)
+    cache.clear()
+
+    assert len(cache) == 0
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.translation.engine_manager import EngineManager
+from src.translation.metrics import Histogram, MetricsRegistry
+from src.translation.models import TranslationRequest, TranslationResult
+from tests.helpers import StubEngine
+
+
+class EchoEngine(StubEngine):
+
+    def __init__(self) -> None:
+        super().__init__("echo", transform=str.upper)
+
+    def respond(self, request: TranslationRequest) -> TranslationResult:
+        if request.text == "fail":
+            return self.result(request, "", error="boom", error_code="500")
+        return super().respond(request)
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    histogram = Histogram((0.1, 0.5, 1.0))
+    for value in (0.05, 0.05, 0.3, 0.8, 3.0):
+        histogram.observe(value)
+
+    assert histogram.percentile(50) == 0.5
+    assert histogram.percentile(99) == 3.0
+    assert histogram.snapshot()["buckets"] == {"<=0.1": 2, "<=0.5": 1, "<=1": 1, "+Inf": 1}
+
+
+def test_engine_manager_records_calls_and_errors():
+    manager = EngineManager()
+    manager.register_engine(EchoEngine())
+
+    manager.translate(TranslationRequest(text="hello", from_lang="en", to_lang="zh"))
+    manager.lookup_word("fail", "en", "zh")
+    manager.translate_batch([
+        TranslationRequest(text="a", from_lang="en", to_lang="zh"),
+        TranslationRequest(text="b", from_lang="en", to_lang="zh"),
+    ])
+
+    stats = manager.metrics.snapshot()["engines"]["echo"]
+    assert stats["requests"] == {"translate": 1, "lookup_word": 1, "translate_batch": 1}
+    assert stats["errors"] == {"500": 1}
+    assert stats["chars_translated"] == len("hello") + 2
+    assert stats["latency_seconds"]["count"] == 3
+
+
+def test_metrics_cache_hit_rate_and_export(tmp_path: Path):
+    metrics = MetricsRegistry()
+    metrics.record_cache("memory", hits=3, misses=1)
+
+    path = tmp_path / "metrics.json"
+    metrics.export(path)
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["caches"]["memory"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+
+    metrics.reset()
+    assert metrics.snapshot()["caches"] == {}
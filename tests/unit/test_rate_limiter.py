@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from src.translation.engine_manager import EngineManager
+from src.translation.models import TranslationRequest
+from src.translation.rate_limiter import TokenBucket
+from tests.helpers import FakeClock, StubEngine
+
+
+class ThrottledEngine(StubEngine):
+
+    def __init__(self, error_code: str | None) -> None:
+        super().__init__("throttled", healthy=False, error_code=error_code)
+
+    @property
+    def rate_limit_error_codes(self) -> frozenset[str]:
+        return frozenset({"54003"})
+
+
+def _bucket(rate: float, clock: FakeClock, **kwargs) -> TokenBucket:
+    return TokenBucket(rate, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_token_bucket_allows_burst_then_waits():
+    clock = FakeClock()
+    bucket = _bucket(2.0, clock)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = _bucket(1.0, clock)
+
+    bucket.acquire()
+    clock.now += 1.0
+
+    assert bucket.acquire() == 0
+
+
+def test_token_bucket_penalize_halves_rate_and_recovers():
+    clock = FakeClock()
+    bucket = _bucket(4.0, clock, recovery_seconds=10.0)
+
+    bucket.penalize()
+    assert bucket.rate == pytest.approx(2.0)
+
+    clock.now += 10.0
+    assert bucket.rate == pytest.approx(4.0)
+
+
+def test_token_bucket_rate_has_floor():
+    clock = FakeClock()
+    bucket = _bucket(1.0, clock, min_rate_ratio=0.25)
+
+    for _ in range(10):
+        bucket.penalize()
+
+    assert bucket.rate == pytest.approx(0.25)
+
+
+def test_token_bucket_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_engine_manager_penalizes_on_rate_limit_error():
+    manager = EngineManager()
+    manager.register_engine(ThrottledEngine("54003"))
+    manager.configure_rate_limits({"throttled": 100.0})
+
+    manager.translate(TranslationRequest(text="hello"))
+
+    assert manager._rate_limiters["throttled"].rate < 100.0
+
+
+def test_engine_manager_ignores_other_errors():
+    manager = EngineManager()
+    manager.register_engine(ThrottledEngine("52003"))
+    manager.configure_rate_limits({"throttled": 100.0})
+
+    manager.translate(TranslationRequest(text="hello"))
+
+    assert manager._rate_limiters["throttled"].rate == pytest.approx(100.0)
+
+
+def test_token_bucket_try_acquire_never_waits():
+    clock = FakeClock()
+    bucket = TokenBucket(1.0, capacity=1.0, clock=clock, sleep=clock.sleep)
+
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    clock.now += 1.0
+    assert bucket.try_acquire()
+    assert clock.sleeps == []
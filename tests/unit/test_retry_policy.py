@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from src.translation.engine_manager import EngineManager
+from src.translation.models import TranslationRequest, TranslationResult
+from src.translation.retry_policy import RetryPolicy
+from tests.helpers import FakeClock, StubEngine
+
+
+def _result(error_code: str | None = None) -> TranslationResult:
+    return TranslationResult(
+        source_text="hello",
+        translated_text="" if error_code else "你好",
+        from_lang="en",
+        to_lang="zh",
+        engine_name="baidu",
+        error="失败" if error_code else None,
+        error_code=error_code,
+    )
+
+
+def _policy(clock: FakeClock, **kwargs) -> RetryPolicy:
+    return RetryPolicy(clock=clock, sleep=clock.sleep, jitter=lambda: 1.0, **kwargs)
+
+
+def _retryable(result: TranslationResult) -> bool:
+    return result.error_code in {"52001", "network"}
+
+
+def test_retry_policy_retries_until_success():
+    clock = FakeClock()
+    outcomes = iter([_result("52001"), _result("network"), _result()])
+
+    result = _policy(clock).run(lambda: next(outcomes), _retryable)
+
+    assert result.success
+    assert result.attempts == 3
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_retry_policy_does_not_retry_permanent_errors():
+    clock = FakeClock()
+    calls = []
+
+    def call() -> TranslationResult:
+        calls.append(1)
+        return _result("54001")
+
+    result = _policy(clock).run(call, _retryable)
+
+    assert not result.success
+    assert result.attempts == 1
+    assert len(calls) == 1
+
+
+def test_retry_policy_respects_max_attempts():
+    clock = FakeClock()
+
+    result = _policy(clock, max_attempts=3).run(lambda: _result("52001"), _retryable)
+
+    assert result.attempts == 3
+    assert len(clock.sleeps) == 2
+
+
+def test_retry_policy_respects_time_budget():
+    clock = FakeClock()
+
+    result = _policy(clock, base_delay=4.0, max_delay=8.0, time_budget=10.0).run(
+        lambda: _result("52001"), _retryable
+    )
+
+    assert result.attempts == 2
+    assert clock.sleeps == [4.0]
+
+
+def test_retry_policy_backoff_is_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=lambda: 1.0)
+
+    assert [policy.backoff(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_retry_policy_batch_retries_only_failed_items():
+    clock = FakeClock()
+    requests = [TranslationRequest(text="a"), TranslationRequest(text="b")]
+    batches: list[list[str]] = []
+
+    def call(batch: list[TranslationRequest]) -> list[TranslationResult]:
+        batches.append([r.text for r in batch])
+        if len(batches) == 1:
+            return [_result(), _result("52001")]
+        return [_result() for _ in batch]
+
+    results = _policy(clock).run_batch(call, requests, _retryable)
+
+    assert batches == [["a", "b"], ["b"]]
+    assert [r.attempts for r in results] == [1, 2]
+    assert all(r.success for r in results)
+
+
+class FlakyEngine(StubEngine):
+
+    def __init__(self, failures: int) -> None:
+        super().__init__("flaky", error_code="network")
+        self.failures = failures
+
+    def respond(self, request: TranslationRequest) -> TranslationResult:
+        return _result("network" if self.calls <= self.failures else None)
+
+
+def test_engine_manager_applies_retry_policy():
+    clock = FakeClock()
+    engine = FlakyEngine(failures=2)
+    manager = EngineManager()
+    manager.register_engine(engine)
+    manager.set_retry_policy(_policy(clock))
+
+    result = manager.translate(TranslationRequest(text="hello"))
+
+    assert result.success
+    assert result.attempts == 3
+    assert engine.calls == 3
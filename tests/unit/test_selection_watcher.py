@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from src.clipboard.selection_watcher import SelectionWatcher, is_prefetch_candidate
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("hello", True),
+        ("The quick brown fox.", True),
+        ("你好世界", True),
+        ("", False),
+        ("   ", False),
+        ("12345", False),
+        ("https://example.com/page", False),
+        ("/usr/local/bin", False),
+        ("C:\\Windows\\system32", False),
+        ("a" * 600, False),
+    ],
+)
+def test_is_prefetch_candidate(text, expected):
+    assert is_prefetch_candidate(text, max_chars=500) == expected
+
+
+def test_watcher_ignores_clipboard_restored_by_selection_handler(qtbot):
+    watcher = SelectionWatcher(watch_primary=False, debounce_ms=10)
+    found: list[str] = []
+    watcher.candidate_found.connect(found.append)
+    watcher.start()
+    clipboard = QApplication.clipboard()
+
+    try:
+        clipboard.setText("selected words")
+        watcher.ignore("original words")
+        clipboard.setText("original words")
+        qtbot.wait(100)
+        assert found == []
+
+        clipboard.setText("copied later")
+        qtbot.wait(100)
+        clipboard.setText("original words")
+        qtbot.wait(100)
+        assert found == ["copied later", "original words"]
+    finally:
+        watcher.stop()
+
+
+def test_watcher_ignores_capture_copy_and_restore_together(qtbot):
+    watcher = SelectionWatcher(watch_primary=False, debounce_ms=50)
+    found: list[str] = []
+    watcher.candidate_found.connect(found.append)
+    watcher.start()
+    clipboard = QApplication.clipboard()
+
+    try:
+        clipboard.setText("selected words")
+        watcher.ignore("selected words")
+        qtbot.wait(100)
+        watcher.ignore("original words")
+        clipboard.setText("original words")
+        qtbot.wait(100)
+        assert found == []
+
+        clipboard.setText("another selection")
+        watcher.ignore("another selection")
+        watcher.ignore("original words")
+        clipboard.setText("original words")
+        qtbot.wait(100)
+        assert found == []
+
+        clipboard.setText("copied later")
+        qtbot.wait(100)
+        assert found == ["copied later"]
+    finally:
+        watcher.stop()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.translation.engine_manager import EngineManager
+from src.translation.models import TranslationRequest
+from src.translation.single_flight import SingleFlight
+from tests.helpers import StubEngine
+
+
+def _gated() -> StubEngine:
+    engine = StubEngine("gated", transform=lambda text: f"译:{text.strip()}")
+    engine.gate = threading.Event()
+    return engine
+
+
+def _wait_for_calls(engine: StubEngine, count: int) -> None:
+    for _ in range(500):
+        if engine.calls >= count:
+            return
+        threading.Event().wait(0.01)
+
+
+def test_single_flight_shares_result():
+    flights: SingleFlight[str, int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def work() -> int:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flights.run, "key", work)
+        started.wait(timeout=5)
+        follower = executor.submit(flights.run, "key", work)
+        release.set()
+
+        assert leader.result() == 42
+        assert follower.result() == 42
+
+    assert len(calls) == 1
+    assert len(flights) == 0
+
+
+def test_single_flight_propagates_errors():
+    flights: SingleFlight[str, int] = SingleFlight()
+    future, leader = flights.claim("key")
+    follower, is_leader = flights.claim("key")
+
+    flights.release("key", future, error=RuntimeError("boom"))
+
+    assert leader and not is_leader
+    with pytest.raises(RuntimeError):
+        follower.result()
+
+
+def test_engine_manager_coalesces_concurrent_translations():
+    engine = _gated()
+    manager = EngineManager()
+    manager.register_engine(engine)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(
+            manager.translate, TranslationRequest(text="hello world", from_lang="en", to_lang="zh")
+        )
+        _wait_for_calls(engine, 1)
+        second = executor.submit(
+            manager.translate, TranslationRequest(text=" hello  world ", from_lang="en", to_lang="zh")
+        )
+        threading.Event().wait(0.05)
+        engine.gate.set()
+
+        assert first.result().translated_text == "译:hello world"
+        assert second.result().source_text == " hello  world "
+
+    assert engine.texts == ["hello world"]
+
+
+def test_engine_manager_batch_deduplicates_segments():
+    engine = _gated()
+    engine.gate.set()
+    manager = EngineManager()
+    manager.register_engine(engine)
+
+    requests = [
+        TranslationRequest(text=text, from_lang="en", to_lang="zh")
+        for text in ("header", "body", "header")
+    ]
+    results = manager.translate_batch(requests)
+
+    assert [r.translated_text for r in results] == ["译:header", "译:body", "译:header"]
+    assert engine.texts == ["header", "body"]
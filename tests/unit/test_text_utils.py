@@ -2,7 +2,17 @@ from __future__ import annotations
 
 import pytest
 
-from src.utils.text_utils import is_single_word, split_text_chunks
+from src.utils.text_utils import (
+    estimate_tokens,
+    is_single_word,
+    normalize_text,
+    pack_segments,
+    segment_text,
+    split_paragraphs,
+    split_sentences,
+    split_text_chunks,
+    text_hash,
+)
 
 
 @pytest.mark.parametrize(
@@ -69,3 +79,123 @@ def test_split_text_chunks_empty():
 
     assert len(chunks) == 1
     assert chunks[0] == ""
+
+
+def test_normalize_text_collapses_horizontal_space():
+    assert normalize_text("  hello \t  world  \n  next\u3000line ") == "hello world\nnext line"
+
+
+def test_text_hash_ignores_layout_whitespace():
+    assert text_hash("hello  world") == text_hash(" hello world ")
+    assert text_hash("hello world") != text_hash("hello\nworld")
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hello world!") == 3
+    assert estimate_tokens("你好世界") == 4
+
+
+def test_split_sentences_keeps_text_intact():
+    text = "你好。今天天气很好！Hello there. How are you?  Fine"
+
+    sentences = split_sentences(text)
+
+    assert "".join(sentences) == text
+    assert sentences == ["你好。", "今天天气很好！", "Hello there. ", "How are you?  ", "Fine"]
+
+
+def test_split_sentences_ignores_decimal_points():
+    assert split_sentences("Pi is 3.14 exactly.") == ["Pi is 3.14 exactly."]
+
+
+def test_split_paragraphs_joins_soft_line_breaks():
+    text = "A sentence that\nwraps,\nContinues.\nNew line.\n\n中文句子，\n换行了。\nEnd-\nof-line"
+
+    assert split_paragraphs(text) == [
+        "A sentence that wraps, Continues.",
+        "New line.",
+        "",
+        "中文句子，换行了。",
+        "End-of-line",
+    ]
+
+
+def test_segment_text_uses_byte_budget():
+    text = "\n".join(["你好世界"] * 10)
+
+    chunks = segment_text(text, max_size=30, size_fn=lambda t: len(t.encode("utf-8")))
+
+    assert all(len(chunk.encode("utf-8")) <= 30 for chunk in chunks)
+    assert "\n".join(chunks) == text
+
+
+def test_segment_text_splits_long_paragraph_at_sentences():
+    text = "First sentence here. Second sentence here. Third one."
+
+    chunks = segment_text(text, max_size=25)
+
+    assert chunks == ["First sentence here. ", "Second sentence here. ", "Third one."]
+
+
+def test_segment_text_hard_split_prefers_spaces():
+    text = "word " * 20
+
+    chunks = segment_text(text, max_size=12)
+
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 12 for chunk in chunks)
+    assert all(chunk.endswith(" ") for chunk in chunks)
+
+
+def test_segment_text_fills_every_chunk_to_budget():
+    text = "\n".join(["x" * 100] * 200)
+
+    chunks = segment_text(text, max_size=5000)
+
+    assert len(chunks) == 5
+    assert [len(chunk) for chunk in chunks] == [4948, 4948, 4948, 4948, 403]
+    assert "\n".join(chunks) == text
+
+
+def test_segment_text_small_lines_pack_across_many_boundaries():
+    chunks = segment_text("\n".join(["abcd"] * 20), max_size=20)
+
+    assert chunks == ["abcd\nabcd\nabcd\nabcd"] * 5
+
+
+def test_segment_text_token_budget_measures_joined_chunk():
+    text = "\n".join(["hello world foo"] * 400)
+
+    chunks = segment_text(text, max_size=100, size_fn=estimate_tokens)
+
+    assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+    assert all(estimate_tokens(chunk) >= 95 for chunk in chunks[:-1])
+    assert len(chunks) == 16
+
+
+def test_pack_segments_merges_small_segments():
+    chunks = list(pack_segments(["aa", "bb", "cc", "dd"], max_size=5))
+
+    assert chunks == ["aa\nbb", "cc\ndd"]
+
+
+def test_pack_segments_splits_oversized_segment():
+    chunks = list(pack_segments(["a" * 3, "b" * 12], max_size=5))
+
+    assert all(len(chunk) <= 5 for chunk in chunks)
+    assert "".join(chunks).replace("\n", "") == "a" * 3 + "b" * 12
+
+
+def test_pack_segments_fills_chunks_across_many_segments():
+    chunks = list(pack_segments(("x" * 100 for _ in range(200)), max_size=5000))
+
+    assert [len(chunk) for chunk in chunks] == [4948, 4948, 4948, 4948, 403]
+
+
+def test_pack_segments_only_splits_oversized_segments():
+    chunks = list(pack_segments(["short", "y" * 12000, "tail"], max_size=5000))
+
+    assert chunks[0] == "short"
+    assert all(len(chunk) <= 5000 for chunk in chunks)
+    assert chunks[-1].endswith("\ntail")
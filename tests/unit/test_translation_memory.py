@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.database.connection import get_session
+from src.history.models import TranslationMemoryRecord
+from src.history.translation_memory import TranslationMemory
+from src.services.file_translation_service import FileTranslationService
+from src.translation.engine_manager import EngineManager
+from src.translation.models import (
+    TranslationRequest,
+    TranslationResult,
+    WordDetail,
+)
+from src.utils.text_utils import text_hash
+from tests.helpers import StubEngine
+
+
+class CountingEngine(StubEngine):
+
+    def __init__(self) -> None:
+        super().__init__("counting", transform=lambda text: f"译:{text}")
+
+    def lookup_word(self, word: str, from_lang: str, to_lang: str) -> TranslationResult:
+        result = super().lookup_word(word, from_lang, to_lang)
+        return result.model_copy(
+            update={"is_word": True, "word_detail": WordDetail(word=word, explains=(f"译:{word}",))}
+        )
+
+
+def _result(text: str, translated: str) -> TranslationResult:
+    return TranslationResult(
+        source_text=text,
+        translated_text=translated,
+        from_lang="en",
+        to_lang="zh",
+        engine_name="baidu",
+    )
+
+
+def test_memory_miss_then_hit(test_db):
+    memory = TranslationMemory()
+    request = TranslationRequest(text="hello world", from_lang="en", to_lang="zh")
+
+    assert memory.get("baidu", request) is None
+
+    memory.put("baidu", request, _result("hello world", "你好世界"))
+    cached = memory.get("baidu", request)
+
+    assert cached is not None
+    assert cached.translated_text == "你好世界"
+    assert cached.source_text == "hello world"
+
+
+def test_memory_key_uses_normalized_text(test_db):
+    memory = TranslationMemory()
+    memory.put(
+        "baidu",
+        TranslationRequest(text="hello   world", from_lang="en", to_lang="zh"),
+        _result("hello   world", "你好世界"),
+    )
+
+    cached = memory.get(
+        "baidu",
+        TranslationRequest(text="  hello world ", from_lang="en", to_lang="zh"),
+    )
+
+    assert cached is not None
+    assert cached.source_text == "  hello world "
+
+
+def test_memory_key_includes_engine_and_languages(test_db):
+    memory = TranslationMemory()
+    request = TranslationRequest(text="hello", from_lang="en", to_lang="zh")
+    memory.put("baidu", request, _result("hello", "你好"))
+
+    assert memory.get("youdao", request) is None
+    assert memory.get(
+        "baidu", TranslationRequest(text="hello", from_lang="en", to_lang="jp")
+    ) is None
+    assert memory.get("baidu", request, with_detail=True) is None
+
+
+def test_memory_ignores_failed_results(test_db):
+    memory = TranslationMemory()
+    request = TranslationRequest(text="hello", from_lang="en", to_lang="zh")
+    failed = TranslationResult(
+        source_text="hello",
+        translated_text="",
+        from_lang="en",
+        to_lang="zh",
+        engine_name="baidu",
+        error="网络请求失败",
+    )
+
+    memory.put("baidu", request, failed)
+
+    assert memory.count() == 0
+
+
+def test_memory_evicts_least_recently_used(test_db):
+    memory = TranslationMemory(max_entries=2)
+    first = TranslationRequest(text="one", from_lang="en", to_lang="zh")
+    second = TranslationRequest(text="two", from_lang="en", to_lang="zh")
+    third = TranslationRequest(text="three", from_lang="en", to_lang="zh")
+
+    memory.put("baidu", first, _result("one", "一"))
+    memory.put("baidu", second, _result("two", "二"))
+
+    session = get_session()
+    record = (
+        session.query(TranslationMemoryRecord)
+        .filter_by(text_hash=text_hash("one"))
+        .first()
+    )
+    record.last_used_at = datetime.utcnow() - timedelta(hours=1)
+    session.commit()
+    session.close()
+
+    memory.put("baidu", third, _result("three", "三"))
+
+    assert memory.count() == 2
+    assert memory.get("baidu", first) is None
+    assert memory.get("baidu", third) is not None
+
+
+def test_memory_expires_old_entries(test_db):
+    memory = TranslationMemory(max_age_days=1)
+    request = TranslationRequest(text="hello", from_lang="en", to_lang="zh")
+    memory.put("baidu", request, _result("hello", "你好"))
+
+    session = get_session()
+    record = session.query(TranslationMemoryRecord).first()
+    record.created_at = datetime.utcnow() - timedelta(days=2)
+    session.commit()
+    session.close()
+
+    assert memory.get("baidu", request) is None
+    assert memory.count() == 0
+
+
+def test_engine_manager_uses_memory(test_db):
+    engine = CountingEngine()
+    manager = EngineManager(TranslationMemory())
+    manager.register_engine(engine)
+
+    request = TranslationRequest(text="hello", from_lang="en", to_lang="zh")
+    first = manager.translate(request)
+    second = manager.translate(request)
+
+    assert engine.calls == 1
+    assert first.translated_text == second.translated_text
+
+
+def test_engine_manager_memory_keeps_word_detail(test_db):
+    engine = CountingEngine()
+    manager = EngineManager(TranslationMemory())
+    manager.register_engine(engine)
+
+    manager.lookup_word("apple", "en", "zh")
+    cached = manager.lookup_word("apple", "en", "zh")
+
+    assert engine.calls == 1
+    assert cached.word_detail is not None
+    assert cached.word_detail.word == "apple"
+
+
+def test_engine_manager_translate_batch_only_sends_misses(test_db):
+    engine = CountingEngine()
+    manager = EngineManager(TranslationMemory())
+    manager.register_engine(engine)
+
+    manager.translate(TranslationRequest(text="one", from_lang="en", to_lang="zh"))
+    results = manager.translate_batch(
+        [
+            TranslationRequest(text="one", from_lang="en", to_lang="zh"),
+            TranslationRequest(text="two", from_lang="en", to_lang="zh"),
+        ]
+    )
+
+    assert engine.calls == 2
+    assert [r.translated_text for r in results] == ["译:one", "译:two"]
+
+
+class DetailInTranslateEngine(CountingEngine):
+
+    @property
+    def supports_word_detail_in_translate(self) -> bool:
+        return True
+
+    def respond(self, request: TranslationRequest) -> TranslationResult:
+        return super().respond(request).model_copy(
+            update={"is_word": True, "word_detail": WordDetail(word=request.text)}
+        )
+
+
+def test_engine_manager_reuses_translate_detail_for_lookup(test_db):
+    engine = DetailInTranslateEngine()
+    manager = EngineManager(TranslationMemory())
+    manager.register_engine(engine)
+
+    manager.translate(TranslationRequest(text="apple", from_lang="en", to_lang="zh"))
+    result = manager.lookup_word("apple", "en", "zh")
+
+    assert engine.calls == 1
+    assert result.word_detail is not None
+
+
+def test_memory_get_many_and_put_many(test_db):
+    memory = TranslationMemory()
+    requests = [
+        TranslationRequest(text=text, from_lang="en", to_lang="zh")
+        for text in ("one", "two", "one")
+    ]
+
+    memory.put_many("baidu", [(requests[0], _result("one", "一"))])
+    cached = memory.get_many("baidu", requests)
+
+    assert [r.translated_text if r else None for r in cached] == ["一", None, "一"]
+    assert memory.count() == 1
+
+
+def test_file_translation_reuses_cached_sentences(test_db, tmp_path: Path):
+    engine = CountingEngine()
+    manager = EngineManager(TranslationMemory())
+    manager.register_engine(engine)
+    service = FileTranslationService(manager)
+    completed: list[str] = []
+    service.translation_completed.connect(completed.append)
+
+    original = tmp_path / "v1.txt"
+    original.write_text("Clause one applies. Clause two applies.\nSignature.", encoding="utf-8")
+    service.translate_file(original, "en", "zh")
+    calls_after_first = engine.calls
+
+    revised = tmp_path / "v2.txt"
+    revised.write_text("Clause one applies. Clause two changed.\nSignature.", encoding="utf-8")
+    service.translate_file(revised, "en", "zh")
+
+    assert calls_after_first == 3
+    assert engine.calls - calls_after_first == 1
+    assert completed[1] == "译:Clause one applies. 译:Clause two changed.\n译:Signature."
+
+
+def test_memory_hits_are_written_in_batches(test_db):
+    memory = TranslationMemory()
+    request = TranslationRequest(text="hello", from_lang="en", to_lang="zh")
+    memory.put("baidu", request, _result("hello", "你好"))
+
+    for _ in range(3):
+        assert memory.get("baidu", request) is not None
+    memory.get_many("baidu", [request])
+
+    session = get_session()
+    assert session.query(TranslationMemoryRecord).first().hit_count == 0
+    session.close()
+
+    memory.flush()
+
+    session = get_session()
+    assert session.query(TranslationMemoryRecord).first().hit_count == 4
+    session.close()
+
+
+def test_memory_eviction_leaves_headroom(test_db):
+    memory = TranslationMemory(max_entries=20)
+    for i in range(21):
+        request = TranslationRequest(text=f"entry {i}", from_lang="en", to_lang="zh")
+        memory.put("baidu", request, _result(request.text, f"条目 {i}"))
+
+    assert memory.count() == 18
+
+    for i in range(21, 23):
+        request = TranslationRequest(text=f"entry {i}", from_lang="en", to_lang="zh")
+        memory.put("baidu", request, _result(request.text, f"条目 {i}"))
+
+    assert memory.count() == 20
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+from src.services.translation_service import TranslationService
+from src.translation.models import TranslationResult, WordDetail
+from src.utils.lru_cache import LruCache
+
+
+def _word_result(word: str) -> TranslationResult:
+    return TranslationResult(
+        source_text=word,
+        translated_text="苹果",
+        from_lang="en",
+        to_lang="zh",
+        engine_name="youdao",
+        is_word=True,
+        word_detail=WordDetail(word=word, explains=("n. 苹果",)),
+    )
+
+
+def _make_manager() -> MagicMock:
+    manager = MagicMock()
+    manager.current_engine_name = "youdao"
+    manager.translate.return_value = TranslationResult(
+        source_text="apple",
+        translated_text="苹果",
+        from_lang="en",
+        to_lang="zh",
+        engine_name="youdao",
+        is_word=True,
+    )
+    manager.translate_stream.return_value = TranslationResult(
+        source_text="I like apples",
+        translated_text="我喜欢苹果",
+        from_lang="en",
+        to_lang="zh",
+        engine_name="llm",
+    )
+    manager.lookup_word.return_value = _word_result("apple")
+    return manager
+
+
+def test_translate_text_emits_and_saves_result():
+    manager = _make_manager()
+    repository = MagicMock()
+    service = TranslationService(manager, repository)
+    emitted = []
+    service.translation_completed.connect(emitted.append)
+
+    service.translate_text("apple", "en", "zh")
+
+    assert len(emitted) == 1
+    assert emitted[0].word_detail is not None
+    repository.create_from_result.assert_called_once()
+
+
+def test_translate_text_uses_result_cache():
+    manager = _make_manager()
+    repository = MagicMock()
+    service = TranslationService(manager, repository, LruCache(max_size=8))
+    emitted = []
+    service.translation_completed.connect(emitted.append)
+
+    service.translate_text("apple", "en", "zh")
+    service.translate_text(" apple ", "en", "zh")
+
+    assert manager.translate.call_count == 0
+    assert manager.lookup_word.call_count == 1
+    assert emitted[1].word_detail is not None
+    assert emitted[1].source_text == " apple "
+
+
+def test_translate_text_does_not_cache_failures():
+    manager = _make_manager()
+    manager.lookup_word.return_value = TranslationResult(
+        source_text="apple",
+        translated_text="",
+        from_lang="en",
+        to_lang="zh",
+        engine_name="youdao",
+        error="网络请求失败",
+    )
+    service = TranslationService(manager, MagicMock(), LruCache(max_size=8))
+
+    service.translate_text("apple", "en", "zh")
+    service.translate_text("apple", "en", "zh")
+
+    assert manager.lookup_word.call_count == 2
+
+
+def test_translate_text_single_word_uses_one_call():
+    manager = _make_manager()
+    service = TranslationService(manager, MagicMock())
+
+    service.translate_text("apple", "en", "zh")
+
+    manager.lookup_word.assert_called_once_with("apple", "en", "zh", interactive=True)
+    manager.translate.assert_not_called()
+
+
+def test_translate_text_sentence_skips_word_lookup():
+    manager = _make_manager()
+    service = TranslationService(manager, MagicMock())
+
+    service.translate_text("I like apples", "en", "zh")
+
+    manager.translate_stream.assert_called_once()
+    manager.lookup_word.assert_not_called()
+
+
+def test_translate_text_forwards_partial_results():
+    manager = _make_manager()
+
+    def stream(request, on_partial, interactive=False):
+        on_partial("我喜欢")
+        on_partial("我喜欢苹果")
+        return manager.translate_stream.return_value
+
+    manager.translate_stream.side_effect = stream
+    repository = MagicMock()
+    service = TranslationService(manager, repository)
+    partials = []
+    service.translation_partial.connect(lambda source, text: partials.append((source, text)))
+
+    service.translate_text("I like apples", "en", "zh")
+
+    assert partials == [("I like apples", "我喜欢"), ("I like apples", "我喜欢苹果")]
+    saved = repository.create_from_result.call_args[0][0]
+    assert saved.translated_text == "我喜欢苹果"
+
+
+def test_prefetch_fills_cache_for_later_hotkey():
+    manager = _make_manager()
+    service = TranslationService(manager, MagicMock(), LruCache(max_size=8))
+
+    assert service.prefetch("I like apples", "en", "zh")
+    service._prefetch_executor.shutdown(wait=True)
+    service.translate_text("I like apples", "en", "zh")
+
+    manager.translate.assert_called_once()
+    manager.translate_stream.assert_not_called()
+
+
+def test_translate_text_joins_inflight_prefetch():
+    manager = _make_manager()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_translate(request, interactive=False):
+        started.set()
+        release.wait(timeout=5)
+        return manager.translate_stream.return_value
+
+    manager.translate.side_effect = slow_translate
+    service = TranslationService(manager, MagicMock(), LruCache(max_size=8))
+    emitted = []
+    service.translation_completed.connect(emitted.append)
+
+    service.prefetch("I like apples", "en", "zh")
+    started.wait(timeout=5)
+    threading.Timer(0.05, release.set).start()
+    service.translate_text("I like apples", "en", "zh")
+
+    assert manager.translate.call_count == 1
+    manager.translate_stream.assert_not_called()
+    assert emitted[0].translated_text == "我喜欢苹果"
+
+
+def test_prefetch_respects_budget_and_skips_cached():
+    manager = _make_manager()
+    budget = MagicMock()
+    budget.try_acquire.return_value = False
+    service = TranslationService(manager, MagicMock(), LruCache(max_size=8), budget)
+
+    assert not service.prefetch("I like apples", "en", "zh")
+
+    budget.try_acquire.return_value = True
+    service.translate_text("apple", "en", "zh")
+    assert not service.prefetch("apple", "en", "zh")
+    manager.translate.assert_not_called()
+
+
+def test_translate_text_prefers_local_dictionary():
+    manager = _make_manager()
+    dictionary = MagicMock()
+    dictionary.supports.return_value = True
+    dictionary.lookup_word.return_value = _word_result("apple").model_copy(
+        update={"engine_name": "dictionary"}
+    )
+    service = TranslationService(manager, MagicMock(), dictionary=dictionary)
+    emitted = []
+    service.translation_completed.connect(emitted.append)
+
+    service.translate_text("apple", "en", "zh")
+
+    assert emitted[0].engine_name == "dictionary"
+    manager.lookup_word.assert_not_called()
+
+
+def test_translate_text_falls_back_when_dictionary_misses():
+    manager = _make_manager()
+    dictionary = MagicMock()
+    dictionary.supports.return_value = True
+    dictionary.lookup_word.return_value = TranslationResult(
+        source_text="apple",
+        translated_text="",
+        from_lang="en",
+        to_lang="zh",
+        engine_name="dictionary",
+        is_word=True,
+        error="本地词典未收录: apple",
+        error_code="not_found",
+    )
+    service = TranslationService(manager, MagicMock(), dictionary=dictionary)
+    emitted = []
+    service.translation_completed.connect(emitted.append)
+
+    service.translate_text("apple", "en", "zh")
+
+    assert emitted[0].engine_name == "youdao"
+    manager.lookup_word.assert_called_once()
+
+
+def test_set_dictionary_closes_previous():
+    service = TranslationService(_make_manager(), MagicMock(), dictionary=MagicMock())
+    previous = service._dictionary
+
+    service.set_dictionary(None)
+
+    previous.close.assert_called_once()
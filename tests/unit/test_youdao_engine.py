@@ -128,3 +128,55 @@ def test_youdao_engine_lookup_word(mock_client_class):
     assert result.word_detail.phonetic == "ˈæpl"
     assert len(result.word_detail.explains) == 2
     assert len(result.word_detail.examples) == 1
+
+
+@patch("src.translation.youdao_engine.httpx.Client")
+def test_youdao_engine_translate_batch(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "errorCode": "0",
+        "translateResults": [
+            {"query": "hello", "translation": "你好"},
+            {"query": "world", "translation": "世界"},
+        ],
+    }
+    mock_client.post.return_value = mock_response
+
+    engine = YoudaoEngine("test_key", "test_secret")
+    requests = [
+        TranslationRequest(text="hello", from_lang="en", to_lang="zh"),
+        TranslationRequest(text="world", from_lang="en", to_lang="zh"),
+    ]
+
+    results = engine.translate_batch(requests)
+
+    assert mock_client.post.call_count == 1
+    url = mock_client.post.call_args.args[0]
+    assert url == "https://openapi.youdao.com/v2/api"
+    assert mock_client.post.call_args.kwargs["data"]["q"] == ["hello", "world"]
+    assert [r.translated_text for r in results] == ["你好", "世界"]
+
+
+@patch("src.translation.youdao_engine.httpx.Client")
+def test_youdao_engine_translate_word_includes_detail(mock_client_class):
+    mock_client = MagicMock()
+    mock_client_class.return_value = mock_client
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "errorCode": "0",
+        "translation": ["苹果"],
+        "basic": {"phonetic": "ˈæpl", "explains": ["n. 苹果"]},
+    }
+    mock_client.post.return_value = mock_response
+
+    engine = YoudaoEngine("test_key", "test_secret")
+    result = engine.translate(TranslationRequest(text="apple", from_lang="en", to_lang="zh"))
+
+    assert engine.supports_word_detail_in_translate is True
+    assert mock_client.post.call_count == 1
+    assert result.word_detail is not None
+    assert result.word_detail.phonetic == "ˈæpl"